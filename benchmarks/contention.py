@@ -0,0 +1,106 @@
+"""Lock contention benchmark for ThreadSafeVoiceSessionManager.
+
+Each worker thread owns one session, appends utterances to it and polls its
+transcript every ten appends. The striped manager is compared against the
+plain VoiceSessionManager behind a single global lock, which is what callers
+had to do before.
+
+    python benchmarks/contention.py --utterances 20000 --threads 1 2 4 8
+
+On a standard CPython build the GIL caps both variants near single-thread
+throughput, and the striped manager pays a small per-call locking overhead
+with one thread. On a free-threaded build (python3.13t, PYTHON_GIL=0) the
+striped manager should scale with the thread count while the global lock
+stays flat.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig
+from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+
+class _GlobalLockManager:
+    """Plain manager serialized by one lock."""
+
+    def __init__(self) -> None:
+        self._manager = VoiceSessionManager()
+        self._lock = threading.Lock()
+
+    def create_session(self, config: VoiceConfig) -> object:
+        with self._lock:
+            return self._manager.create_session(config)
+
+    def add_utterance(self, session: object, utterance: Utterance) -> None:
+        with self._lock:
+            self._manager.add_utterance(session, utterance)  # type: ignore[arg-type]
+
+    def get_transcript(self, session: object) -> str:
+        with self._lock:
+            return self._manager.get_transcript(session)  # type: ignore[arg-type]
+
+
+def _run(factory: Callable[[], object], threads: int, per_thread: int) -> float:
+    manager = factory()
+    config = VoiceConfig(language="en")
+    batches = [
+        [
+            Utterance(
+                text=f"utterance {i}",
+                language="en",
+                start_ms=float(i),
+                end_ms=float(i) + 5.0,
+                confidence=0.9,
+            )
+            for i in range(per_thread)
+        ]
+        for _ in range(threads)
+    ]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(batch: list[Utterance]) -> None:
+        session = manager.create_session(config)  # type: ignore[attr-defined]
+        barrier.wait()
+        for count, utterance in enumerate(batch):
+            manager.add_utterance(session, utterance)  # type: ignore[attr-defined]
+            if count % 10 == 0:
+                manager.get_transcript(session)  # type: ignore[attr-defined]
+
+    workers = [threading.Thread(target=worker, args=(b,)) for b in batches]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    began = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    return threads * per_thread / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--utterances", type=int, default=20_000, help="Per thread.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}  GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>7}  {'global lock ops/s':>18}  {'striped ops/s':>14}  {'ratio':>6}")
+    for threads in args.threads:
+        baseline = _run(_GlobalLockManager, threads, args.utterances)
+        striped = _run(ThreadSafeVoiceSessionManager, threads, args.utterances)
+        print(
+            f"{threads:>7}  {baseline:>18,.0f}  {striped:>14,.0f}"
+            f"  {striped / baseline:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
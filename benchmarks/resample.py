@@ -0,0 +1,82 @@
+"""Resampling benchmark: polyphase filter versus naive linear interpolation.
+
+Converts a minute of white noise plus a test tone from each source rate to
+16 kHz, one-shot and in 20 ms streaming chunks, and compares against
+``numpy.interp``. Alias energy is measured on a tone above the target Nyquist
+frequency that an ideal converter would remove completely.
+
+    python benchmarks/resample.py --seconds 60 --rates 8000 44100 48000
+
+Linear interpolation is faster but leaves aliases tens of dB louder; the
+polyphase resampler should stay near -80 dB.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from aumai_voicefirst.resample import Resampler, resample
+
+_TARGET = 16_000
+
+Samples = npt.NDArray[np.float32]
+
+
+def _naive(samples: Samples, src: int, dst: int) -> Samples:
+    count = math.ceil(len(samples) * dst / src)
+    positions = np.arange(count) * (src / dst)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def _streaming(samples: Samples, src: int, dst: int) -> Samples:
+    resampler = Resampler(src, dst)
+    chunk = src // 50
+    parts = [resampler.process(samples[i : i + chunk]) for i in range(0, len(samples), chunk)]
+    parts.append(resampler.flush())
+    return np.concatenate(parts)
+
+
+def _alias_db(convert: Callable[[Samples, int, int], Samples], src: int) -> float:
+    if src <= _TARGET:
+        return float("nan")
+    t = np.arange(src) / src
+    tone = np.sin(2 * np.pi * (0.75 * src / 2) * t).astype(np.float32)
+    out = convert(tone, src, _TARGET)[100:-100]
+    return 20 * math.log10(max(float(np.sqrt(np.mean(out**2))), 1e-12) / math.sqrt(0.5))
+
+
+def _throughput(
+    convert: Callable[[Samples, int, int], Samples], samples: Samples, src: int
+) -> float:
+    began = time.perf_counter()
+    convert(samples, src, _TARGET)
+    return len(samples) / (time.perf_counter() - began)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--rates", type=int, nargs="+", default=[8000, 44100, 48000])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'src Hz':>7}  {'method':<10}  {'Msamples/s':>10}  {'alias dB':>8}")
+    for src in args.rates:
+        samples = rng.standard_normal(int(src * args.seconds)).astype(np.float32)
+        for name, convert in (
+            ("polyphase", resample),
+            ("streaming", _streaming),
+            ("linear", _naive),
+        ):
+            rate = _throughput(convert, samples, src)
+            print(f"{src:>7}  {name:<10}  {rate / 1e6:>10.1f}  {_alias_db(convert, src):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
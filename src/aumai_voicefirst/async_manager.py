@@ -0,0 +1,257 @@
+"""Asyncio session management for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping, Sequence
+from typing import Any, ParamSpec, TypeVar
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import SessionState, Utterance, VoiceConfig, VoiceSession
+from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+__all__ = ["AsyncVoiceSessionManager"]
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# Pushed to subscribers when a session completes, errors or the manager closes.
+_END: Any = object()
+# Pushed to a subscriber that fell too far behind, in place of what overflowed.
+_OVERFLOW: Any = object()
+
+
+class AsyncVoiceSessionManager:
+    """Awaitable facade over a VoiceSessionManager for asyncio applications.
+
+    Mutations of one session are serialized by a per-session asyncio.Lock,
+    so concurrent tasks appending to the same session keep their order while
+    tasks working on different sessions never wait on each other. ``stream``
+    lets consumers such as WebSocket handlers receive utterances as they are
+    added instead of polling ``get_transcript``.
+
+    Calls run inline on the event loop by default. When ``offload`` is true
+    they run in the default executor instead, which keeps the loop responsive
+    while a storage backend fsyncs or a registry spills to disk; the wrapped
+    manager must then be a ThreadSafeVoiceSessionManager.
+
+    Each stream buffers at most ``stream_buffer`` utterances its consumer has
+    not taken yet. Writers never wait for a slow consumer: a stream that falls
+    further behind is unsubscribed, and raises once it has yielded what it
+    had buffered.
+
+    Args:
+        manager: The manager to wrap. Defaults to a new in-memory manager, or
+            a ThreadSafeVoiceSessionManager when offloading.
+        offload: Run manager calls in worker threads. Defaults to true when
+            the wrapped manager has a storage backend.
+        stream_buffer: Maximum utterances buffered for each stream.
+
+    Raises:
+        ValueError: If offloading is requested for a manager that is not
+            thread-safe, or stream_buffer is less than 1.
+    """
+
+    def __init__(
+        self,
+        manager: VoiceSessionManager | None = None,
+        *,
+        offload: bool | None = None,
+        stream_buffer: int = 1024,
+    ) -> None:
+        if stream_buffer < 1:
+            raise ValueError("stream_buffer must be at least 1.")
+        if manager is None:
+            manager = (
+                ThreadSafeVoiceSessionManager() if offload else VoiceSessionManager()
+            )
+        if offload is None:
+            offload = manager.storage is not None
+        if offload and not isinstance(manager, ThreadSafeVoiceSessionManager):
+            raise ValueError(
+                "offload requires a ThreadSafeVoiceSessionManager to wrap."
+            )
+        self._manager = manager
+        self._offload = offload
+        self._stream_buffer = stream_buffer
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._subscribers: dict[str, set[asyncio.Queue[Utterance]]] = {}
+        self._closed = False
+
+    @property
+    def manager(self) -> VoiceSessionManager:
+        """The wrapped synchronous manager."""
+        return self._manager
+
+    async def create_session(
+        self, config: VoiceConfig, *, compact: bool = False
+    ) -> VoiceSession:
+        """Create and register a new voice session.
+
+        Args:
+            config: The voice configuration for this session.
+            compact: Store utterances in a columnar UtteranceStore.
+
+        Returns:
+            A newly created VoiceSession in the 'active' state.
+        """
+        return await self._call(self._manager.create_session, config, compact=compact)
+
+    async def get_session(self, session_id: str) -> VoiceSession:
+        """Retrieve an existing session by ID.
+
+        Raises:
+            KeyError: If no session with the given ID exists.
+        """
+        return await self._call(self._manager.get_session, session_id)
+
+    async def add_utterance(self, session: VoiceSession, utterance: Utterance) -> None:
+        """Add an utterance to a session and publish it to its streams.
+
+        Raises:
+            ValueError: If the session is not in 'active' or 'paused' state.
+        """
+        async with self._lock(session.session_id):
+            await self._call(self._manager.add_utterance, session, utterance)
+            self._publish(session.session_id, (utterance,))
+
+    async def add_utterances(
+        self,
+        session: VoiceSession,
+        utterances: Iterable[Utterance | Mapping[str, Any]],
+        *,
+        trusted: bool = False,
+    ) -> list[Utterance]:
+        """Add a batch of utterances to a session and publish them.
+
+        See VoiceSessionManager.add_utterances for validation and ordering.
+
+        Returns:
+            The added utterances, sorted by start_ms.
+
+        Raises:
+            ValueError: If the session is not in 'active' or 'paused' state.
+            pydantic.ValidationError: If any raw dict fails validation.
+        """
+        async with self._lock(session.session_id):
+            batch = await self._call(
+                self._manager.add_utterances, session, utterances, trusted=trusted
+            )
+            self._publish(session.session_id, batch)
+        return batch
+
+    async def get_transcript(self, session: VoiceSession) -> str:
+        """Return the full transcript of a session as a single string."""
+        async with self._lock(session.session_id):
+            return await self._call(self._manager.get_transcript, session)
+
+    async def set_state(self, session: VoiceSession, state: SessionState) -> None:
+        """Move a session to a new lifecycle state.
+
+        Entering 'completed' or 'error' ends every open stream of the session.
+
+        Raises:
+            ValueError: If the state is not a valid session state.
+        """
+        async with self._lock(session.session_id):
+            await self._call(self._manager.set_state, session, state)
+            if state in ("completed", "error"):
+                self._end(session.session_id)
+
+    async def checkpoint(self) -> None:
+        """Compact the storage backend, if any."""
+        await self._call(self._manager.checkpoint)
+
+    async def close(self) -> None:
+        """End all open streams and close the storage backend, if any."""
+        self._closed = True
+        for session_id in list(self._subscribers):
+            self._end(session_id)
+        await self._call(self._manager.close)
+
+    async def stream(
+        self, session: VoiceSession, *, replay: bool = False
+    ) -> AsyncIterator[Utterance]:
+        """Yield utterances as they are added to a session.
+
+        Utterances are yielded in the order they were added, which is not
+        necessarily start_ms order. The generator finishes when the session
+        is completed or errors, or the manager is closed, and immediately if
+        that has already happened; a consumer may also stop early by breaking
+        out of its loop.
+
+        Args:
+            session: The session to follow.
+            replay: First yield the utterances the session already holds, in
+                start_ms order. No utterance is missed or repeated between the
+                replay and the live stream.
+
+        Yields:
+            Each utterance added to the session.
+
+        Raises:
+            RuntimeError: If the consumer fell more than stream_buffer
+                utterances behind; the utterances after that were not
+                delivered.
+        """
+        session_id = session.session_id
+        # One slot beyond the buffer is kept for the end or overflow marker.
+        queue: asyncio.Queue[Utterance] = asyncio.Queue(self._stream_buffer + 1)
+        async with self._lock(session_id):
+            backlog = list(session.utterances) if replay else []
+            if self._closed or session.state in ("completed", "error"):
+                queue.put_nowait(_END)
+            self._subscribers.setdefault(session_id, set()).add(queue)
+        try:
+            for utterance in backlog:
+                yield utterance
+            while True:
+                utterance = await queue.get()
+                if utterance is _END:
+                    return
+                if utterance is _OVERFLOW:
+                    raise RuntimeError(
+                        f"Stream of session '{session_id}' fell more than "
+                        f"{self._stream_buffer} utterances behind."
+                    )
+                yield utterance
+        finally:
+            subscribers = self._subscribers.get(session_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[session_id]
+
+    def _lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        return lock
+
+    def _publish(self, session_id: str, utterances: Sequence[Utterance]) -> None:
+        subscribers = self._subscribers.get(session_id)
+        if not subscribers:
+            return
+        for queue in list(subscribers):
+            for utterance in utterances:
+                if queue.qsize() >= self._stream_buffer:
+                    subscribers.discard(queue)
+                    queue.put_nowait(_OVERFLOW)
+                    break
+                queue.put_nowait(utterance)
+        if not subscribers:
+            del self._subscribers[session_id]
+
+    def _end(self, session_id: str) -> None:
+        for queue in self._subscribers.pop(session_id, ()):
+            queue.put_nowait(_END)
+
+    async def _call(
+        self, function: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _T:
+        if self._offload:
+            return await asyncio.to_thread(function, *args, **kwargs)
+        return function(*args, **kwargs)
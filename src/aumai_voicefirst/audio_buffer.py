@@ -0,0 +1,279 @@
+"""Bounded per-session audio buffering for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Literal, get_args
+
+from pydantic import BaseModel
+
+from aumai_voicefirst.models import VoiceConfig
+
+__all__ = ["AudioBufferStats", "AudioRingBuffer", "OverflowPolicy"]
+
+OverflowPolicy = Literal["overwrite", "block"]
+"""What a full AudioRingBuffer does with a write: drop the oldest audio or wait."""
+
+
+class AudioBufferStats(BaseModel):
+    """Aggregate counters for the audio buffers of a VoiceSessionManager."""
+
+    buffers: int
+    allocated_bytes: int
+    buffered_bytes: int
+    unread_bytes: int
+    dropped_bytes: int
+
+
+class AudioRingBuffer:
+    """Fixed-capacity ring buffer holding the most recent audio of a session.
+
+    The buffer holds ``seconds`` of raw interleaved PCM in the session's
+    sample rate and channel count, allocated once up front. Audio is
+    addressed by stream time: the first byte written is at 0 ms and every
+    later byte's time follows from the byte rate, so ``window`` can cut the
+    audio behind an utterance's start_ms and end_ms for re-recognition.
+
+    Reads never copy. ``window`` and ``read`` return one read-only memoryview
+    of the buffer, or two when the requested span wraps around its end. The
+    views are only valid until the audio they cover is overwritten; copy
+    them, e.g. with ``b"".join(parts)``, to keep the audio longer.
+
+    When a write does not fit, the ``overwrite`` policy drops the oldest
+    audio, counting any of it not yet consumed by ``read`` in ``dropped``.
+    The ``block`` policy instead waits until ``read`` frees enough space, so
+    no audio is ever lost and a slow consumer throttles its producer.
+
+    All methods are safe to call from different threads.
+
+    Args:
+        config: Session configuration supplying sample rate and channels.
+        seconds: Duration of audio the buffer holds.
+        sample_width: Bytes per sample of one channel.
+        policy: Behaviour of a write into a full buffer.
+
+    Raises:
+        ValueError: If seconds, sample_width or policy is invalid.
+    """
+
+    def __init__(
+        self,
+        config: VoiceConfig,
+        seconds: float = 10.0,
+        *,
+        sample_width: int = 2,
+        policy: OverflowPolicy = "overwrite",
+    ) -> None:
+        if sample_width not in (1, 2, 3, 4):
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+        if policy not in get_args(OverflowPolicy):
+            raise ValueError(f"Unknown overflow policy '{policy}'.")
+        self._block_align = sample_width * config.channels
+        self._byte_rate = config.sample_rate * self._block_align
+        samples = round(config.sample_rate * seconds)
+        if samples < 1:
+            raise ValueError("seconds must cover at least one sample.")
+        self._policy = policy
+        self._data = bytearray(samples * self._block_align)
+        self._view = memoryview(self._data).toreadonly()
+        self._capacity = len(self._data)
+        # Absolute byte positions in the stream: everything before _written
+        # has been written, and _read is the consumer's cursor.
+        self._written = 0
+        self._read = 0
+        self._dropped = 0
+        self._closed = False
+        self._space = threading.Condition()
+
+    def __len__(self) -> int:
+        """Number of bytes of audio currently retained."""
+        with self._space:
+            return min(self._written, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Size of the buffer in bytes; the memory it allocates."""
+        return self._capacity
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        """Behaviour of a write into a full buffer."""
+        return self._policy
+
+    @property
+    def block_align(self) -> int:
+        """Bytes per sample frame across all channels."""
+        return self._block_align
+
+    @property
+    def unread(self) -> int:
+        """Bytes written but not yet consumed by ``read``."""
+        with self._space:
+            return self._written - self._read
+
+    @property
+    def dropped(self) -> int:
+        """Bytes overwritten before ``read`` consumed them."""
+        return self._dropped
+
+    @property
+    def start_ms(self) -> float:
+        """Stream time of the oldest retained audio."""
+        with self._space:
+            return self._ms(max(0, self._written - self._capacity))
+
+    @property
+    def end_ms(self) -> float:
+        """Stream time just past the newest audio."""
+        with self._space:
+            return self._ms(self._written)
+
+    def write(
+        self, data: bytes | bytearray | memoryview, *, timeout: float | None = None
+    ) -> None:
+        """Append raw interleaved PCM.
+
+        Args:
+            data: Whole sample frames in the session's layout.
+            timeout: With the ``block`` policy, seconds to wait for space;
+                None waits indefinitely.
+
+        Raises:
+            ValueError: If data is not a whole number of sample frames, or a
+                ``block`` buffer could never hold it.
+            TimeoutError: If space did not free up within timeout; nothing
+                is written in that case.
+            RuntimeError: If the buffer is closed.
+        """
+        view = memoryview(data).cast("B")
+        size = len(view)
+        if size % self._block_align:
+            raise ValueError("Data is not a whole number of sample frames.")
+        with self._space:
+            self._check_open()
+            if self._policy == "block":
+                if size > self._capacity:
+                    raise ValueError(
+                        f"Write of {size} bytes exceeds the buffer capacity "
+                        f"of {self._capacity} bytes."
+                    )
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while self._capacity - (self._written - self._read) < size:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Audio buffer stayed full.")
+                    self._space.wait(remaining)
+                    self._check_open()
+            elif size > self._capacity:
+                # Only the newest capacity bytes can survive the write.
+                self._written += size - self._capacity
+                view = view[size - self._capacity :]
+                size = self._capacity
+            self._copy_in(view)
+            oldest = self._written - self._capacity
+            if oldest > self._read:
+                self._dropped += oldest - self._read
+                self._read = oldest
+
+    def read(self, max_bytes: int | None = None) -> tuple[memoryview, ...]:
+        """Consume unread audio without waiting.
+
+        Args:
+            max_bytes: Most bytes to consume, rounded down to whole sample
+                frames; all unread audio when None.
+
+        Returns:
+            Zero, one or two views of the consumed audio, oldest first.
+        """
+        with self._space:
+            end = self._written
+            if max_bytes is not None:
+                end = min(end, self._read + max_bytes - max_bytes % self._block_align)
+            parts = self._views(self._read, end)
+            if end > self._read:
+                self._read = end
+                self._space.notify_all()
+            return parts
+
+    def window(
+        self, start_ms: float, end_ms: float | None = None
+    ) -> tuple[memoryview, ...]:
+        """Return retained audio between two stream times.
+
+        Times are rounded down to whole sample frames. Reading a window does
+        not move the ``read`` cursor.
+
+        Args:
+            start_ms: Window start in milliseconds.
+            end_ms: Window end in milliseconds; the newest audio when None.
+                Clamped to the audio written so far.
+
+        Returns:
+            One or two views of the window, oldest first; none if it is empty.
+
+        Raises:
+            ValueError: If start_ms is greater than end_ms or the window
+                starts before the oldest retained audio.
+        """
+        if end_ms is not None and start_ms > end_ms:
+            raise ValueError("start_ms must not be greater than end_ms.")
+        with self._space:
+            start = self._position(start_ms)
+            end = (
+                self._written
+                if end_ms is None
+                else min(self._position(end_ms), self._written)
+            )
+            if start < self._written - self._capacity:
+                raise ValueError(
+                    f"Audio at {start_ms} ms is no longer retained; the oldest "
+                    f"retained audio starts at "
+                    f"{self._ms(self._written - self._capacity)} ms."
+                )
+            return self._views(start, end)
+
+    def latest(self, duration_ms: float) -> tuple[memoryview, ...]:
+        """Return up to the last ``duration_ms`` of retained audio."""
+        with self._space:
+            end = self._written
+            start = max(end - self._position(duration_ms), end - self._capacity, 0)
+            return self._views(start, end)
+
+    def close(self) -> None:
+        """Wake blocked writers and reject further writes.
+
+        Retained audio can still be read after closing.
+        """
+        with self._space:
+            self._closed = True
+            self._space.notify_all()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Audio buffer is closed.")
+
+    def _position(self, time_ms: float) -> int:
+        frames = int(max(0.0, time_ms) * self._byte_rate / 1000) // self._block_align
+        return frames * self._block_align
+
+    def _ms(self, position: int) -> float:
+        return position * 1000.0 / self._byte_rate
+
+    def _copy_in(self, view: memoryview) -> None:
+        offset = self._written % self._capacity
+        first = min(len(view), self._capacity - offset)
+        self._data[offset : offset + first] = view[:first]
+        self._data[: len(view) - first] = view[first:]
+        self._written += len(view)
+
+    def _views(self, start: int, end: int) -> tuple[memoryview, ...]:
+        if end <= start:
+            return ()
+        offset = start % self._capacity
+        size = end - start
+        if offset + size <= self._capacity:
+            return (self._view[offset : offset + size],)
+        return (self._view[offset:], self._view[: offset + size - self._capacity])
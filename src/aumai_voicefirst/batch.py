@@ -0,0 +1,114 @@
+"""Parallel transcript extraction over many session files for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import glob
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aumai_voicefirst.packed import MAGIC, PackedSession, is_packed
+from aumai_voicefirst.streaming import iter_transcript
+
+__all__ = ["BatchResult", "collect_paths", "run_batch", "transcribe_file"]
+
+# Upper bound on files per task, so results keep streaming back steadily.
+_MAX_CHUNKSIZE = 64
+
+
+class BatchResult:
+    """Outcome of extracting one file's transcript."""
+
+    __slots__ = ("error", "lines", "path", "transcript")
+
+    def __init__(
+        self,
+        path: str,
+        transcript: str | None = None,
+        lines: int = 0,
+        error: str | None = None,
+    ) -> None:
+        self.path = path
+        self.transcript = transcript
+        self.lines = lines
+        self.error = error
+
+    def __repr__(self) -> str:
+        status = f"error={self.error!r}" if self.error else f"lines={self.lines}"
+        return f"BatchResult({self.path!r}, {status})"
+
+    @property
+    def ok(self) -> bool:
+        """True if the transcript was extracted."""
+        return self.error is None
+
+
+def collect_paths(source: str | os.PathLike[str]) -> list[Path]:
+    """Expand a directory or glob pattern into a sorted list of files.
+
+    A directory contributes the regular files directly inside it; anything
+    else is treated as a glob pattern, with ``**`` matching subdirectories.
+    """
+    root = Path(source)
+    if root.is_dir():
+        return sorted(path for path in root.iterdir() if path.is_file())
+    matches = glob.glob(os.fspath(source), recursive=True)
+    return sorted(Path(match) for match in matches if os.path.isfile(match))
+
+
+def transcribe_file(path: str | os.PathLike[str]) -> BatchResult:
+    """Extract the transcript of one JSON or packed session file.
+
+    Failures are reported in the result instead of raised, so one bad file
+    does not stop a batch.
+    """
+    name = os.fspath(path)
+    try:
+        with open(name, "rb") as handle:
+            packed = is_packed(handle.read(len(MAGIC)))
+        if packed:
+            session = PackedSession.from_file(name)
+            return BatchResult(name, session.transcript(), len(session))
+        lines = list(iter_transcript(name))
+    except (OSError, ValueError) as exc:
+        return BatchResult(name, error=str(exc) or type(exc).__name__)
+    return BatchResult(name, "\n".join(lines), len(lines))
+
+
+def run_batch(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> Iterator[BatchResult]:
+    """Extract transcripts from many files across a process pool.
+
+    Files are handed to workers in chunks of ``chunksize`` so each task
+    amortizes its inter-process round trip over several files. Results are
+    yielded in input order as soon as every earlier file is done. A single
+    worker processes the files in this process.
+
+    Args:
+        paths: Session files to process.
+        workers: Worker processes; the CPU count if None.
+        chunksize: Files per task; sized from the batch if None.
+
+    Yields:
+        One BatchResult per path, in input order.
+
+    Raises:
+        ValueError: If workers or chunksize is below 1.
+    """
+    names = [os.fspath(path) for path in paths]
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1 or (chunksize is not None and chunksize < 1):
+        raise ValueError("workers and chunksize must be at least 1.")
+    if workers == 1 or len(names) <= 1:
+        yield from map(transcribe_file, names)
+        return
+    if chunksize is None:
+        # About four tasks per worker balances stragglers against overhead.
+        chunksize = max(1, min(_MAX_CHUNKSIZE, len(names) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=min(workers, len(names))) as pool:
+        yield from pool.map(transcribe_file, names, chunksize=chunksize)
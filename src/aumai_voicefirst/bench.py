@@ -0,0 +1,292 @@
+"""Hot-path benchmark suite for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import gc
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+
+from pydantic import BaseModel, Field
+
+from aumai_voicefirst.core import VoiceRouter, VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig, VoiceSession
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "Workload",
+    "compare",
+    "run_benchmarks",
+]
+
+_REPORT_VERSION = 1
+# Route calls are too fast to time one by one; they are timed in blocks.
+_ROUTE_BLOCK = 64
+# Gap between consecutive utterances, and the most a late one is delayed.
+_SPACING_MS = 100.0
+_MAX_DELAY = 50
+
+_Record = Callable[[int, int], None]
+
+
+class Workload(BaseModel):
+    """Parameters of the synthetic workload every benchmark runs."""
+
+    session_size: int = Field(default=2000, ge=1, description="Utterances per session.")
+    languages: list[str] = Field(
+        default_factory=lambda: ["en", "hi", "ta", "zh-Hant", "ar", "ur-Arab"],
+        min_length=1,
+        description="Language tags drawn uniformly for each utterance.",
+    )
+    out_of_order: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of utterances that arrive after later ones.",
+    )
+    rounds: int = Field(default=5, ge=1, description="Repetitions of each benchmark.")
+    seed: int = 0
+
+
+class BenchmarkResult(BaseModel):
+    """Throughput, latency and memory of one benchmark."""
+
+    ops: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_memory_bytes: int | None = None
+
+
+class BenchmarkReport(BaseModel):
+    """Machine-readable results of a benchmark run."""
+
+    version: int = _REPORT_VERSION
+    python: str = Field(default_factory=platform.python_version)
+    platform: str = Field(default_factory=platform.platform)
+    workload: Workload
+    results: dict[str, BenchmarkResult]
+
+
+def _utterances(workload: Workload) -> list[Utterance]:
+    """Build one session's utterances in arrival order."""
+    rng = random.Random(workload.seed)  # noqa: S311 - reproducible test data
+    arrivals: list[tuple[float, Utterance]] = []
+    for index in range(workload.session_size):
+        start = index * _SPACING_MS
+        utterance = Utterance(
+            text=f"synthetic utterance {index} with a few words",
+            language=rng.choice(workload.languages),
+            start_ms=start,
+            end_ms=start + _SPACING_MS * 0.8,
+            confidence=round(rng.uniform(0.5, 1.0), 3),
+        )
+        delay = (
+            rng.uniform(1, _MAX_DELAY) if rng.random() < workload.out_of_order else 0
+        )
+        arrivals.append((index + delay, utterance))
+    arrivals.sort(key=lambda arrival: arrival[0])
+    return [utterance for _, utterance in arrivals]
+
+
+def _bench_create_session(workload: Workload, record: _Record) -> None:
+    manager = VoiceSessionManager()
+    config = VoiceConfig(language=workload.languages[0])
+    for _ in range(workload.rounds):
+        for _ in range(workload.session_size):
+            began = time.perf_counter_ns()
+            manager.create_session(config)
+            record(time.perf_counter_ns() - began, 1)
+
+
+def _bench_add_utterance(workload: Workload, record: _Record) -> None:
+    manager = VoiceSessionManager()
+    config = VoiceConfig(language=workload.languages[0])
+    utterances = _utterances(workload)
+    for _ in range(workload.rounds):
+        session = manager.create_session(config)
+        for utterance in utterances:
+            began = time.perf_counter_ns()
+            manager.add_utterance(session, utterance)
+            record(time.perf_counter_ns() - began, 1)
+
+
+def _bench_get_transcript(workload: Workload, record: _Record) -> None:
+    # The transcript is read after every arrival, as a live caller would;
+    # late arrivals force a rebuild instead of an incremental extension.
+    manager = VoiceSessionManager()
+    config = VoiceConfig(language=workload.languages[0])
+    utterances = _utterances(workload)
+    for _ in range(workload.rounds):
+        session = manager.create_session(config)
+        for utterance in utterances:
+            manager.add_utterance(session, utterance)
+            began = time.perf_counter_ns()
+            manager.get_transcript(session)
+            record(time.perf_counter_ns() - began, 1)
+
+
+def _bench_route(workload: Workload, record: _Record) -> None:
+    router = VoiceRouter()
+    utterances = _utterances(workload)
+    route = router.route
+    for _ in range(workload.rounds):
+        for offset in range(0, len(utterances), _ROUTE_BLOCK):
+            block = utterances[offset : offset + _ROUTE_BLOCK]
+            began = time.perf_counter_ns()
+            for utterance in block:
+                route(utterance)
+            record(time.perf_counter_ns() - began, len(block))
+
+
+def _bench_json_roundtrip(workload: Workload, record: _Record) -> None:
+    session = VoiceSession(
+        session_id="benchmark", config=VoiceConfig(language=workload.languages[0])
+    )
+    session.utterances.extend(sorted(_utterances(workload), key=lambda u: u.start_ms))
+    for _ in range(workload.rounds):
+        began = time.perf_counter_ns()
+        VoiceSession.model_validate_json(session.model_dump_json())
+        record(time.perf_counter_ns() - began, 1)
+
+
+_SUITE: dict[str, Callable[[Workload, _Record], None]] = {
+    "create_session": _bench_create_session,
+    "add_utterance": _bench_add_utterance,
+    "get_transcript": _bench_get_transcript,
+    "route": _bench_route,
+    "json_roundtrip": _bench_json_roundtrip,
+}
+
+BENCHMARKS: tuple[str, ...] = tuple(_SUITE)
+"""Names of the available benchmarks, in run order."""
+
+
+def run_benchmarks(
+    workload: Workload | None = None,
+    names: Iterable[str] | None = None,
+    *,
+    measure_memory: bool = True,
+) -> BenchmarkReport:
+    """Run benchmarks against a synthetic workload.
+
+    Each benchmark is timed with the garbage collector paused. Peak memory
+    is measured in a separate, untimed pass under tracemalloc, whose
+    overhead would otherwise distort the timings.
+
+    Args:
+        workload: Workload parameters; the defaults if None.
+        names: Benchmarks to run; all of BENCHMARKS if None.
+        measure_memory: Also record each benchmark's peak traced memory.
+
+    Returns:
+        The report, with results keyed by benchmark name.
+
+    Raises:
+        ValueError: If a name is not a known benchmark.
+    """
+    workload = workload if workload is not None else Workload()
+    selected = list(names) if names is not None else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in _SUITE]
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmark(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(BENCHMARKS)}."
+        )
+    results = {name: _run(_SUITE[name], workload, measure_memory) for name in selected}
+    return BenchmarkReport(workload=workload, results=results)
+
+
+def compare(
+    report: BenchmarkReport, baseline: BenchmarkReport, *, tolerance: float = 0.1
+) -> list[str]:
+    """List the regressions of a report against a baseline.
+
+    A benchmark regresses when its ops/s falls, or its p99 latency or peak
+    memory grows, by more than ``tolerance`` relative to the baseline.
+    Benchmarks missing from either report are skipped.
+
+    Args:
+        report: The new results.
+        baseline: Results recorded earlier on the same workload.
+        tolerance: Allowed relative change, e.g. 0.1 for 10 %.
+
+    Returns:
+        One human-readable line per regression; empty if none.
+
+    Raises:
+        ValueError: If the reports were recorded with different workloads.
+    """
+    if report.workload != baseline.workload:
+        raise ValueError("Baseline was recorded with a different workload.")
+    regressions: list[str] = []
+    for name, result in report.results.items():
+        before = baseline.results.get(name)
+        if before is None:
+            continue
+        checks: Sequence[tuple[str, float | None, float | None, bool]] = (
+            ("ops/s", result.ops_per_sec, before.ops_per_sec, False),
+            ("p99", result.p99_us, before.p99_us, True),
+            ("peak memory", result.peak_memory_bytes, before.peak_memory_bytes, True),
+        )
+        for metric, now, then, higher_is_worse in checks:
+            if now is None or then is None or then == 0:
+                continue
+            change = (now - then) / then
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append(
+                    f"{name}: {metric} {then:.6g} -> {now:.6g} ({change:+.1%})"
+                )
+    return regressions
+
+
+def _run(
+    benchmark: Callable[[Workload, _Record], None],
+    workload: Workload,
+    measure_memory: bool,
+) -> BenchmarkResult:
+    latencies: list[float] = []
+    totals = [0, 0]
+
+    def record(elapsed_ns: int, ops: int) -> None:
+        latencies.append(elapsed_ns / ops / 1000)
+        totals[0] += elapsed_ns
+        totals[1] += ops
+
+    enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        benchmark(workload, record)
+    finally:
+        if enabled:
+            gc.enable()
+
+    peak: int | None = None
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            benchmark(workload, lambda elapsed_ns, ops: None)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    elapsed_ns, ops = totals
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p99 = cuts[49], cuts[98]
+    else:
+        p50 = p99 = latencies[0] if latencies else 0.0
+    return BenchmarkResult(
+        ops=ops,
+        ops_per_sec=ops / (elapsed_ns / 1e9) if elapsed_ns else 0.0,
+        p50_us=p50,
+        p99_us=p99,
+        peak_memory_bytes=peak,
+    )
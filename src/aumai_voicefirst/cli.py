@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
-import json
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from aumai_voicefirst.core import VoiceSessionManager
-from aumai_voicefirst.models import AudioFormat, VoiceConfig, VoiceSession
+from aumai_voicefirst import __version__
 
-_manager = VoiceSessionManager()
+if TYPE_CHECKING:
+    from aumai_voicefirst.core import VoiceSessionManager
+
+# Heavy modules (pydantic models, the manager, numpy-backed helpers) are
+# imported inside the commands that use them, so --help, --version and
+# light commands start quickly. Option choices are therefore spelled out
+# here; tests keep them in step with AudioFormat and bench.BENCHMARKS.
+_AUDIO_FORMATS = ("wav", "mp3", "ogg", "flac")
+_BENCHMARKS = (
+    "create_session",
+    "add_utterance",
+    "get_transcript",
+    "route",
+    "json_roundtrip",
+)
+_NO_UTTERANCES = "No utterances recorded in this session."
+
+_manager: VoiceSessionManager | None = None
+
+
+def _get_manager() -> VoiceSessionManager:
+    """Return the process-wide manager, building it on first use."""
+    global _manager
+    if _manager is None:
+        from aumai_voicefirst.core import VoiceSessionManager
+
+        _manager = VoiceSessionManager()
+    return _manager
 
 
 @click.group()
-@click.version_option()
+@click.version_option(version=__version__)
 def main() -> None:
     """AumAI VoiceFirst — Voice-native AI interaction framework CLI."""
 
@@ -27,32 +54,51 @@ def main() -> None:
     "audio_format",
     default="wav",
     show_default=True,
-    type=click.Choice([f.value for f in AudioFormat]),
+    type=click.Choice(_AUDIO_FORMATS),
     help="Audio format.",
 )
 @click.option(
     "--output",
     type=click.Path(dir_okay=False, path_type=Path),
     default=None,
-    help="Save session JSON to this file.",
+    help="Save the session to this file.",
 )
-def session(language: str, sample_rate: int, audio_format: str, output: Path | None) -> None:
+@click.option(
+    "--output-format",
+    default="json",
+    show_default=True,
+    type=click.Choice(["json", "packed"]),
+    help="File format for --output; packed is a compact binary format.",
+)
+def session(
+    language: str,
+    sample_rate: int,
+    audio_format: str,
+    output: Path | None,
+    output_format: str,
+) -> None:
     """Create a new voice session and print its ID."""
+    from aumai_voicefirst.models import AudioFormat, VoiceConfig
+    from aumai_voicefirst.packed import pack_session
+
     config = VoiceConfig(
         language=language,
         sample_rate=sample_rate,
         format=AudioFormat(audio_format),
     )
-    voice_session = _manager.create_session(config)
+    voice_session = _get_manager().create_session(config)
     click.echo(f"Session ID: {voice_session.session_id}")
     click.echo(f"Language:   {language}")
     click.echo(f"Format:     {audio_format}  {sample_rate} Hz")
 
     if output is not None:
-        output.write_text(
-            voice_session.model_dump_json(indent=2),
-            encoding="utf-8",
-        )
+        if output_format == "packed":
+            output.write_bytes(pack_session(voice_session))
+        else:
+            output.write_text(
+                voice_session.model_dump_json(indent=2),
+                encoding="utf-8",
+            )
         click.echo(f"Session saved to {output}")
 
 
@@ -62,17 +108,309 @@ def session(language: str, sample_rate: int, audio_format: str, output: Path | N
     "session_file",
     required=True,
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Path to session JSON file.",
-)
-def transcript(session_file: Path) -> None:
-    """Print the transcript of a saved voice session."""
-    data: dict[str, object] = json.loads(session_file.read_text(encoding="utf-8"))
-    voice_session = VoiceSession.model_validate(data)
-    text = _manager.get_transcript(voice_session)
-    if text:
-        click.echo(text)
+    help="Path to a JSON or packed session file.",
+)
+@click.option(
+    "--presorted",
+    is_flag=True,
+    help=(
+        "The JSON file's utterances are already in start_ms order, as "
+        "VoiceSessionManager writes them: print lines as they are parsed."
+    ),
+)
+def transcript(session_file: Path, presorted: bool) -> None:
+    """Print the transcript of a saved voice session.
+
+    JSON files are parsed incrementally, so memory use stays bounded however
+    large the session is.
+    """
+    from aumai_voicefirst.packed import MAGIC, PackedSession, is_packed
+    from aumai_voicefirst.streaming import iter_transcript
+
+    with session_file.open("rb") as handle:
+        packed = is_packed(handle.read(len(MAGIC)))
+    if packed:
+        text = PackedSession.from_file(session_file).transcript()
+        click.echo(text if text else _NO_UTTERANCES)
+        return
+    empty = True
+    try:
+        for line in iter_transcript(session_file, presorted=presorted):
+            click.echo(line)
+            empty = False
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+    if empty:
+        click.echo(_NO_UTTERANCES)
+
+
+@main.command("batch")
+@click.argument("source")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes.  [default: CPU count]",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Files handed to a worker per task.  [default: sized from the batch]",
+)
+@click.option(
+    "--output-format",
+    default="text",
+    show_default=True,
+    type=click.Choice(["text", "jsonl"]),
+    help="Transcripts under per-file headers, or one JSON object per file.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write output to this file instead of stdout.",
+)
+@click.pass_context
+def batch(
+    ctx: click.Context,
+    source: str,
+    workers: int | None,
+    chunksize: int | None,
+    output_format: str,
+    output: Path | None,
+) -> None:
+    """Print the transcripts of many saved sessions, in parallel.
+
+    SOURCE is a directory of session files or a glob pattern such as
+    'exports/**/*.json'. Output follows the sorted file order. A summary is
+    written to stderr, and the exit status is 1 if any file failed.
+    """
+    import json
+
+    from aumai_voicefirst.batch import collect_paths, run_batch
+
+    paths = collect_paths(source)
+    if not paths:
+        raise click.ClickException(f"No session files found at {source}.")
+    started = time.perf_counter()
+    failures = []
+    utterances = 0
+    with click.open_file(
+        str(output) if output is not None else "-", "w", encoding="utf-8"
+    ) as stream:
+        for result in run_batch(paths, workers=workers, chunksize=chunksize):
+            utterances += result.lines
+            if not result.ok:
+                failures.append(result)
+            if output_format == "jsonl":
+                record = {
+                    "path": result.path,
+                    "transcript": result.transcript,
+                    "utterances": result.lines,
+                    "error": result.error,
+                }
+                stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            elif not result.ok:
+                stream.write(f"==> {result.path} <== failed: {result.error}\n")
+            else:
+                stream.write(f"==> {result.path} <==\n")
+                if result.transcript:
+                    stream.write(result.transcript + "\n")
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    click.echo(
+        f"Processed {len(paths)} files ({len(failures)} failed), "
+        f"{utterances} utterances in {elapsed:.2f} s: "
+        f"{len(paths) / elapsed:.1f} files/s, {utterances / elapsed:.0f} utterances/s",
+        err=True,
+    )
+    for failure in failures:
+        click.echo(f"  {failure.path}: {failure.error}", err=True)
+    if failures:
+        ctx.exit(1)
+
+
+@main.command("bench")
+@click.option(
+    "--only",
+    "names",
+    multiple=True,
+    type=click.Choice(_BENCHMARKS),
+    help="Run only this benchmark; repeat for several.  [default: all]",
+)
+@click.option(
+    "--session-size",
+    default=2000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Utterances per synthetic session.",
+)
+@click.option(
+    "--languages",
+    default="en,hi,ta,zh-Hant,ar,ur-Arab",
+    show_default=True,
+    help="Comma-separated language tags mixed into the workload.",
+)
+@click.option(
+    "--out-of-order",
+    default=0.0,
+    show_default=True,
+    type=click.FloatRange(0.0, 1.0),
+    help="Fraction of utterances that arrive late.",
+)
+@click.option(
+    "--rounds",
+    default=5,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Repetitions of each benchmark.",
+)
+@click.option("--seed", default=0, show_default=True, type=int, help="Workload seed.")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the JSON results to this file instead of stdout.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Compare against results saved earlier with --output.",
+)
+@click.option(
+    "--tolerance",
+    default=0.1,
+    show_default=True,
+    type=click.FloatRange(min=0.0),
+    help="Allowed relative regression against the baseline.",
+)
+@click.option("--no-memory", is_flag=True, help="Skip the peak memory pass.")
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    names: tuple[str, ...],
+    session_size: int,
+    languages: str,
+    out_of_order: float,
+    rounds: int,
+    seed: int,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+    no_memory: bool,
+) -> None:
+    """Benchmark the hot paths on a synthetic workload.
+
+    Results are printed as JSON (ops/s, p50/p99 latency in microseconds and
+    peak traced memory per benchmark) and summarized on stderr. With
+    --baseline, the exit status is 1 if any benchmark regressed beyond
+    --tolerance.
+    """
+    from aumai_voicefirst.bench import (
+        BenchmarkReport,
+        Workload,
+        compare,
+        run_benchmarks,
+    )
+
+    workload = Workload(
+        session_size=session_size,
+        languages=[tag.strip() for tag in languages.split(",") if tag.strip()],
+        out_of_order=out_of_order,
+        rounds=rounds,
+        seed=seed,
+    )
+    previous = None
+    if baseline is not None:
+        previous = BenchmarkReport.model_validate_json(baseline.read_bytes())
+        if previous.workload != workload:
+            raise click.ClickException(
+                "The baseline was recorded with a different workload: "
+                f"{previous.workload.model_dump_json()}"
+            )
+    report = run_benchmarks(workload, names or None, measure_memory=not no_memory)
+    payload = report.model_dump_json(indent=2)
+    if output is not None:
+        output.write_text(payload + "\n", encoding="utf-8")
     else:
-        click.echo("No utterances recorded in this session.")
+        click.echo(payload)
+
+    for name, result in report.results.items():
+        memory = (
+            f"{result.peak_memory_bytes / 1024:10.0f} KiB"
+            if result.peak_memory_bytes is not None
+            else ""
+        )
+        click.echo(
+            f"{name:<16}{result.ops_per_sec:>14,.0f} ops/s"
+            f"  p50 {result.p50_us:9.2f} us  p99 {result.p99_us:9.2f} us{memory}",
+            err=True,
+        )
+    if previous is not None:
+        regressions = compare(report, previous, tolerance=tolerance)
+        for line in regressions:
+            click.echo(f"REGRESSION {line}", err=True)
+        if regressions:
+            ctx.exit(1)
+        click.echo(f"No regressions beyond {tolerance:.0%}.", err=True)
+
+
+@main.command("serve")
+@click.option(
+    "--port",
+    default=8765,
+    show_default=True,
+    type=click.IntRange(0, 65535),
+    help="Localhost TCP port to listen on.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Listen on this Unix socket instead of a TCP port.",
+)
+@click.option(
+    "--storage",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Write-ahead log directory, so sessions survive restarts.",
+)
+@click.option("--metrics", is_flag=True, help="Instrument and expose GET /metrics.")
+def serve(
+    port: int, socket_path: Path | None, storage: Path | None, metrics: bool
+) -> None:
+    """Host a resident session manager behind a local HTTP API.
+
+    Clients create sessions, add utterances, read transcripts and route
+    utterances over JSON, reusing this warm process instead of starting
+    Python per call. Runs until interrupted.
+    """
+    import asyncio
+
+    from aumai_voicefirst.async_manager import AsyncVoiceSessionManager
+    from aumai_voicefirst.core import VoiceRouter
+    from aumai_voicefirst.metrics import Metrics
+    from aumai_voicefirst.server import SessionServer
+    from aumai_voicefirst.storage import WriteAheadLogStorage
+    from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+    instruments = Metrics() if metrics else None
+    backend = WriteAheadLogStorage(storage) if storage is not None else None
+    manager = ThreadSafeVoiceSessionManager(backend, metrics=instruments)
+    server = SessionServer(
+        AsyncVoiceSessionManager(manager),
+        router=VoiceRouter(metrics=instruments),
+        metrics=instruments,
+    )
+    asyncio.run(
+        server.serve(
+            port=port,
+            socket_path=socket_path,
+            ready=lambda address: click.echo(f"Listening on {address}", err=True),
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -2,44 +2,252 @@
 
 from __future__ import annotations
 
-import uuid
+import bisect
+import functools
+import heapq
+import threading
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Sequence,
+)
+from operator import attrgetter
+from typing import Any, cast, get_args
 
-from aumai_voicefirst.models import Utterance, VoiceConfig, VoiceSession
+from pydantic import TypeAdapter
+
+from aumai_voicefirst.audio_buffer import (
+    AudioBufferStats,
+    AudioRingBuffer,
+    OverflowPolicy,
+)
+from aumai_voicefirst.ids import IdFactory, uuid7
+from aumai_voicefirst.index import UtteranceIndex
+from aumai_voicefirst.metrics import Metrics
+from aumai_voicefirst.models import (
+    SessionState,
+    Utterance,
+    UtteranceList,
+    VoiceConfig,
+    VoiceSession,
+)
+from aumai_voicefirst.registry import RegistryStats, SessionRegistry
+from aumai_voicefirst.routing import HandlerTable
+from aumai_voicefirst.storage import SessionStorage
+from aumai_voicefirst.store import UtteranceStore
 
 __all__ = ["VoiceSessionManager", "VoiceRouter"]
 
 # Language family groupings for routing
 _INDIC_LANGUAGES = {
-    "hi", "bn", "te", "ta", "mr", "gu", "kn", "ml", "pa",
-    "or", "as", "ur", "sa", "si", "ne", "kok", "mai", "doi",
-    "mni", "ks", "sat", "sd", "bo",
+    "hi",
+    "bn",
+    "te",
+    "ta",
+    "mr",
+    "gu",
+    "kn",
+    "ml",
+    "pa",
+    "or",
+    "as",
+    "ur",
+    "sa",
+    "si",
+    "ne",
+    "kok",
+    "mai",
+    "doi",
+    "mni",
+    "ks",
+    "sat",
+    "sd",
+    "bo",
 }
 _CJK_LANGUAGES = {"zh", "ja", "ko"}
 _ARABIC_LANGUAGES = {"ar", "fa", "ur", "ks", "sd"}
 
+# Handler per primary language subtag. "ur", "ks" and "sd" are written in both
+# Perso-Arabic and Indic scripts; without a script subtag they route to the
+# Indic handler, and a script subtag such as "sd-Arab" decides otherwise.
+_LANGUAGE_HANDLERS: dict[str, str] = {
+    **dict.fromkeys(_ARABIC_LANGUAGES, "handler.arabic"),
+    **dict.fromkeys(_CJK_LANGUAGES, "handler.cjk"),
+    **dict.fromkeys(_INDIC_LANGUAGES, "handler.indic"),
+}
+
+# Handler per ISO 15924 script subtag, lowercased. Scripts shared by many
+# families (Latn, Cyrl, ...) are absent so the language decides.
+_SCRIPT_HANDLERS: dict[str, str] = {
+    "arab": "handler.arabic",
+    "aran": "handler.arabic",
+    **dict.fromkeys(
+        (
+            "deva",
+            "beng",
+            "guru",
+            "gujr",
+            "orya",
+            "taml",
+            "telu",
+            "knda",
+            "mlym",
+            "sinh",
+            "tibt",
+            "olck",
+            "mtei",
+            "shrd",
+            "sind",
+        ),
+        "handler.indic",
+    ),
+    **dict.fromkeys(
+        (
+            "hans",
+            "hant",
+            "hani",
+            "hanb",
+            "bopo",
+            "jpan",
+            "hira",
+            "kana",
+            "hrkt",
+            "kore",
+            "hang",
+        ),
+        "handler.cjk",
+    ),
+}
+
+_DEFAULT_HANDLER_TABLE = HandlerTable(_LANGUAGE_HANDLERS, scripts=_SCRIPT_HANDLERS)
+_DEFAULT_ROUTE_CACHE_SIZE = 1024
+
+_start_ms = attrgetter("start_ms")
+_StateListener = Callable[[SessionState, SessionState], None]
+_utterance_batch: TypeAdapter[list[Utterance]] = TypeAdapter(list[Utterance])
+
+
+def _is_ordered(utterances: MutableSequence[Utterance], start: int = 0) -> bool:
+    """Return True if ``utterances[start:]`` continues the start_ms ordering."""
+    if isinstance(utterances, UtteranceStore):
+        return utterances.is_ordered(start)
+    previous = utterances[start - 1].start_ms if start > 0 else 0.0
+    for index in range(start, len(utterances)):
+        current = utterances[index].start_ms
+        if current < previous:
+            return False
+        previous = current
+    return True
+
+
+def _generation(utterances: MutableSequence[Utterance]) -> int | None:
+    """Return the rewrite counter of *utterances*, or None if it has none."""
+    if isinstance(utterances, (UtteranceList, UtteranceStore)):
+        return utterances.generation
+    return None
+
+
+def _texts(utterances: MutableSequence[Utterance], start: int = 0) -> Iterable[str]:
+    """Return the texts of ``utterances[start:]`` without building store views."""
+    if isinstance(utterances, UtteranceStore):
+        return utterances.iter_texts(start)
+    return (utterances[index].text for index in range(start, len(utterances)))
+
+
+def _languages(utterances: Sequence[Utterance]) -> Iterable[str]:
+    """Return the language tags of *utterances* without building store views."""
+    if isinstance(utterances, UtteranceStore):
+        return utterances.iter_languages()
+    return (utterance.language for utterance in utterances)
+
+
+def _bisect(utterances: MutableSequence[Utterance], start_ms: float) -> int:
+    """Return the position after the last utterance starting at or before start_ms."""
+    if isinstance(utterances, UtteranceStore):
+        return utterances.bisect(start_ms)
+    return bisect.bisect_right(utterances, start_ms, key=_start_ms)
+
 
 class VoiceSessionManager:
-    """Manages voice interaction sessions."""
+    """Manages voice interaction sessions.
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, VoiceSession] = {}
+    Args:
+        storage: Optional durable backend. Sessions it holds are loaded on
+            construction, and every creation, utterance addition and
+            set_state call is recorded through it.
+        registry: Optional bounded session registry. Defaults to an
+            unbounded in-memory table.
+        audio_budget: Maximum total bytes allocated by the audio buffers of
+            all sessions; unbounded when None.
+        metrics: Optional Metrics that times the manager's hot-path methods
+            and counts its sessions and utterances. Without it the methods
+            run uninstrumented.
+        id_factory: Produces the ID of each new session. Defaults to
+            monotonic UUIDv7 IDs, which sort by creation time; pass
+            ``aumai_voicefirst.ids.random_id`` for random UUIDv4 IDs.
+    """
 
-    def create_session(self, config: VoiceConfig) -> VoiceSession:
+    def __init__(
+        self,
+        storage: SessionStorage | None = None,
+        registry: SessionRegistry | None = None,
+        *,
+        audio_budget: int | None = None,
+        metrics: Metrics | None = None,
+        id_factory: IdFactory = uuid7,
+    ) -> None:
+        self._storage = storage
+        self._id_factory = id_factory
+        self._sessions = registry if registry is not None else SessionRegistry()
+        # Called with (previous, new) state inside set_state, so a subclass
+        # that serializes set_state also serializes its listeners.
+        self._state_listeners: tuple[_StateListener, ...] = ()
+        self._audio_budget = audio_budget
+        self._audio: dict[str, AudioRingBuffer] = {}
+        self._audio_bytes = 0
+        self._audio_lock = threading.Lock()
+        if storage is not None:
+            for session in storage.load().values():
+                self._sessions.add(session)
+        if metrics is not None:
+            metrics.instrument_manager(self)
+
+    @property
+    def storage(self) -> SessionStorage | None:
+        """The durable storage backend, or None for an in-memory manager."""
+        return self._storage
+
+    def create_session(
+        self, config: VoiceConfig, *, compact: bool = False
+    ) -> VoiceSession:
         """Create a new voice session.
 
         Args:
             config: Configuration for the session.
+            compact: Store utterances in a columnar UtteranceStore instead of a
+                list, trading per-access view construction for several times
+                less memory per utterance on very long sessions.
 
         Returns:
             A new VoiceSession in 'active' state.
         """
-        session_id = str(uuid.uuid4())
-        session = VoiceSession(session_id=session_id, config=config)
-        self._sessions[session_id] = session
+        session = VoiceSession(session_id=self._id_factory(), config=config)
+        if compact:
+            session.utterances = UtteranceStore()
+        if self._storage is not None:
+            self._storage.session_created(session)
+        self._sessions.add(session)
         return session
 
     def add_utterance(self, session: VoiceSession, utterance: Utterance) -> None:
-        """Append an utterance to an existing session.
+        """Add an utterance to an existing session, keeping start_ms order.
+
+        In-order arrivals are appended in O(1); late arrivals are inserted
+        after any utterances sharing the same start_ms, matching the order a
+        stable sort would produce.
 
         Args:
             session: The VoiceSession to update.
@@ -52,18 +260,121 @@ class VoiceSessionManager:
             raise ValueError(
                 f"Cannot add utterance to session in state '{session.state}'."
             )
-        session.utterances.append(utterance)
+        if self._storage is not None:
+            self._storage.utterances_added(session.session_id, (utterance,))
+        utterances = session.utterances
+        index = self._current_index(session)
+        if isinstance(utterances, UtteranceStore):
+            if utterances.insort(utterance) != len(utterances) - 1:
+                session._transcript = None
+        elif utterances and utterance.start_ms < utterances[-1].start_ms:
+            bisect.insort_right(utterances, utterance, key=_start_ms)
+            session._transcript = None
+        else:
+            utterances.append(utterance)
+        if index is not None:
+            index.add(utterance)
+            session._index_generation = _generation(utterances)
+        self._sessions.touch(session, (utterance,))
+
+    def add_utterances(
+        self,
+        session: VoiceSession,
+        utterances: Iterable[Utterance | Mapping[str, Any]],
+        *,
+        trusted: bool = False,
+    ) -> list[Utterance]:
+        """Add a batch of utterances to an existing session.
+
+        The batch is validated in a single pass, the session state is checked
+        once, and the batch is sorted and merged into the ordered utterance
+        sequence in one step. A batch that starts at or after the last stored
+        utterance is simply appended.
+
+        Args:
+            session: The VoiceSession to update.
+            utterances: Utterance instances or raw dicts with Utterance fields.
+            trusted: The batch holds only already-validated Utterance
+                instances from an internal producer, so the validation pass
+                is skipped entirely. Raw dicts always need validation, which
+                pydantic-core performs faster than unvalidated construction.
+
+        Returns:
+            The added utterances, sorted by start_ms.
+
+        Raises:
+            ValueError: If the session is not in 'active' or 'paused' state.
+            pydantic.ValidationError: If any raw dict fails validation; no
+                utterances are added in that case.
+        """
+        if session.state not in {"active", "paused"}:
+            raise ValueError(
+                f"Cannot add utterance to session in state '{session.state}'."
+            )
+        if trusted:
+            batch = cast(list[Utterance], list(utterances))
+        else:
+            batch = _utterance_batch.validate_python(list(utterances))
+        if not batch:
+            return batch
+        if self._storage is not None:
+            self._storage.utterances_added(session.session_id, batch)
+        self._sessions.touch(session, batch)
+        batch.sort(key=_start_ms)
+
+        existing = session.utterances
+        index = self._current_index(session)
+        position = _bisect(existing, batch[0].start_ms) if existing else 0
+        if position == len(existing):
+            existing.extend(batch)
+            if index is not None:
+                for utterance in batch:
+                    index.add(utterance)
+                session._index_generation = _generation(existing)
+            return batch
+
+        tail = existing[position:]
+        del existing[position:]
+        existing.extend(heapq.merge(tail, batch, key=_start_ms))
+        session._transcript = None
+        session._index = None
+        return batch
 
     def get_transcript(self, session: VoiceSession) -> str:
         """Return the full transcript of a session as a single string.
 
+        The joined text is cached on the session and extended with only the
+        utterances appended since the previous call. The cache is rebuilt when
+        an utterance is inserted, replaced or removed anywhere else, including
+        by editing ``session.utterances`` in place, and is skipped for a plain
+        list assigned to ``session.utterances`` by hand, whose edits cannot be
+        detected.
+
         Args:
             session: The VoiceSession to transcribe.
 
         Returns:
             Newline-separated utterance texts ordered by start_ms.
         """
-        ordered = sorted(session.utterances, key=lambda u: u.start_ms)
+        utterances = session.utterances
+        generation = _generation(utterances)
+        snapshot = session._transcript
+        if snapshot is not None and generation is not None:
+            source, cached_generation, count, cached = snapshot
+            if source is utterances and cached_generation == generation:
+                if count == len(utterances):
+                    return cached
+                if count < len(utterances) and _is_ordered(utterances, count):
+                    tail = "\n".join(_texts(utterances, count))
+                    text = f"{cached}\n{tail}" if count else tail
+                    self._cache_transcript(session, text)
+                    return text
+
+        if _is_ordered(utterances):
+            text = "\n".join(_texts(utterances))
+            self._cache_transcript(session, text)
+            return text
+        ordered = sorted(utterances, key=_start_ms)
         return "\n".join(u.text for u in ordered)
 
     def get_session(self, session_id: str) -> VoiceSession:
@@ -78,15 +389,343 @@ class VoiceSessionManager:
         Raises:
             KeyError: If the session does not exist.
         """
-        return self._sessions[session_id]
+        return self._sessions.get(session_id)
+
+    def set_state(self, session: VoiceSession, state: SessionState) -> None:
+        """Move a session to a new lifecycle state.
+
+        Prefer this over assigning ``session.state`` directly: the transition
+        is recorded by the storage backend, if any.
+
+        Args:
+            session: The VoiceSession to update.
+            state: The new state.
+
+        Raises:
+            ValueError: If state is not a valid session state.
+        """
+        if state not in get_args(SessionState):
+            raise ValueError(f"Unknown session state '{state}'.")
+        if self._storage is not None:
+            self._storage.state_changed(session.session_id, state)
+        previous = session.state
+        session.state = state
+        for listener in self._state_listeners:
+            listener(previous, state)
+        if state in {"completed", "error"}:
+            self._sessions.demote(session.session_id)
+            self.release_audio(session)
+        else:
+            self._sessions.touch(session)
+
+    def checkpoint(self) -> None:
+        """Compact the storage backend into a snapshot of the current sessions.
+
+        Does nothing when the manager has no storage backend.
+        """
+        if self._storage is not None:
+            self._storage.compact(self._sessions.sessions())
+
+    def registry_stats(self) -> RegistryStats:
+        """Return session cache sizes and hit, miss and eviction counters."""
+        return self._sessions.stats()
+
+    def sessions(self) -> Iterator[VoiceSession]:
+        """Yield every session, including spilled ones, without touching them."""
+        return self._sessions.sessions()
+
+    def add_state_listener(self, listener: _StateListener) -> None:
+        """Call *listener* with the previous and new state on each set_state.
+
+        Listeners run inside set_state, so a subclass that serializes
+        set_state also serializes its listeners.
+        """
+        self._state_listeners = (*self._state_listeners, listener)
+
+    def add_discard_listener(self, listener: Callable[[VoiceSession], None]) -> None:
+        """Call *listener* with each session the registry discards on eviction.
+
+        Only sessions evicted with no spill directory to write them to are
+        discarded; spilled sessions are still held.
+        """
+        self._sessions.add_discard_listener(listener)
+
+    def open_audio(
+        self,
+        session: VoiceSession,
+        seconds: float = 10.0,
+        *,
+        sample_width: int = 2,
+        policy: OverflowPolicy = "overwrite",
+    ) -> AudioRingBuffer:
+        """Allocate a ring buffer holding the session's most recent audio.
+
+        The buffer is sized from the session's sample rate and channel count
+        and charged against the manager's audio budget until it is released,
+        explicitly or by moving the session to 'completed' or 'error'.
+        Opening audio for a session that already has a buffer returns it.
+
+        Args:
+            session: The VoiceSession the audio belongs to.
+            seconds: Duration of audio to retain.
+            sample_width: Bytes per sample of one channel.
+            policy: Behaviour of a write into a full buffer.
+
+        Returns:
+            The session's AudioRingBuffer.
+
+        Raises:
+            ValueError: If the session is not in 'active' or 'paused' state,
+                or the buffer would exceed the audio budget.
+        """
+        if session.state not in {"active", "paused"}:
+            raise ValueError(
+                f"Cannot open audio for session in state '{session.state}'."
+            )
+        with self._audio_lock:
+            existing = self._audio.get(session.session_id)
+            if existing is not None:
+                return existing
+            buffer = AudioRingBuffer(
+                session.config, seconds, sample_width=sample_width, policy=policy
+            )
+            total = self._audio_bytes + buffer.capacity
+            if self._audio_budget is not None and total > self._audio_budget:
+                raise ValueError(
+                    f"Audio buffer of {buffer.capacity} bytes would exceed the "
+                    f"audio budget of {self._audio_budget} bytes "
+                    f"({self._audio_bytes} in use)."
+                )
+            self._audio[session.session_id] = buffer
+            self._audio_bytes = total
+            return buffer
+
+    def audio_buffer(self, session: VoiceSession) -> AudioRingBuffer:
+        """Return the session's open audio buffer.
+
+        Raises:
+            KeyError: If no audio buffer is open for the session.
+        """
+        with self._audio_lock:
+            try:
+                return self._audio[session.session_id]
+            except KeyError:
+                raise KeyError(
+                    f"No audio buffer open for session '{session.session_id}'."
+                ) from None
+
+    def release_audio(self, session: VoiceSession) -> None:
+        """Close the session's audio buffer and return its bytes to the budget.
+
+        Does nothing when the session has no audio buffer.
+        """
+        with self._audio_lock:
+            buffer = self._audio.pop(session.session_id, None)
+            if buffer is None:
+                return
+            self._audio_bytes -= buffer.capacity
+        buffer.close()
+
+    def audio_stats(self) -> AudioBufferStats:
+        """Return memory and overflow totals across all open audio buffers."""
+        with self._audio_lock:
+            buffers = list(self._audio.values())
+            allocated = self._audio_bytes
+        return AudioBufferStats(
+            buffers=len(buffers),
+            allocated_bytes=allocated,
+            buffered_bytes=sum(len(buffer) for buffer in buffers),
+            unread_bytes=sum(buffer.unread for buffer in buffers),
+            dropped_bytes=sum(buffer.dropped for buffer in buffers),
+        )
+
+    def close(self) -> None:
+        """Release all audio buffers and close the storage backend, if any."""
+        with self._audio_lock:
+            buffers = list(self._audio.values())
+            self._audio.clear()
+            self._audio_bytes = 0
+        for buffer in buffers:
+            buffer.close()
+        if self._storage is not None:
+            self._storage.close()
+
+    def utterances_in_range(
+        self, session: VoiceSession, start_ms: float, end_ms: float
+    ) -> Iterator[Utterance]:
+        """Lazily yield the utterances overlapping a time window.
+
+        Uses the session's time-range index instead of scanning every
+        utterance. The index is built on first use and then kept current by
+        add_utterance.
+
+        Args:
+            session: The VoiceSession to query.
+            start_ms: Window start in milliseconds (inclusive).
+            end_ms: Window end in milliseconds (inclusive).
+
+        Returns:
+            An iterator over overlapping utterances in start_ms order.
+
+        Raises:
+            ValueError: If start_ms is greater than end_ms.
+        """
+        return self._index_for(session).overlapping(start_ms, end_ms)
+
+    def utterances_at(
+        self, session: VoiceSession, time_ms: float
+    ) -> Iterator[Utterance]:
+        """Lazily yield the utterances being spoken at a point in time.
+
+        Args:
+            session: The VoiceSession to query.
+            time_ms: The point in time in milliseconds.
+
+        Returns:
+            An iterator over utterances whose span contains time_ms.
+        """
+        return self._index_for(session).at(time_ms)
+
+    def transcript_slice(
+        self, session: VoiceSession, start_ms: float, end_ms: float
+    ) -> Iterator[str]:
+        """Stream the transcript lines for a time window.
+
+        Args:
+            session: The VoiceSession to transcribe.
+            start_ms: Window start in milliseconds (inclusive).
+            end_ms: Window end in milliseconds (inclusive).
+
+        Returns:
+            An iterator over the texts of overlapping utterances, ordered by
+            start_ms.
+
+        Raises:
+            ValueError: If start_ms is greater than end_ms.
+        """
+        overlapping = self.utterances_in_range(session, start_ms, end_ms)
+        return (utterance.text for utterance in overlapping)
+
+    @classmethod
+    def _index_for(cls, session: VoiceSession) -> UtteranceIndex:
+        """Return the session's time-range index, rebuilding it if stale."""
+        index = cls._current_index(session)
+        if index is None:
+            utterances = session.utterances
+            index = UtteranceIndex(utterances)
+            session._index = index
+            session._index_source = utterances
+            session._index_generation = _generation(utterances)
+        return index
+
+    @staticmethod
+    def _current_index(session: VoiceSession) -> UtteranceIndex | None:
+        """Return the session's index if no edit has bypassed it, else None."""
+        index = session._index
+        utterances = session.utterances
+        if (
+            index is None
+            or session._index_source is not utterances
+            or len(index) != len(utterances)
+        ):
+            return None
+        generation = _generation(utterances)
+        if generation is None or generation != session._index_generation:
+            return None
+        return index
+
+    @staticmethod
+    def _cached_transcript(session: VoiceSession) -> str | None:
+        """Return the cached transcript if it covers the current utterances."""
+        snapshot = session._transcript
+        if snapshot is None:
+            return None
+        source, generation, count, text = snapshot
+        utterances = session.utterances
+        if (
+            source is utterances
+            and count == len(utterances)
+            and generation == _generation(utterances)
+        ):
+            return text
+        return None
+
+    @staticmethod
+    def _cache_transcript(session: VoiceSession, text: str) -> None:
+        """Record *text* as the transcript of the session's current utterances."""
+        utterances = session.utterances
+        generation = _generation(utterances)
+        if generation is None:
+            return
+        session._transcript = (utterances, generation, len(utterances), text)
 
 
 class VoiceRouter:
-    """Route voice interactions to appropriate language handlers."""
+    """Route voice interactions to appropriate language handlers.
+
+    Handlers are looked up in a HandlerTable, which matches the longest
+    registered prefix of a BCP-47 tag. The resolved handler of each tag is
+    memoized in a bounded LRU cache, so routing a tag seen recently costs a
+    single cache lookup.
+
+    The table can be replaced at any time with ``reload`` or extended with
+    ``register``. Both swap in a new table and cache in one assignment, so
+    concurrent ``route`` calls never block and see either the old or the new
+    table.
+
+    Args:
+        table: Handler table to route with. Defaults to the built-in Indic,
+            CJK and Arabic family table.
+        cache_size: Maximum number of distinct language tags memoized.
+        metrics: Optional Metrics that times routing and counts routed
+            utterances per handler.
+    """
+
+    def __init__(
+        self,
+        table: HandlerTable | None = None,
+        *,
+        cache_size: int = _DEFAULT_ROUTE_CACHE_SIZE,
+        metrics: Metrics | None = None,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1.")
+        self._cache_size = cache_size
+        self._reload_lock = threading.Lock()
+        self._install(table if table is not None else _DEFAULT_HANDLER_TABLE)
+        if metrics is not None:
+            metrics.instrument_router(self)
+
+    @property
+    def table(self) -> HandlerTable:
+        """The handler table currently used for routing."""
+        return self._table
+
+    def reload(self, table: HandlerTable) -> None:
+        """Replace the handler table without pausing routing.
+
+        Args:
+            table: The new table; memoized results of the old one are dropped.
+        """
+        with self._reload_lock:
+            self._install(table)
+
+    def register(self, tag: str, handler_id: str) -> None:
+        """Route a tag prefix, and every longer tag under it, to a handler.
+
+        Raises:
+            ValueError: If the tag prefix is malformed.
+        """
+        with self._reload_lock:
+            self._install(self._table.with_routes({tag: handler_id}))
 
     def route(self, utterance: Utterance) -> str:
         """Determine the handler ID for an utterance based on language.
 
+        With the default table, a script subtag (``pa-Arab``, ``sd-Deva``)
+        decides the family when it maps to one; otherwise the primary
+        language subtag does.
+
         Args:
             utterance: The utterance to route.
 
@@ -94,12 +733,39 @@ class VoiceRouter:
             A handler identifier string such as 'handler.indic',
             'handler.cjk', 'handler.arabic', or 'handler.default'.
         """
-        lang = utterance.language.lower().split("-")[0]
+        return self._resolve(utterance.language)
+
+    def route_many(
+        self, utterances: Sequence[Utterance] | VoiceSession
+    ) -> dict[str, list[int]]:
+        """Route a batch of utterances and group their positions by handler.
+
+        Each distinct language tag is resolved once, however many utterances
+        carry it, so a batch costs one pass plus one lookup per tag.
+
+        Args:
+            utterances: The utterances to route, or a session whose
+                utterances are routed in their stored order.
+
+        Returns:
+            A mapping from handler ID to the ascending indices of the
+            utterances routed to it, in order of each handler's first use.
+        """
+        if isinstance(utterances, VoiceSession):
+            utterances = utterances.utterances
+        resolve = self._resolve
+        groups: dict[str, list[int]] = {}
+        by_tag: dict[str, list[int]] = {}
+        for index, language in enumerate(_languages(utterances)):
+            group = by_tag.get(language)
+            if group is None:
+                group = groups.setdefault(resolve(language), [])
+                by_tag[language] = group
+            group.append(index)
+        return groups
 
-        if lang in _INDIC_LANGUAGES:
-            return "handler.indic"
-        if lang in _CJK_LANGUAGES:
-            return "handler.cjk"
-        if lang in _ARABIC_LANGUAGES:
-            return "handler.arabic"
-        return "handler.default"
+    def _install(self, table: HandlerTable) -> None:
+        # Readers load self._resolve once per call, so publishing the cached
+        # resolver in a single assignment keeps the swap atomic.
+        self._table = table
+        self._resolve = functools.lru_cache(maxsize=self._cache_size)(table.resolve)
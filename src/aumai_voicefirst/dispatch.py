@@ -0,0 +1,259 @@
+"""Concurrent handler dispatch for routed utterances."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from aumai_voicefirst.core import VoiceRouter
+from aumai_voicefirst.models import Utterance, VoiceSession
+
+__all__ = ["HandlerDispatcher"]
+
+
+class _Handler:
+    """A registered handler callable with its executor and pending slots."""
+
+    __slots__ = ("executor", "function", "slots")
+
+    def __init__(
+        self, function: Callable[[Utterance], Any], executor: Executor, max_pending: int
+    ) -> None:
+        self.function = function
+        self.executor = executor
+        self.slots = threading.BoundedSemaphore(max_pending)
+
+
+class _SessionQueue:
+    """Submitted work of one session awaiting in-order completion."""
+
+    __slots__ = ("draining", "pending")
+
+    def __init__(self) -> None:
+        # (work future, ordered future) pairs in submission order.
+        self.pending: deque[tuple[Future[Any], Future[Any]]] = deque()
+        self.draining = False
+
+
+class HandlerDispatcher:
+    """Run registered handler callables on routed utterances concurrently.
+
+    Every handler ID gets its own executor, so a slow handler family only
+    ever occupies its own workers and cannot starve the others. Each handler
+    admits at most ``max_pending`` queued or running utterances; ``submit``
+    blocks once that bound is reached, which pushes back on producers instead
+    of letting queues grow without limit.
+
+    Handlers may finish out of order, but the futures returned by ``submit``
+    complete in submission order per session, so callbacks attached to them
+    observe each session's utterances in sequence.
+
+    Args:
+        router: Router that picks the handler ID for each utterance.
+    """
+
+    def __init__(self, router: VoiceRouter | None = None) -> None:
+        self._router = router if router is not None else VoiceRouter()
+        self._handlers: dict[str, _Handler] = {}
+        self._sessions: dict[str, _SessionQueue] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> HandlerDispatcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def register_handler(
+        self,
+        handler_id: str,
+        function: Callable[[Utterance], Any],
+        *,
+        workers: int = 1,
+        max_pending: int = 64,
+        pool: Literal["thread", "process"] = "thread",
+    ) -> None:
+        """Register the callable that processes utterances routed to a handler.
+
+        Args:
+            handler_id: Handler ID as returned by the router.
+            function: Called with each utterance; its return value becomes
+                the result of the submitted future. Must be picklable when
+                ``pool`` is 'process'.
+            workers: Maximum number of concurrent calls of this handler.
+            max_pending: Maximum utterances queued or running for this
+                handler before ``submit`` blocks.
+            pool: Run calls in worker threads, or in worker processes for
+                CPU-bound handlers.
+
+        Raises:
+            ValueError: If the handler ID is already registered or a bound
+                is smaller than 1.
+        """
+        if workers < 1 or max_pending < 1:
+            raise ValueError("workers and max_pending must be at least 1.")
+        if pool not in ("thread", "process"):
+            raise ValueError(f"Unknown pool kind: {pool!r}")
+        executor: Executor = (
+            ThreadPoolExecutor(workers, thread_name_prefix=handler_id)
+            if pool == "thread"
+            else ProcessPoolExecutor(workers)
+        )
+        with self._lock:
+            if handler_id in self._handlers:
+                executor.shutdown()
+                raise ValueError(f"Handler already registered: {handler_id!r}")
+            self._handlers[handler_id] = _Handler(function, executor, max_pending)
+
+    def submit(
+        self,
+        session: VoiceSession,
+        utterance: Utterance,
+        *,
+        timeout: float | None = None,
+    ) -> Future[Any]:
+        """Route an utterance and schedule its handler.
+
+        Args:
+            session: The session the utterance belongs to.
+            utterance: The utterance to process.
+            timeout: Seconds to wait for a free slot when the handler is at
+                max_pending; None waits indefinitely.
+
+        Returns:
+            A future for the handler's result, completed only after every
+            earlier submission for the same session.
+
+        Raises:
+            KeyError: If no handler is registered for the routed handler ID.
+            TimeoutError: If no slot frees up within the timeout.
+            RuntimeError: If the dispatcher is closed.
+        """
+        handler_id = self._router.route(utterance)
+        return self._submit(
+            session.session_id, self._handler(handler_id), utterance, timeout
+        )
+
+    def submit_many(
+        self,
+        session: VoiceSession,
+        utterances: Iterable[Utterance] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> list[Future[Any]]:
+        """Route a batch with VoiceRouter.route_many and schedule each item.
+
+        Items are submitted in their given order, so the returned futures
+        complete in that order. Every routed handler is checked before
+        anything is submitted.
+
+        Args:
+            session: The session the utterances belong to.
+            utterances: The utterances to process. Defaults to all of the
+                session's utterances.
+            timeout: Per-item wait for a free slot, as for ``submit``.
+
+        Returns:
+            One future per utterance, in input order.
+
+        Raises:
+            KeyError: If no handler is registered for a routed handler ID.
+            TimeoutError: If a slot does not free up within the timeout.
+            RuntimeError: If the dispatcher is closed.
+        """
+        batch = list(session.utterances if utterances is None else utterances)
+        handlers: list[_Handler | None] = [None] * len(batch)
+        for handler_id, indices in self._router.route_many(batch).items():
+            handler = self._handler(handler_id)
+            for index in indices:
+                handlers[index] = handler
+        return [
+            self._submit(session.session_id, handler, utterance, timeout)
+            for handler, utterance in zip(handlers, batch, strict=True)
+            if handler is not None
+        ]
+
+    def close(self, *, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop accepting work and shut down every handler's executor.
+
+        Args:
+            wait: Block until running and queued calls finish.
+            cancel_pending: Cancel calls that have not started yet.
+        """
+        with self._lock:
+            self._closed = True
+            handlers = list(self._handlers.values())
+        for handler in handlers:
+            handler.executor.shutdown(wait=wait, cancel_futures=cancel_pending)
+
+    def _handler(self, handler_id: str) -> _Handler:
+        try:
+            return self._handlers[handler_id]
+        except KeyError:
+            raise KeyError(f"No handler registered for {handler_id!r}") from None
+
+    def _submit(
+        self,
+        session_id: str,
+        handler: _Handler,
+        utterance: Utterance,
+        timeout: float | None,
+    ) -> Future[Any]:
+        if self._closed:
+            raise RuntimeError("Dispatcher is closed.")
+        if not handler.slots.acquire(timeout=timeout):
+            raise TimeoutError("Handler queue is full.")
+        try:
+            work = handler.executor.submit(handler.function, utterance)
+        except BaseException:
+            handler.slots.release()
+            raise
+        work.add_done_callback(lambda _: handler.slots.release())
+
+        ordered: Future[Any] = Future()
+        with self._lock:
+            queue = self._sessions.get(session_id)
+            if queue is None:
+                queue = self._sessions[session_id] = _SessionQueue()
+            queue.pending.append((work, ordered))
+        work.add_done_callback(lambda _: self._drain(session_id))
+        return ordered
+
+    def _drain(self, session_id: str) -> None:
+        # Release finished work in submission order. Only one thread drains a
+        # session at a time; others that finish meanwhile leave their work for
+        # it, which the drainer sees on its next pass under the lock.
+        with self._lock:
+            queue = self._sessions.get(session_id)
+            if queue is None or queue.draining:
+                return
+            queue.draining = True
+        while True:
+            ready = []
+            with self._lock:
+                while queue.pending and queue.pending[0][0].done():
+                    ready.append(queue.pending.popleft())
+                if not ready:
+                    queue.draining = False
+                    if not queue.pending:
+                        del self._sessions[session_id]
+                    return
+            for work, ordered in ready:
+                _transfer(work, ordered)
+
+
+def _transfer(source: Future[Any], target: Future[Any]) -> None:
+    if target.cancelled():
+        return
+    if source.cancelled():
+        target.cancel()
+        return
+    exception = source.exception()
+    if exception is not None:
+        target.set_exception(exception)
+    else:
+        target.set_result(source.result())
@@ -0,0 +1,139 @@
+"""Session ID generation for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+import uuid
+import weakref
+from collections.abc import Callable
+
+__all__ = ["IdFactory", "UUID7Generator", "random_id", "timestamp_ms", "uuid7"]
+
+IdFactory = Callable[[], str]
+"""Zero-argument callable returning a new, unique session ID."""
+
+# A UUIDv7 holds a 48-bit millisecond timestamp, then 74 bits that this
+# generator uses as a counter, split around the version and variant fields.
+_COUNTER_BITS = 74
+_RAND_B_BITS = 62
+_RAND_B_MASK = (1 << _RAND_B_BITS) - 1
+# Fresh counters start in the lower half, and same-millisecond IDs step by at
+# most 2**32, so a millisecond fits at least 2**41 IDs before borrowing the next.
+_SEED_BITS = _COUNTER_BITS - 1
+_STEP_BITS = 32
+_VERSION = 0x7 << 76
+_VARIANT = 0b10 << 62
+
+
+def random_id() -> str:
+    """Return a random UUIDv4 string, as sessions used before UUIDv7 IDs."""
+    return str(uuid.uuid4())
+
+
+class UUID7Generator:
+    """Monotonic UUIDv7 session IDs that sort by creation time.
+
+    IDs follow RFC 9562: the first 48 bits are the Unix time in milliseconds,
+    so comparing two IDs as strings orders them by creation time, and
+    ``timestamp_ms`` recovers the time without any lookup. The remaining 74
+    bits form a counter that starts at a random value each millisecond and
+    advances by a random step for every further ID in that millisecond.
+    Successive IDs from one generator are therefore strictly increasing,
+    even when the clock stalls or steps backwards.
+
+    Random bits come from a PRNG seeded once from the OS, so producing an
+    ID costs no system call. A child process started with ``os.fork``
+    reseeds every generator from the OS, so parent and child never repeat
+    each other's IDs. The step makes neighbouring IDs hard to guess, but an
+    ID is not a secret: do not use it as a credential.
+
+    Instances are safe to share between threads.
+
+    Args:
+        clock: Wall-clock source in nanoseconds since the epoch.
+        seed: PRNG seed, for reproducible IDs in tests; OS entropy if None.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], int] = time.time_ns,
+        seed: int | None = None,
+    ) -> None:
+        self._clock = clock
+        self._random = random.Random(  # noqa: S311 - unpredictability only
+            seed if seed is not None else os.urandom(16)
+        )
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+        _generators.add(self)
+
+    def __call__(self) -> str:
+        """Return the next ID."""
+        now_ms = self._clock() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = self._random.getrandbits(_SEED_BITS)
+            else:
+                self._counter += self._random.getrandbits(_STEP_BITS) + 1
+                if self._counter >> _COUNTER_BITS:
+                    # Counter exhausted: borrow the next millisecond.
+                    self._last_ms += 1
+                    self._counter = self._random.getrandbits(_SEED_BITS)
+            value = (
+                (self._last_ms << 80)
+                | _VERSION
+                | (self._counter >> _RAND_B_BITS) << 64
+                | _VARIANT
+                | (self._counter & _RAND_B_MASK)
+            )
+        text = f"{value:032x}"
+        return f"{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}"
+
+    def _reseed(self) -> None:
+        # Another parent thread may have held the lock at fork time.
+        self._lock = threading.Lock()
+        self._random.seed(os.urandom(16))
+
+
+# Every live generator, so a forked child can reseed them all.
+_generators: weakref.WeakSet[UUID7Generator] = weakref.WeakSet()
+
+
+def _reseed_after_fork() -> None:
+    for generator in list(_generators):
+        generator._reseed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
+uuid7: IdFactory = UUID7Generator()
+"""Process-wide UUIDv7 generator; the default session ID factory."""
+
+
+def timestamp_ms(session_id: str) -> int:
+    """Return the creation time encoded in a UUIDv7 session ID.
+
+    Args:
+        session_id: An ID produced by UUID7Generator.
+
+    Returns:
+        Milliseconds since the Unix epoch.
+
+    Raises:
+        ValueError: If the ID is not a UUIDv7.
+    """
+    try:
+        parsed = uuid.UUID(session_id)
+    except ValueError:
+        raise ValueError(f"'{session_id}' is not a UUID.") from None
+    if parsed.version != 7:
+        raise ValueError(f"'{session_id}' is not a time-ordered UUIDv7.")
+    return parsed.int >> 80
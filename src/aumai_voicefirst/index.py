@@ -0,0 +1,157 @@
+"""Time-range index over session utterances for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence
+
+from aumai_voicefirst.models import Utterance
+from aumai_voicefirst.store import UtteranceStore
+
+__all__ = ["UtteranceIndex"]
+
+_EMPTY = float("-inf")
+
+
+class UtteranceIndex:
+    """Interval index answering time-range queries over utterances.
+
+    Utterances are kept ordered by ``start_ms``, with a segment tree holding
+    the maximum ``end_ms`` of every aligned block of positions. A query
+    bisects the start times to drop every utterance that starts after the
+    window, then walks down the tree into blocks whose maximum end reaches
+    the window start, skipping whole blocks that end too early. A query
+    therefore costs O((k + 1) log n) for k results, however the utterances
+    overlap: one long utterance only adds itself to the results.
+
+    In-order additions cost O(log n) amortized; a late addition costs
+    O(k) where k is the number of utterances that start after it.
+
+    Indexing an ``UtteranceStore`` keeps the index's own copy columnar too.
+    """
+
+    def __init__(self, utterances: Iterable[Utterance] = ()) -> None:
+        self._items: MutableSequence[Utterance]
+        if isinstance(utterances, UtteranceStore):
+            self._items = utterances.ordered_copy()
+        else:
+            self._items = sorted(utterances, key=lambda u: u.start_ms)
+        self._starts = array("d", _start_times(self._items))
+        self._build(max(len(self._items), 1))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, utterance: Utterance) -> None:
+        """Index an utterance, keeping start_ms order.
+
+        Utterances sharing a start_ms stay in arrival order.
+
+        Args:
+            utterance: The utterance to index.
+        """
+        start = utterance.start_ms
+        size = len(self._items)
+        if not self._starts or start >= self._starts[-1]:
+            self._items.append(utterance)
+            self._starts.append(start)
+            if size == self._capacity:
+                self._build(2 * self._capacity)
+            else:
+                self._set(size, utterance.end_ms)
+            return
+
+        position = bisect.bisect_right(self._starts, start)
+        self._items.insert(position, utterance)
+        self._starts.insert(position, start)
+        if size == self._capacity:
+            self._build(2 * self._capacity)
+            return
+        tree, capacity = self._tree, self._capacity
+        for leaf, end_ms in enumerate(_end_times(self._items, position), position):
+            tree[capacity + leaf] = end_ms
+        low, high = (capacity + position) // 2, (capacity + size) // 2
+        while low:
+            for node in range(low, high + 1):
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            low, high = low // 2, high // 2
+
+    def overlapping(self, start_ms: float, end_ms: float) -> Iterator[Utterance]:
+        """Yield utterances overlapping the closed window [start_ms, end_ms].
+
+        Results are produced lazily in start_ms order.
+
+        Args:
+            start_ms: Window start in milliseconds.
+            end_ms: Window end in milliseconds.
+
+        Yields:
+            Each utterance with ``start_ms <= end_ms`` and ``end_ms >= start_ms``.
+
+        Raises:
+            ValueError: If start_ms is greater than end_ms.
+        """
+        if start_ms > end_ms:
+            raise ValueError(f"Window start {start_ms} is after window end {end_ms}.")
+        return self._scan(start_ms, end_ms)
+
+    def at(self, time_ms: float) -> Iterator[Utterance]:
+        """Yield utterances spanning a single point in time.
+
+        Args:
+            time_ms: The point in time in milliseconds.
+
+        Yields:
+            Each utterance with ``start_ms <= time_ms <= end_ms``.
+        """
+        return self._scan(time_ms, time_ms)
+
+    def _build(self, capacity: int) -> None:
+        """Rebuild the tree with room for *capacity* leaves, a power of two."""
+        capacity = 1 << (capacity - 1).bit_length()
+        tree = array("d", [_EMPTY]) * (2 * capacity)
+        tree[capacity : capacity + len(self._items)] = array(
+            "d", _end_times(self._items)
+        )
+        for node in range(capacity - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+        self._capacity = capacity
+
+    def _set(self, position: int, end_ms: float) -> None:
+        tree = self._tree
+        node = self._capacity + position
+        tree[node] = end_ms
+        node //= 2
+        while node and tree[node] < end_ms:
+            tree[node] = end_ms
+            node //= 2
+
+    def _scan(self, start_ms: float, end_ms: float) -> Iterator[Utterance]:
+        high = bisect.bisect_right(self._starts, end_ms)
+        tree, capacity, items = self._tree, self._capacity, self._items
+        # Depth-first, left to right, over (node, first position, width).
+        stack = [(1, 0, capacity)]
+        while stack:
+            node, first, width = stack.pop()
+            if first >= high or tree[node] < start_ms:
+                continue
+            if width == 1:
+                yield items[first]
+                continue
+            half = width // 2
+            stack.append((2 * node + 1, first + half, half))
+            stack.append((2 * node, first, half))
+
+
+def _start_times(items: MutableSequence[Utterance]) -> Iterable[float]:
+    if isinstance(items, UtteranceStore):
+        return items.start_times()
+    return (u.start_ms for u in items)
+
+
+def _end_times(items: MutableSequence[Utterance], start: int = 0) -> Iterable[float]:
+    if isinstance(items, UtteranceStore):
+        return items.end_times(start)
+    return (items[index].end_ms for index in range(start, len(items)))
@@ -0,0 +1,383 @@
+"""Opt-in hot-path instrumentation for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from aumai_voicefirst.core import VoiceRouter, VoiceSessionManager
+    from aumai_voicefirst.models import SessionState, Utterance, VoiceSession
+
+__all__ = ["CONTENT_TYPE", "DEFAULT_BUCKETS", "Metrics", "MetricsHook", "Observation"]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""HTTP Content-Type of the Prometheus text exposition format."""
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6,
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    0.1, 0.25, 0.5, 1.0,
+)  # fmt: skip
+"""Latency bucket upper bounds in seconds, from 1 µs to 1 s."""
+
+_MANAGER_OPERATIONS = (
+    "create_session",
+    "add_utterance",
+    "add_utterances",
+    "get_transcript",
+    "get_session",
+    "set_state",
+)
+_ROUTER_OPERATIONS = ("route", "route_many")
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class Observation:
+    """One completed call of an instrumented operation, as passed to hooks.
+
+    Attributes:
+        operation: Method name, e.g. ``"add_utterance"``.
+        start_ns: Wall-clock start time in nanoseconds since the epoch.
+        duration_ns: Elapsed time in nanoseconds, from a monotonic clock.
+        error: The exception the call raised, or None.
+    """
+
+    __slots__ = ("duration_ns", "error", "operation", "start_ns")
+
+    def __init__(
+        self,
+        operation: str,
+        start_ns: int,
+        duration_ns: int,
+        error: BaseException | None = None,
+    ) -> None:
+        self.operation = operation
+        self.start_ns = start_ns
+        self.duration_ns = duration_ns
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"Observation({self.operation!r}, duration_ns={self.duration_ns})"
+
+
+MetricsHook = Callable[[Observation], None]
+"""Callback invoked after every instrumented call, e.g. to record a span."""
+
+
+class _Histogram:
+    """Latency histogram with fixed bucket bounds; guarded by Metrics._lock."""
+
+    __slots__ = ("count", "counts", "total_ns")
+
+    def __init__(self, buckets: int) -> None:
+        # One slot per bound plus the +Inf overflow, stored non-cumulatively.
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.total_ns = 0
+
+
+class Metrics:
+    """Counters and latency histograms for a manager and router.
+
+    Nothing is measured until a VoiceSessionManager or VoiceRouter is
+    instrumented, usually by passing the Metrics as their ``metrics``
+    argument. Instrumenting replaces the object's public hot-path methods
+    with timed wrappers on that instance only, so uninstrumented objects
+    run the original methods with no added cost at all.
+
+    Recorded per instance:
+
+    * ``voicefirst_operation_seconds``: latency histogram per operation.
+    * ``voicefirst_operation_errors_total``: calls that raised, per operation.
+    * ``voicefirst_utterances_added_total``: utterances accepted.
+    * ``voicefirst_sessions``: sessions per state, counting those created
+      or loaded by the manager and moved with ``set_state``, until the
+      session registry discards them.
+    * ``voicefirst_routes_total``: routed utterances per handler ID.
+
+    ``render`` produces the Prometheus text exposition format, ready to be
+    served on a scrape endpoint. Hooks receive an Observation after every
+    call, which is enough to attach an external tracer.
+
+    All methods are safe to call from different threads.
+
+    Args:
+        buckets: Ascending latency bucket upper bounds in seconds.
+        hooks: Initial hooks, as for ``add_hook``.
+
+    Raises:
+        ValueError: If buckets is empty or not strictly ascending.
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        hooks: Iterable[MetricsHook] = (),
+    ) -> None:
+        bounds = tuple(float(bound) for bound in buckets)
+        if not bounds or any(a >= b for a, b in zip(bounds, bounds[1:], strict=False)):
+            raise ValueError("buckets must be non-empty and strictly ascending.")
+        self._bounds = bounds
+        # Durations are bucketed as integer nanoseconds, so a call costs no
+        # float conversion.
+        self._bounds_ns = tuple(round(bound * 1e9) for bound in bounds)
+        self._lock = threading.Lock()
+        self._histograms: dict[str, _Histogram] = {}
+        self._errors: dict[str, int] = {}
+        self._routes: dict[str, int] = {}
+        self._states: dict[str, int] = {}
+        self._utterances = 0
+        # Hooks are published as a tuple so calls never iterate a mutating list.
+        self._hooks: tuple[MetricsHook, ...] = tuple(hooks)
+        self._epoch_offset = time.time_ns() - time.perf_counter_ns()
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """Call *hook* with an Observation after every instrumented call.
+
+        Hooks run synchronously in the calling thread after the metrics are
+        updated; an exception from a hook propagates to the caller.
+        """
+        with self._lock:
+            self._hooks = (*self._hooks, hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        """Stop calling *hook*.
+
+        Raises:
+            ValueError: If the hook was not added.
+        """
+        with self._lock:
+            if hook not in self._hooks:
+                raise ValueError("Hook was not added.")
+            hooks = list(self._hooks)
+            hooks.remove(hook)
+            self._hooks = tuple(hooks)
+
+    def instrument_manager(self, manager: VoiceSessionManager) -> None:
+        """Time the hot-path methods of *manager* and track its sessions.
+
+        Sessions the manager already holds are counted by state once, here.
+        State changes are counted from inside ``set_state``, under any lock
+        the manager holds there, and sessions its registry discards stop
+        being counted; spilled sessions still count.
+        """
+        states: dict[str, int] = {}
+        for session in manager.sessions():
+            states[session.state] = states.get(session.state, 0) + 1
+        with self._lock:
+            for state, count in states.items():
+                self._states[state] = self._states.get(state, 0) + count
+        manager.add_state_listener(self._state_changed)
+        manager.add_discard_listener(self._discarded)
+        for operation in _MANAGER_OPERATIONS:
+            method = getattr(manager, operation)
+            instrumented = getattr(self, f"_instrument_{operation}", None)
+            wrapper = (
+                instrumented(method) if instrumented else self._timed(operation, method)
+            )
+            setattr(manager, operation, wrapper)
+
+    def instrument_router(self, router: VoiceRouter) -> None:
+        """Time the routing methods of *router* and count routes per handler."""
+        for operation in _ROUTER_OPERATIONS:
+            method = getattr(router, operation)
+            setattr(
+                router, operation, getattr(self, f"_instrument_{operation}")(method)
+            )
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = {
+                operation: (list(h.counts), h.count, h.total_ns / 1e9)
+                for operation, h in self._histograms.items()
+            }
+            errors = dict(self._errors)
+            routes = dict(self._routes)
+            states = dict(self._states)
+            utterances = self._utterances
+
+        lines = [
+            "# HELP voicefirst_operation_seconds Latency of instrumented operations.",
+            "# TYPE voicefirst_operation_seconds histogram",
+        ]
+        for operation, (counts, count, total) in sorted(histograms.items()):
+            label = f'operation="{_escape(operation)}"'
+            cumulative = 0
+            for bound, bucket in zip(self._bounds, counts, strict=False):
+                cumulative += bucket
+                lines.append(
+                    f"voicefirst_operation_seconds_bucket"
+                    f'{{{label},le="{bound!r}"}} {cumulative}'
+                )
+            lines.append(
+                f'voicefirst_operation_seconds_bucket{{{label},le="+Inf"}} {count}'
+            )
+            lines.append(f"voicefirst_operation_seconds_sum{{{label}}} {total!r}")
+            lines.append(f"voicefirst_operation_seconds_count{{{label}}} {count}")
+        lines += _family(
+            "voicefirst_operation_errors_total",
+            "counter",
+            "Instrumented calls that raised an exception.",
+            "operation",
+            errors,
+        )
+        lines += [
+            "# HELP voicefirst_utterances_added_total Utterances added to sessions.",
+            "# TYPE voicefirst_utterances_added_total counter",
+            f"voicefirst_utterances_added_total {utterances}",
+        ]
+        lines += _family(
+            "voicefirst_sessions",
+            "gauge",
+            "Sessions by lifecycle state.",
+            "state",
+            states,
+        )
+        lines += _family(
+            "voicefirst_routes_total",
+            "counter",
+            "Utterances routed, by handler.",
+            "handler",
+            routes,
+        )
+        return "\n".join(lines) + "\n"
+
+    def _timed(
+        self,
+        operation: str,
+        method: Callable[_P, _T],
+        after: Callable[[_T], None] | None = None,
+    ) -> Callable[_P, _T]:
+        """Wrap *method* so each call is timed under *operation*.
+
+        ``after`` is called with the result of each successful call while
+        the lock is held, to update the operation's other metrics.
+        """
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = _Histogram(len(self._bounds))
+        counts = histogram.counts
+        bounds = self._bounds_ns
+        lock = self._lock
+        clock = time.perf_counter_ns
+        bucket = bisect.bisect_left
+
+        @functools.wraps(method)
+        def timed(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+            began = clock()
+            try:
+                result = method(*args, **kwargs)
+            except BaseException as exc:
+                self._failed(operation, histogram, began, exc)
+                raise
+            elapsed = clock() - began
+            with lock:
+                counts[bucket(bounds, elapsed)] += 1
+                histogram.count += 1
+                histogram.total_ns += elapsed
+                if after is not None:
+                    after(result)
+            if self._hooks:
+                self._notify(operation, began, elapsed, None)
+            return result
+
+        return timed
+
+    def _failed(
+        self, operation: str, histogram: _Histogram, began: int, error: BaseException
+    ) -> None:
+        elapsed = time.perf_counter_ns() - began
+        with self._lock:
+            histogram.counts[bisect.bisect_left(self._bounds_ns, elapsed)] += 1
+            histogram.count += 1
+            histogram.total_ns += elapsed
+            self._errors[operation] = self._errors.get(operation, 0) + 1
+        if self._hooks:
+            self._notify(operation, began, elapsed, error)
+
+    def _notify(
+        self, operation: str, began: int, elapsed: int, error: BaseException | None
+    ) -> None:
+        observation = Observation(operation, began + self._epoch_offset, elapsed, error)
+        for hook in self._hooks:
+            hook(observation)
+
+    def _instrument_create_session(
+        self, method: Callable[_P, VoiceSession]
+    ) -> Callable[_P, VoiceSession]:
+        def created(session: VoiceSession) -> None:
+            self._move(None, session.state)
+
+        return self._timed("create_session", method, created)
+
+    def _instrument_add_utterance(
+        self, method: Callable[_P, None]
+    ) -> Callable[_P, None]:
+        def added(_: None) -> None:
+            self._utterances += 1
+
+        return self._timed("add_utterance", method, added)
+
+    def _instrument_add_utterances(
+        self, method: Callable[_P, list[Utterance]]
+    ) -> Callable[_P, list[Utterance]]:
+        def added(batch: list[Utterance]) -> None:
+            self._utterances += len(batch)
+
+        return self._timed("add_utterances", method, added)
+
+    def _instrument_route(self, method: Callable[_P, str]) -> Callable[_P, str]:
+        def routed(handler: str) -> None:
+            self._routes[handler] = self._routes.get(handler, 0) + 1
+
+        return self._timed("route", method, routed)
+
+    def _instrument_route_many(
+        self, method: Callable[_P, dict[str, list[int]]]
+    ) -> Callable[_P, dict[str, list[int]]]:
+        def routed(groups: dict[str, list[int]]) -> None:
+            for handler, indices in groups.items():
+                self._routes[handler] = self._routes.get(handler, 0) + len(indices)
+
+        return self._timed("route_many", method, routed)
+
+    def _state_changed(self, previous: SessionState, state: SessionState) -> None:
+        with self._lock:
+            self._move(previous, state)
+
+    def _discarded(self, session: VoiceSession) -> None:
+        with self._lock:
+            self._states[session.state] = self._states.get(session.state, 0) - 1
+
+    def _move(self, previous: str | None, state: str) -> None:
+        if previous == state:
+            return
+        if previous is not None:
+            self._states[previous] = self._states.get(previous, 0) - 1
+        self._states[state] = self._states.get(state, 0) + 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _family(
+    name: str, kind: str, help_text: str, label: str, values: dict[str, int]
+) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for key, value in sorted(values.items()):
+        lines.append(f'{name}{{{label}="{_escape(key)}"}} {value}')
+    return lines
@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, MutableSequence
 from enum import Enum
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal, SupportsIndex, overload
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsRichComparison
+
+    from aumai_voicefirst.index import UtteranceIndex
 
 __all__ = [
     "AudioFormat",
+    "SessionState",
     "VoiceConfig",
     "Utterance",
+    "UtteranceList",
     "VoiceSession",
     "TextToSpeechConfig",
 ]
 
 
+SessionState = Literal["active", "paused", "completed", "error"]
+"""Lifecycle states of a VoiceSession."""
+
+
 class AudioFormat(str, Enum):
     """Supported audio container formats."""
 
@@ -44,13 +63,123 @@ class Utterance(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
 
 
+class UtteranceList(list[Utterance]):
+    """List of utterances that counts in-place rewrites.
+
+    ``generation`` increases whenever an existing item is replaced, removed
+    or moved; appending leaves it unchanged. A cache derived from the first
+    ``n`` items therefore stays valid while the generation it recorded
+    matches and the list holds at least ``n`` items.
+    """
+
+    __slots__ = ("_generation",)
+
+    def __init__(self, utterances: Iterable[Utterance] = ()) -> None:
+        super().__init__(utterances)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of in-place rewrites so far."""
+        return self._generation
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, value: Utterance) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Utterance]) -> None: ...
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:
+        self._generation += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        self._generation += 1
+        super().__delitem__(index)
+
+    def __imul__(self, count: SupportsIndex) -> UtteranceList:
+        self._generation += 1
+        return super().__imul__(count)
+
+    def insert(self, index: SupportsIndex, value: Utterance) -> None:
+        """Insert *value* before *index*; inserting at the end is an append."""
+        if index.__index__() < len(self):
+            self._generation += 1
+        super().insert(index, value)
+
+    def pop(self, index: SupportsIndex = -1) -> Utterance:
+        """Remove and return the item at *index*."""
+        self._generation += 1
+        return super().pop(index)
+
+    def remove(self, value: Utterance) -> None:
+        """Remove the first item equal to *value*."""
+        self._generation += 1
+        super().remove(value)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._generation += 1
+        super().clear()
+
+    def reverse(self) -> None:
+        """Reverse the list in place."""
+        self._generation += 1
+        super().reverse()
+
+    def sort(
+        self,
+        *,
+        key: Callable[[Utterance], SupportsRichComparison] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        """Sort the list in place, as list.sort."""
+        self._generation += 1
+        super().sort(key=key, reverse=reverse)
+
+
+_TranscriptSnapshot = tuple[MutableSequence[Utterance], int, int, str]
+
+
 class VoiceSession(BaseModel):
     """An active or completed voice interaction session."""
 
     session_id: str
     config: VoiceConfig
-    utterances: list[Utterance] = Field(default_factory=list)
-    state: Literal["active", "paused", "completed", "error"] = "active"
+    utterances: MutableSequence[Utterance] = Field(default_factory=UtteranceList)
+    state: SessionState = "active"
+
+    # Transcript snapshot maintained by VoiceSessionManager: (source sequence,
+    # its generation, count, joined text of its first ``count`` utterances).
+    # Replaced as a whole, never mutated, so readers can use it without
+    # locking.
+    _transcript: _TranscriptSnapshot | None = PrivateAttr(default=None)
+    # Time-range index built on first query and kept current by add_utterance,
+    # with the sequence and generation it reflects.
+    _index: UtteranceIndex | None = PrivateAttr(default=None)
+    _index_source: MutableSequence[Utterance] | None = PrivateAttr(default=None)
+    _index_generation: int | None = PrivateAttr(default=None)
+
+    @field_validator("utterances", mode="after")
+    @classmethod
+    def _track_utterances(
+        cls, utterances: MutableSequence[Utterance]
+    ) -> MutableSequence[Utterance]:
+        # Validated lists count their rewrites so derived caches stay correct.
+        if type(utterances) is list:
+            return UtteranceList(utterances)
+        return utterances
+
+    @field_serializer("utterances", mode="wrap")
+    def _serialize_utterances(
+        self,
+        utterances: MutableSequence[Utterance],
+        handler: SerializerFunctionWrapHandler,
+    ) -> object:
+        # Columnar stores serialize exactly like the equivalent list.
+        if not isinstance(utterances, list):
+            utterances = list(utterances)
+        return handler(utterances)
 
 
 class TextToSpeechConfig(BaseModel):
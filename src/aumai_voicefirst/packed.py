@@ -0,0 +1,243 @@
+"""Compact binary session serialization for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from aumai_voicefirst.models import SessionState, VoiceConfig, VoiceSession
+from aumai_voicefirst.store import StoreColumns, UtteranceStore
+
+__all__ = ["MAGIC", "PackedSession", "is_packed", "pack_session"]
+
+MAGIC = b"AVFSESS\0"
+"""First bytes of every packed session; JSON sessions never start with them."""
+
+_VERSION = 1
+# magic, version, flags, metadata bytes, utterances, languages, text bytes
+_HEADER = struct.Struct("<8sHHIIIQ")
+_LANGUAGE_LENGTH = struct.Struct("<H")
+# Column layout after the language table, padded to 8 bytes: start_ms,
+# end_ms and confidence doubles, n + 1 text offsets, language ids, text.
+# Each entry is (array typecode, extra items beyond one per utterance).
+_COLUMNS = (("d", 0), ("d", 0), ("d", 0), ("Q", 1), ("H", 0))
+_STARTS, _ENDS, _CONFIDENCES, _OFFSETS, _LANGUAGE_IDS = range(len(_COLUMNS))
+_SWAP = sys.byteorder != "little"
+
+
+def is_packed(data: bytes | bytearray | memoryview) -> bool:
+    """Return True if *data* starts with the packed session header."""
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def pack_session(session: VoiceSession) -> bytes:
+    """Serialize a session to the packed binary format.
+
+    Utterances keep their stored order. A session whose utterances already
+    live in an UtteranceStore is packed straight from its columns.
+
+    Args:
+        session: The VoiceSession to serialize.
+
+    Returns:
+        The packed session.
+
+    Raises:
+        ValueError: If the session uses more than 65536 language tags.
+    """
+    utterances = session.utterances
+    store = (
+        utterances
+        if isinstance(utterances, UtteranceStore)
+        else UtteranceStore(utterances)
+    )
+    columns = store.columns()
+    metadata = json.dumps(
+        {
+            "session_id": session.session_id,
+            "config": session.config.model_dump(mode="json"),
+            "state": session.state,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    languages = bytearray()
+    for language in columns.languages:
+        encoded = language.encode("utf-8")
+        languages += _LANGUAGE_LENGTH.pack(len(encoded)) + encoded
+    parts = [
+        _HEADER.pack(
+            MAGIC,
+            _VERSION,
+            0,
+            len(metadata),
+            len(store),
+            len(columns.languages),
+            len(columns.text),
+        ),
+        metadata,
+        bytes(languages),
+    ]
+    parts.append(bytes(-(_HEADER.size + len(metadata) + len(languages)) % 8))
+    for column in (
+        columns.starts,
+        columns.ends,
+        columns.confidences,
+        columns.offsets,
+        columns.language_ids,
+    ):
+        if _SWAP:
+            column = array(column.typecode, column)
+            column.byteswap()
+        parts.append(column.tobytes())
+    parts.append(bytes(columns.text))
+    return b"".join(parts)
+
+
+class PackedSession:
+    """Lazily decoded view of a packed session.
+
+    Only the header, the metadata record and the language table are parsed
+    up front, so reading a session's ID, config, state or utterance count costs the
+    same however many utterances it holds. ``transcript`` reads the text and
+    timing columns without building any Utterance, and ``to_session``
+    returns a VoiceSession whose utterances are an UtteranceStore filled by
+    bulk copies of the columns; Utterance objects are only built when that
+    store is indexed.
+
+    Packed data is trusted: utterances are not validated again on load.
+
+    Args:
+        data: The packed session, e.g. the bytes of a file.
+
+    Raises:
+        ValueError: If the data is not a packed session of a supported
+            version, or it is truncated or its metadata is malformed.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        view = memoryview(data).cast("B")
+        if len(view) < _HEADER.size or not is_packed(view):
+            raise ValueError("Data is not a packed voice session.")
+        _, version, _, metadata_size, count, language_count, text_size = (
+            _HEADER.unpack_from(view)
+        )
+        if version != _VERSION:
+            raise ValueError(f"Unsupported packed session version {version}.")
+        position = _HEADER.size + metadata_size
+        if position > len(view):
+            raise ValueError("Packed session is truncated.")
+        try:
+            metadata = json.loads(bytes(view[_HEADER.size : position]))
+            session_id: str = metadata["session_id"]
+            config = VoiceConfig.model_validate(metadata["config"])
+            state: SessionState = metadata["state"]
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Packed session metadata is malformed.") from exc
+        languages: list[str] = []
+        for _ in range(language_count):
+            if position + _LANGUAGE_LENGTH.size > len(view):
+                raise ValueError("Packed session is truncated.")
+            (size,) = _LANGUAGE_LENGTH.unpack_from(view, position)
+            position += _LANGUAGE_LENGTH.size
+            languages.append(str(view[position : position + size], "utf-8"))
+            position += size
+        position += -position % 8
+        # Byte offset of each column, then of the text blob.
+        self._sections: list[int] = []
+        for typecode, extra in _COLUMNS:
+            self._sections.append(position)
+            position += (count + extra) * struct.calcsize(typecode)
+        self._sections.append(position)
+        if position + text_size > len(view):
+            raise ValueError("Packed session is truncated.")
+
+        self._view = view
+        self._count: int = count
+        self._text_size: int = text_size
+        self._languages = languages
+        self._session_id = session_id
+        self._config = config
+        self._state = state
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str]) -> PackedSession:
+        """Read a packed session file."""
+        return cls(Path(path).read_bytes())
+
+    def __len__(self) -> int:
+        """Number of utterances in the session."""
+        return self._count
+
+    @property
+    def session_id(self) -> str:
+        """The session identifier."""
+        return self._session_id
+
+    @property
+    def config(self) -> VoiceConfig:
+        """The session configuration."""
+        return self._config
+
+    @property
+    def state(self) -> SessionState:
+        """The session lifecycle state."""
+        return self._state
+
+    @property
+    def languages(self) -> list[str]:
+        """The distinct language tags used by the utterances."""
+        return list(self._languages)
+
+    def transcript(self) -> str:
+        """Return the transcript exactly as VoiceSessionManager.get_transcript would.
+
+        Utterance texts are joined with newlines in start_ms order, keeping
+        stored order among equal start times. No Utterance is built.
+        """
+        starts = self._column(_STARTS)
+        offsets = self._column(_OFFSETS)
+        text = self._text()
+        order: Iterable[int] = range(self._count)
+        if any(starts[i] < starts[i - 1] for i in range(1, self._count)):
+            order = sorted(order, key=starts.__getitem__)
+        return "\n".join(str(text[offsets[i] : offsets[i + 1]], "utf-8") for i in order)
+
+    def utterances(self) -> UtteranceStore:
+        """Return the utterances as an UtteranceStore, in stored order."""
+        return UtteranceStore.from_columns(
+            StoreColumns(
+                self._column(_STARTS),
+                self._column(_ENDS),
+                self._column(_CONFIDENCES),
+                self._column(_OFFSETS),
+                self._column(_LANGUAGE_IDS),
+                self._languages,
+                self._text(),
+            )
+        )
+
+    def to_session(self) -> VoiceSession:
+        """Decode the full VoiceSession, backed by an UtteranceStore."""
+        session = VoiceSession(
+            session_id=self._session_id, config=self._config, state=self._state
+        )
+        session.utterances = self.utterances()
+        return session
+
+    def _column(self, index: int) -> array[Any]:
+        typecode, _ = _COLUMNS[index]
+        column = array(typecode)
+        column.frombytes(self._view[self._sections[index] : self._sections[index + 1]])
+        if _SWAP:
+            column.byteswap()
+        return column
+
+    def _text(self) -> memoryview:
+        start = self._sections[-1]
+        return self._view[start : start + self._text_size]
@@ -0,0 +1,209 @@
+"""PCM sample conversion and channel downmix for aumai-voicefirst."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "aumai_voicefirst.pcm requires NumPy; install aumai-voicefirst[audio]."
+    ) from exc
+
+if TYPE_CHECKING:
+    from aumai_voicefirst.wav import WavReader
+
+__all__ = ["PcmConverter", "downmix", "pcm_to_float32"]
+
+_S = TypeVar("_S", bound="np.generic")
+_Bytes = bytes | bytearray | memoryview
+
+# Little-endian WAV sample layouts that NumPy can view directly.
+_DTYPES: dict[int, np.dtype[Any]] = {
+    1: np.dtype("u1"),
+    2: np.dtype("<i2"),
+    4: np.dtype("<i4"),
+}
+_SCALES = {1: 1.0 / 128, 2: 1.0 / 32768, 3: 1.0 / 2**31, 4: 1.0 / 2**31}
+
+
+def pcm_to_float32(
+    data: _Bytes,
+    sample_width: int,
+    *,
+    is_float: bool = False,
+    out: npt.NDArray[np.float32] | None = None,
+    scratch: npt.NDArray[np.int32] | None = None,
+) -> npt.NDArray[np.float32]:
+    """Convert little-endian PCM bytes to float32 samples in [-1, 1).
+
+    The input is read through a NumPy view without copying and the result is
+    written straight into ``out``, so a caller that reuses its buffers makes
+    no allocation per call. 8-bit PCM is unsigned, as in WAV files.
+
+    Args:
+        data: Raw interleaved samples, e.g. a WavReader frame.
+        sample_width: Bytes per sample: 1, 2, 3 or 4.
+        is_float: The samples are IEEE float32 rather than integers.
+        out: Destination with room for every sample; allocated if omitted.
+        scratch: int32 work buffer for 24-bit input, at least as long as the
+            sample count; allocated if omitted.
+
+    Returns:
+        The converted samples: a view of ``out`` when it is given.
+
+    Raises:
+        ValueError: For an unsupported sample width, a length that is not a
+            whole number of samples, or a buffer that is too small.
+    """
+    raw = memoryview(data).cast("B")
+    if is_float:
+        if sample_width != 4:
+            raise ValueError("Only 32-bit float samples are supported.")
+    elif sample_width not in _SCALES:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+    if len(raw) % sample_width:
+        raise ValueError("Data is not a whole number of samples.")
+    count = len(raw) // sample_width
+    target = _buffer(out, count, np.float32)
+
+    if is_float:
+        np.copyto(target, np.frombuffer(raw, dtype="<f4"))
+        return target
+    if sample_width == 3:
+        # Place each 3-byte sample in the top bytes of an int32 so the sign
+        # carries over, then scale by 2**-31.
+        work = _buffer(scratch, count, np.int32)
+        lanes = work.view(np.uint8).reshape(count, 4)
+        lanes[:, 0] = 0
+        lanes[:, 1:] = np.frombuffer(raw, dtype=np.uint8).reshape(count, 3)
+        samples: npt.NDArray[Any] = work
+    else:
+        samples = np.frombuffer(raw, dtype=_DTYPES[sample_width])
+    # Cast first and scale in place: a mixed-dtype ufunc would allocate a
+    # casting buffer on every call.
+    np.copyto(target, samples, casting="unsafe")
+    if sample_width == 1:
+        target -= np.float32(128)
+    target *= np.float32(_SCALES[sample_width])
+    return target
+
+
+def downmix(
+    samples: npt.NDArray[np.float32],
+    channels: int,
+    *,
+    out: npt.NDArray[np.float32] | None = None,
+) -> npt.NDArray[np.float32]:
+    """Average interleaved channels into mono.
+
+    Args:
+        samples: Interleaved float32 samples.
+        channels: Number of interleaved channels.
+        out: Destination with room for ``len(samples) // channels`` samples;
+            allocated if omitted. Must not overlap ``samples``.
+
+    Returns:
+        The mono samples: a view of ``out`` when it is given, or ``samples``
+        itself for mono input.
+
+    Raises:
+        ValueError: If the length is not a multiple of channels.
+    """
+    if channels < 1 or len(samples) % channels:
+        raise ValueError("Sample count is not a multiple of the channel count.")
+    if channels == 1:
+        return samples
+    count = len(samples) // channels
+    target = _buffer(out, count, np.float32)
+    frames = samples.reshape(count, channels)
+    np.add(frames[:, 0], frames[:, 1], out=target)
+    for channel in range(2, channels):
+        target += frames[:, channel]
+    target *= np.float32(1.0 / channels)
+    return target
+
+
+class PcmConverter:
+    """Turns raw PCM frames into mono float32 using preallocated buffers.
+
+    Every call to ``convert`` writes into the same buffers and returns a view
+    of them, so a per-frame loop allocates nothing after the first frame.
+    The returned array is only valid until the next call; copy it to keep it.
+    Buffers grow when a larger frame arrives.
+
+    Args:
+        sample_width: Bytes per sample: 1, 2, 3 or 4.
+        channels: Number of interleaved channels.
+        is_float: The samples are IEEE float32.
+        frame_samples: Samples per channel to preallocate for.
+
+    Raises:
+        ValueError: For an unsupported sample width or channel count.
+    """
+
+    def __init__(
+        self,
+        sample_width: int,
+        channels: int = 1,
+        *,
+        is_float: bool = False,
+        frame_samples: int = 0,
+    ) -> None:
+        if (is_float and sample_width != 4) or sample_width not in _SCALES:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+        if channels < 1:
+            raise ValueError("channels must be at least 1.")
+        self._sample_width = sample_width
+        self._channels = channels
+        self._is_float = is_float
+        self._interleaved = np.empty(frame_samples * channels, dtype=np.float32)
+        self._mono = np.empty(frame_samples if channels > 1 else 0, dtype=np.float32)
+        self._scratch = np.empty(
+            frame_samples * channels if sample_width == 3 else 0, dtype=np.int32
+        )
+
+    @classmethod
+    def for_reader(cls, reader: WavReader) -> PcmConverter:
+        """Create a converter sized for a WavReader's frames."""
+        return cls(
+            reader.sample_width,
+            reader.channels,
+            is_float=reader.is_float,
+            frame_samples=reader.frame_bytes // (reader.sample_width * reader.channels),
+        )
+
+    def convert(self, frame: _Bytes) -> npt.NDArray[np.float32]:
+        """Convert one frame of raw interleaved PCM to mono float32."""
+        count = memoryview(frame).nbytes // self._sample_width
+        if count > len(self._interleaved):
+            self._interleaved = np.empty(count, dtype=np.float32)
+            if self._sample_width == 3:
+                self._scratch = np.empty(count, dtype=np.int32)
+        interleaved = pcm_to_float32(
+            frame,
+            self._sample_width,
+            is_float=self._is_float,
+            out=self._interleaved[:count],
+            scratch=self._scratch[:count] if self._sample_width == 3 else None,
+        )
+        if self._channels == 1:
+            return interleaved
+        mono_count = count // self._channels
+        if mono_count > len(self._mono):
+            self._mono = np.empty(mono_count, dtype=np.float32)
+        return downmix(interleaved, self._channels, out=self._mono[:mono_count])
+
+
+def _buffer(
+    buffer: npt.NDArray[_S] | None, count: int, dtype: type[_S]
+) -> npt.NDArray[_S]:
+    if buffer is None:
+        return np.empty(count, dtype=dtype)
+    if buffer.dtype != dtype or len(buffer) < count:
+        raise ValueError(
+            f"Buffer must be {np.dtype(dtype).name} with room for {count} samples."
+        )
+    return buffer[:count]
@@ -0,0 +1,322 @@
+"""Memory-bounded session registry for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+from urllib.parse import quote
+
+from pydantic import BaseModel
+
+from aumai_voicefirst.models import Utterance, VoiceSession
+from aumai_voicefirst.store import UtteranceStore
+
+__all__ = ["RegistryStats", "SessionRegistry"]
+
+# Rough resident sizes used for the max_bytes budget, measured with
+# tracemalloc on CPython 3.11: a session with its config and caches, one
+# list-held Utterance model excluding its text, and one UtteranceStore row.
+_SESSION_BYTES = 2048
+_UTTERANCE_BYTES = 950
+_STORE_ROW_BYTES = 42
+
+# States whose sessions may be discarded when there is nowhere to spill them.
+_FINISHED_STATES = frozenset({"completed", "error"})
+
+
+class RegistryStats(BaseModel):
+    """Point-in-time counters for a SessionRegistry."""
+
+    resident_sessions: int
+    spilled_sessions: int
+    resident_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    spills: int
+    reloads: int
+
+
+class SessionRegistry:
+    """Session table bounded by count, estimated bytes and idle time.
+
+    Resident sessions are kept in least-recently-used order. When a bound is
+    exceeded, or a session has been idle longer than ``idle_ttl`` seconds,
+    sessions are evicted from the cold end; demoted (completed) sessions are
+    always coldest. Evicted sessions are written to ``spill_directory`` and
+    reloaded transparently by ``get``; while a caller still holds an evicted
+    session, ``get`` returns that same object rather than a second copy.
+    Spill files left in the directory by an earlier process are removed on
+    construction, since durability is the storage backend's job. Without a
+    spill directory only
+    completed and errored sessions are evicted, and discarded; active and
+    paused sessions stay resident even past the bounds, which then cost a
+    scan over the live sessions at the cold end. The most recently used
+    session is never evicted.
+
+    All bounds default to ``None``, which makes the registry an unbounded
+    in-memory table.
+
+    Args:
+        max_sessions: Maximum number of resident sessions.
+        max_bytes: Maximum estimated bytes held by resident sessions.
+        idle_ttl: Seconds a session may go untouched before eviction.
+        spill_directory: Directory for evicted sessions.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int | None = None,
+        max_bytes: int | None = None,
+        idle_ttl: float | None = None,
+        spill_directory: str | os.PathLike[str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1.")
+        self._max_sessions = max_sessions
+        self._max_bytes = max_bytes
+        self._idle_ttl = idle_ttl
+        self._spill_directory = (
+            Path(spill_directory) if spill_directory is not None else None
+        )
+        if self._spill_directory is not None:
+            self._spill_directory.mkdir(parents=True, exist_ok=True)
+            for stale in self._spill_directory.glob("*.json"):
+                stale.unlink(missing_ok=True)
+            for stale in self._spill_directory.glob("*.tmp"):
+                stale.unlink(missing_ok=True)
+        self._clock = clock
+        # session_id -> (session, last access time, estimated bytes)
+        self._resident: OrderedDict[str, tuple[VoiceSession, float, int]] = (
+            OrderedDict()
+        )
+        self._spilled: set[str] = set()
+        # Spilled sessions still referenced outside the registry, so a reload
+        # hands back the caller's object instead of a diverging copy.
+        self._detached: weakref.WeakValueDictionary[str, VoiceSession] = (
+            weakref.WeakValueDictionary()
+        )
+        self._discard_listeners: tuple[Callable[[VoiceSession], None], ...] = ()
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._spills = 0
+        self._reloads = 0
+
+    def __len__(self) -> int:
+        return len(self._resident) + len(self._spilled)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._resident or session_id in self._spilled
+
+    def add(self, session: VoiceSession) -> None:
+        """Admit a session as the most recently used entry."""
+        self._admit(session, _estimate_bytes(session))
+        self._enforce_bounds()
+
+    def get(self, session_id: str) -> VoiceSession:
+        """Return a session, reloading it from the spill directory if needed.
+
+        Raises:
+            KeyError: If the session is neither resident nor spilled.
+        """
+        entry = self._resident.get(session_id)
+        if entry is not None:
+            self._hits += 1
+            session, _, size = entry
+            self._resident[session_id] = (session, self._clock(), size)
+            self._resident.move_to_end(session_id)
+            self._enforce_bounds()
+            return session
+
+        self._misses += 1
+        if session_id not in self._spilled:
+            raise KeyError(session_id)
+        detached = self._detached.get(session_id)
+        session = detached if detached is not None else self._read_spill(session_id)
+        self._reloads += 1
+        self._admit(session, _estimate_bytes(session))
+        self._enforce_bounds()
+        return session
+
+    def touch(self, session: VoiceSession, added: Sequence[Utterance] = ()) -> None:
+        """Mark a session as used and account for utterances added to it.
+
+        A spilled session touched through a caller-held reference is made
+        resident again so the caller's changes are not lost. Sessions the
+        registry does not know about, including copies of a registered
+        session, are ignored and never replace the registered object.
+
+        Args:
+            session: The session that was used.
+            added: Utterances just added to the session.
+        """
+        session_id = session.session_id
+        entry = self._resident.get(session_id)
+        if entry is None:
+            if self._detached.get(session_id) is session:
+                self._admit(session, _estimate_bytes(session))
+                self._enforce_bounds()
+            return
+        if entry[0] is not session:
+            return
+        compact = isinstance(session.utterances, UtteranceStore)
+        growth = sum(_utterance_bytes(u, compact) for u in added)
+        self._resident_bytes += growth
+        self._resident[session_id] = (session, self._clock(), entry[2] + growth)
+        self._resident.move_to_end(session_id)
+        self._enforce_bounds()
+
+    def demote(self, session_id: str) -> None:
+        """Treat a resident session as idle so it is the next to be evicted.
+
+        Used for completed sessions: with an idle_ttl they spill on the next
+        registry operation, otherwise they go before any live session.
+        """
+        entry = self._resident.get(session_id)
+        if entry is not None:
+            self._resident[session_id] = (entry[0], float("-inf"), entry[2])
+            self._resident.move_to_end(session_id, last=False)
+
+    def sweep(self) -> None:
+        """Evict idle sessions now instead of on the next registry operation."""
+        self._enforce_bounds()
+
+    def add_discard_listener(self, listener: Callable[[VoiceSession], None]) -> None:
+        """Call *listener* with each session evicted with nowhere to spill it."""
+        self._discard_listeners = (*self._discard_listeners, listener)
+
+    def sessions(self) -> Iterator[VoiceSession]:
+        """Yield every session, reading spilled ones without making them resident."""
+        for session, _, _ in list(self._resident.values()):
+            yield session
+        for session_id in sorted(self._spilled):
+            detached = self._detached.get(session_id)
+            if detached is None:
+                detached = self._read_spill(session_id, remove=False)
+                self._detached[session_id] = detached
+            yield detached
+
+    def stats(self) -> RegistryStats:
+        """Return a snapshot of the registry's size and counters."""
+        return RegistryStats(
+            resident_sessions=len(self._resident),
+            spilled_sessions=len(self._spilled),
+            resident_bytes=self._resident_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            spills=self._spills,
+            reloads=self._reloads,
+        )
+
+    def _admit(self, session: VoiceSession, size: int) -> None:
+        session_id = session.session_id
+        previous = self._resident.pop(session_id, None)
+        if previous is not None:
+            self._resident_bytes -= previous[2]
+        if session_id in self._spilled:
+            self._spilled.discard(session_id)
+            self._detached.pop(session_id, None)
+            self._spill_path(session_id).unlink(missing_ok=True)
+        self._resident[session_id] = (session, self._clock(), size)
+        self._resident_bytes += size
+
+    def _enforce_bounds(self) -> None:
+        resident = self._resident
+        if self._idle_ttl is not None:
+            deadline = self._clock() - self._idle_ttl
+            # Access order is also time order, so expired entries form a prefix.
+            expired = []
+            for session_id, (session, seen, _) in self._coldest():
+                if seen >= deadline:
+                    break
+                if self._evictable(session):
+                    expired.append(session_id)
+            for session_id in expired:
+                self._expirations += 1
+                self._evict(session_id)
+
+        while (
+            self._max_sessions is not None and len(resident) > self._max_sessions
+        ) or (self._max_bytes is not None and self._resident_bytes > self._max_bytes):
+            victim = next(
+                (
+                    session_id
+                    for session_id, (session, _, _) in self._coldest()
+                    if self._evictable(session)
+                ),
+                None,
+            )
+            if victim is None:
+                break
+            self._evict(victim)
+
+    def _coldest(self) -> Iterator[tuple[str, tuple[VoiceSession, float, int]]]:
+        """Yield resident entries from the cold end, leaving out the hottest."""
+        return islice(self._resident.items(), max(len(self._resident) - 1, 0))
+
+    def _evictable(self, session: VoiceSession) -> bool:
+        return self._spill_directory is not None or session.state in _FINISHED_STATES
+
+    def _evict(self, session_id: str) -> None:
+        session, _, size = self._resident.pop(session_id)
+        self._resident_bytes -= size
+        self._evictions += 1
+        if self._spill_directory is None:
+            for listener in self._discard_listeners:
+                listener(session)
+            return
+        compact = isinstance(session.utterances, UtteranceStore)
+        path = self._spill_path(session_id)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(
+            b'{"compact":%s,"session":%s}'
+            % (b"true" if compact else b"false", session.model_dump_json().encode())
+        )
+        os.replace(temporary, path)
+        self._spilled.add(session_id)
+        self._detached[session_id] = session
+        self._spills += 1
+
+    def _read_spill(self, session_id: str, *, remove: bool = True) -> VoiceSession:
+        path = self._spill_path(session_id)
+        entry = json.loads(path.read_bytes())
+        session = VoiceSession.model_validate(entry["session"])
+        if entry["compact"]:
+            session.utterances = UtteranceStore(session.utterances)
+        if remove:
+            self._spilled.discard(session_id)
+            path.unlink()
+        return session
+
+    def _spill_path(self, session_id: str) -> Path:
+        if self._spill_directory is None:
+            raise KeyError(session_id)
+        return self._spill_directory / f"{quote(session_id, safe='')}.json"
+
+
+def _estimate_bytes(session: VoiceSession) -> int:
+    utterances = session.utterances
+    if isinstance(utterances, UtteranceStore):
+        return _SESSION_BYTES + utterances.nbytes
+    return _SESSION_BYTES + sum(_utterance_bytes(u, False) for u in utterances)
+
+
+def _utterance_bytes(utterance: Utterance, compact: bool) -> int:
+    if compact:
+        return _STORE_ROW_BYTES + len(utterance.text)
+    return _UTTERANCE_BYTES + len(utterance.text)
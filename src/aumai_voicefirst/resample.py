@@ -0,0 +1,220 @@
+"""Polyphase sample-rate conversion for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import functools
+import math
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "aumai_voicefirst.resample requires NumPy; install aumai-voicefirst[audio]."
+    ) from exc
+
+from aumai_voicefirst.models import VoiceConfig
+
+__all__ = ["Resampler", "resample"]
+
+# Passband edge as a fraction of the lower Nyquist rate, and the Kaiser window
+# shape; together about 80 dB of stopband rejection at 32 taps per phase.
+_ROLLOFF = 0.94
+_KAISER_BETA = 8.0
+# Below this many outputs per phase, one vectorized gather beats a strided
+# matrix-vector product per phase.
+_MIN_ROWS_PER_PHASE = 8
+
+
+class _Kernel:
+    """Polyphase decomposition of one (src, dst, taps) lowpass filter."""
+
+    __slots__ = ("delay", "down", "phases", "up")
+
+    def __init__(
+        self, up: int, down: int, delay: int, phases: npt.NDArray[np.float32]
+    ) -> None:
+        self.up = up
+        self.down = down
+        self.delay = delay
+        # phases[r] holds the taps of phase r in reverse, so a window of input
+        # samples ending at the current position dots with it directly.
+        self.phases = phases
+
+
+@functools.lru_cache(maxsize=64)
+def _kernel(src_rate: int, dst_rate: int, taps: int) -> _Kernel:
+    divisor = math.gcd(src_rate, dst_rate)
+    up, down = dst_rate // divisor, src_rate // divisor
+    if up == down:
+        identity = np.ones((1, 1), dtype=np.float32)
+        identity.setflags(write=False)
+        return _Kernel(1, 1, 0, identity)
+    half = taps // 2
+    length = 2 * half * up + 1
+    cutoff = 0.5 * _ROLLOFF / max(up, down)
+    offsets = np.arange(length) - half * up
+    taps_ = (
+        2 * cutoff * np.sinc(2 * cutoff * offsets) * np.kaiser(length, _KAISER_BETA)
+    ) * up
+    width = -(-length // up)
+    padded = np.zeros(width * up)
+    padded[:length] = taps_
+    phases = np.ascontiguousarray(
+        padded.reshape(width, up).T[:, ::-1], dtype=np.float32
+    )
+    phases.setflags(write=False)
+    return _Kernel(up, down, half * up, phases)
+
+
+class Resampler:
+    """Streaming polyphase resampler for mono float audio.
+
+    The anti-aliasing filter is a Kaiser-windowed sinc split into one short
+    filter per output phase, so every output sample costs one dot product of
+    ``taps`` inputs regardless of the rate ratio. Equal rates pass samples
+    through unchanged. Filters are designed once
+    per (src_rate, dst_rate, taps) and shared by every Resampler, so opening
+    many streams at the same rates costs no design work.
+
+    ``process`` may be called with chunks of any size and carries the filter
+    history between them. It holds back the outputs whose filter window
+    reaches past the audio seen so far (``taps / 2`` input samples at most)
+    until more audio or ``flush`` arrives. The concatenated output of all
+    calls equals ``resample`` of the concatenated input.
+
+    Args:
+        src_rate: Input sample rate in Hz.
+        dst_rate: Output sample rate in Hz.
+        taps: Filter taps per phase; more taps sharpen the transition band.
+
+    Raises:
+        ValueError: If a rate is not positive or taps is below 2.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, *, taps: int = 32) -> None:
+        if src_rate < 1 or dst_rate < 1:
+            raise ValueError("Sample rates must be positive.")
+        if taps < 2:
+            raise ValueError("taps must be at least 2.")
+        self._src_rate = src_rate
+        self._dst_rate = dst_rate
+        self._kernel = _kernel(src_rate, dst_rate, taps)
+        self._width = self._kernel.phases.shape[1]
+        self._buffer: npt.NDArray[np.float32]
+        self._buffer_start = self._received = self._emitted = 0
+        self._reset()
+
+    @classmethod
+    def for_config(
+        cls, config: VoiceConfig, src_rate: int, *, taps: int = 32
+    ) -> Resampler:
+        """Create a resampler converting ``src_rate`` audio to a session's rate."""
+        return cls(src_rate, config.sample_rate, taps=taps)
+
+    @property
+    def src_rate(self) -> int:
+        """Input sample rate in Hz."""
+        return self._src_rate
+
+    @property
+    def dst_rate(self) -> int:
+        """Output sample rate in Hz."""
+        return self._dst_rate
+
+    def process(self, samples: npt.ArrayLike) -> npt.NDArray[np.float32]:
+        """Resample the next chunk of a stream.
+
+        Args:
+            samples: One-dimensional float samples.
+
+        Returns:
+            The output samples that are now fully determined.
+
+        Raises:
+            ValueError: If samples is not one-dimensional.
+        """
+        chunk = np.asarray(samples, dtype=np.float32)
+        if chunk.ndim != 1:
+            raise ValueError("samples must be one-dimensional.")
+        if chunk.size:
+            self._buffer = np.concatenate((self._buffer, chunk))
+            self._received += chunk.size
+        kernel = self._kernel
+        ready = (kernel.up * self._received - 1 - kernel.delay) // kernel.down + 1
+        return self._emit(ready)
+
+    def flush(self) -> npt.NDArray[np.float32]:
+        """End the stream and return the held-back output samples.
+
+        The resampler is reset afterwards and can start a new stream.
+        """
+        kernel = self._kernel
+        total = -(-self._received * kernel.up // kernel.down)
+        if total:
+            last_base = ((total - 1) * kernel.down + kernel.delay) // kernel.up
+            missing = last_base + 1 - (self._buffer_start + len(self._buffer))
+            if missing > 0:
+                self._buffer = np.concatenate(
+                    (self._buffer, np.zeros(missing, dtype=np.float32))
+                )
+        output = self._emit(total)
+        self._reset()
+        return output
+
+    def _reset(self) -> None:
+        # The buffer holds input from absolute index _buffer_start onward;
+        # samples before the stream starts are zeros.
+        self._buffer = np.zeros(self._width - 1, dtype=np.float32)
+        self._buffer_start = 1 - self._width
+        self._received = 0
+        self._emitted = 0
+
+    def _emit(self, end: int) -> npt.NDArray[np.float32]:
+        start = self._emitted
+        count = end - start
+        if count <= 0:
+            return np.empty(0, dtype=np.float32)
+        kernel = self._kernel
+        up, down, width = kernel.up, kernel.down, self._width
+        if count < up * _MIN_ROWS_PER_PHASE:
+            # Few outputs per phase: gather every window and its phase at once.
+            positions = np.arange(start, end) * down + kernel.delay
+            firsts = positions // up - (width - 1) - self._buffer_start
+            windows = self._buffer[firsts[:, None] + np.arange(width)]
+            output: npt.NDArray[np.float32] = np.einsum(
+                "ij,ij->i", windows, kernel.phases[positions % up], dtype=np.float32
+            )
+        else:
+            output = np.empty(count, dtype=np.float32)
+            strided = sliding_window_view(self._buffer, width)
+            # Outputs up apart share a phase and their windows lie down apart,
+            # so each phase is one strided matrix-vector product.
+            for offset in range(up):
+                position = (start + offset) * down + kernel.delay
+                first = position // up - (width - 1) - self._buffer_start
+                rows = -(-(count - offset) // up)
+                block = strided[first : first + (rows - 1) * down + 1 : down]
+                output[offset::up] = block @ kernel.phases[position % up]
+        self._emitted = end
+
+        next_base = (end * down + kernel.delay) // up
+        drop = next_base - (width - 1) - self._buffer_start
+        if drop > 0:
+            self._buffer = self._buffer[drop:].copy()
+            self._buffer_start += drop
+        return output
+
+
+def resample(
+    samples: npt.ArrayLike, src_rate: int, dst_rate: int, *, taps: int = 32
+) -> npt.NDArray[np.float32]:
+    """Resample a complete mono recording.
+
+    Returns ``ceil(len(samples) * dst_rate / src_rate)`` float32 samples,
+    time-aligned with the input.
+    """
+    resampler = Resampler(src_rate, dst_rate, taps=taps)
+    head = resampler.process(samples)
+    return np.concatenate((head, resampler.flush()))
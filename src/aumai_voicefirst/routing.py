@@ -0,0 +1,173 @@
+"""Language handler tables for aumai-voicefirst routing."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+__all__ = ["HandlerTable"]
+
+_DEFAULT_HANDLER = "handler.default"
+
+
+class _Node:
+    """One subtag position in a HandlerTable trie."""
+
+    __slots__ = ("children", "handler")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.handler: str | None = None
+
+
+class HandlerTable:
+    """Immutable mapping from BCP-47 language tags to handler IDs.
+
+    Routes are keyed by tag prefixes such as ``hi``, ``hi-IN`` or
+    ``zh-Hant-TW`` and stored in a trie of lowercased subtags, so resolving a
+    tag walks it once and picks the longest registered prefix in O(number of
+    subtags). Script routes (``Arab``, ``Deva``) apply to any language written
+    in that script and outrank prefix matches that stop before the tag's
+    script subtag; a prefix that spells out the script, like ``zh-Hant``,
+    still wins.
+
+    Tables never change after construction. ``with_routes`` and
+    ``without_routes`` return new tables, which lets a VoiceRouter swap
+    tables while other threads keep routing.
+
+    Args:
+        routes: Handler ID per tag prefix.
+        scripts: Handler ID per ISO 15924 script subtag.
+        default: Handler ID for tags no route matches.
+
+    Raises:
+        ValueError: If a tag prefix or script code is malformed.
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, str] | None = None,
+        *,
+        scripts: Mapping[str, str] | None = None,
+        default: str = _DEFAULT_HANDLER,
+    ) -> None:
+        self._root = _Node()
+        self._routes: dict[str, str] = {}
+        for tag, handler in (routes or {}).items():
+            subtags = _pattern_subtags(tag)
+            node = self._root
+            for subtag in subtags:
+                node = node.children.setdefault(subtag, _Node())
+            node.handler = handler
+            self._routes["-".join(subtags)] = handler
+        self._scripts: dict[str, str] = {}
+        for script, handler in (scripts or {}).items():
+            code = script.lower()
+            if len(code) != 4 or not code.isalpha():
+                raise ValueError(f"Invalid script subtag: {script!r}")
+            self._scripts[code] = handler
+        self._default = default
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str]) -> HandlerTable:
+        """Load a table from a JSON file.
+
+        The file holds an object with a ``routes`` mapping and optional
+        ``scripts`` mapping and ``default`` handler ID.
+
+        Raises:
+            ValueError: If the file is not a valid handler table.
+        """
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            return cls(
+                data.get("routes", {}),
+                scripts=data.get("scripts", {}),
+                default=data.get("default", _DEFAULT_HANDLER),
+            )
+        except (AttributeError, json.JSONDecodeError) as exc:
+            raise ValueError(f"Invalid handler table file {path}: {exc}") from exc
+
+    @property
+    def routes(self) -> dict[str, str]:
+        """A copy of the tag prefix routes, keyed by normalized tag."""
+        return dict(self._routes)
+
+    @property
+    def scripts(self) -> dict[str, str]:
+        """A copy of the script routes, keyed by lowercased script code."""
+        return dict(self._scripts)
+
+    @property
+    def default(self) -> str:
+        """Handler ID returned when no route matches."""
+        return self._default
+
+    def with_routes(
+        self,
+        routes: Mapping[str, str] | None = None,
+        *,
+        scripts: Mapping[str, str] | None = None,
+    ) -> HandlerTable:
+        """Return a new table with routes added or replaced."""
+        return HandlerTable(
+            {**self._routes, **(routes or {})},
+            scripts={**self._scripts, **(scripts or {})},
+            default=self._default,
+        )
+
+    def without_routes(self, tags: Iterable[str]) -> HandlerTable:
+        """Return a new table without the given tag prefix routes.
+
+        Raises:
+            KeyError: If a tag has no route in this table.
+        """
+        routes = dict(self._routes)
+        for tag in tags:
+            del routes["-".join(_pattern_subtags(tag))]
+        return HandlerTable(routes, scripts=self._scripts, default=self._default)
+
+    def resolve(self, tag: str) -> str:
+        """Return the handler ID for a BCP-47 language tag.
+
+        Matching is case-insensitive and accepts ``_`` as a separator.
+        Extension and private-use subtags (after a singleton such as ``-u-``
+        or ``-x-``) never match.
+        """
+        subtags = _subtags(tag)
+        node = self._root
+        handler = self._default
+        depth = 0
+        for position, subtag in enumerate(subtags, 1):
+            child = node.children.get(subtag)
+            if child is None:
+                break
+            node = child
+            if node.handler is not None:
+                handler, depth = node.handler, position
+        if self._scripts:
+            for position in range(1, len(subtags)):
+                subtag = subtags[position]
+                if len(subtag) == 4 and subtag.isalpha():
+                    if depth <= position and subtag in self._scripts:
+                        return self._scripts[subtag]
+                    break
+        return handler
+
+
+def _subtags(tag: str) -> list[str]:
+    """Split a tag into lowercased subtags, dropping extensions."""
+    subtags = tag.lower().replace("_", "-").split("-")
+    for position in range(1, len(subtags)):
+        if len(subtags[position]) == 1:
+            return subtags[:position]
+    return subtags
+
+
+def _pattern_subtags(tag: str) -> list[str]:
+    subtags = tag.lower().replace("_", "-").split("-")
+    if not all(subtag.isalnum() for subtag in subtags):
+        raise ValueError(f"Invalid language tag prefix: {tag!r}")
+    return subtags
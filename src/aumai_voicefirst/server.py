@@ -0,0 +1,401 @@
+"""Local HTTP API keeping a session manager resident for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import stat
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from pydantic import TypeAdapter
+
+from aumai_voicefirst.async_manager import AsyncVoiceSessionManager
+from aumai_voicefirst.core import VoiceRouter
+from aumai_voicefirst.metrics import CONTENT_TYPE, Metrics
+from aumai_voicefirst.models import SessionState, Utterance, VoiceConfig, VoiceSession
+
+__all__ = ["SessionServer"]
+
+_JSON = "application/json"
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Content Too Large",
+    415: "Unsupported Media Type",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+# Most header lines read per request before the connection is refused.
+_MAX_HEADERS = 100
+_LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+_utterances: TypeAdapter[list[Utterance]] = TypeAdapter(list[Utterance])
+_state: TypeAdapter[SessionState] = TypeAdapter(SessionState)
+
+
+class _Response:
+    """Status, payload and content type of one API response."""
+
+    __slots__ = ("content_type", "payload", "status")
+
+    def __init__(self, status: int, payload: object, content_type: str = _JSON) -> None:
+        self.status = status
+        self.payload = payload
+        self.content_type = content_type
+
+    def encode(self, keep_alive: bool) -> bytes:
+        if self.content_type == _JSON:
+            body = json.dumps(self.payload, ensure_ascii=False).encode("utf-8")
+        else:
+            body = str(self.payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {self.status} {_REASONS[self.status]}\r\n"
+            f"Content-Type: {self.content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+
+class _HTTPError(Exception):
+    """Request failure mapped to an HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class SessionServer:
+    """JSON-over-HTTP front end for a resident session manager.
+
+    Serves HTTP/1.1 with keep-alive on a localhost TCP port or a Unix
+    socket, so thin clients (``curl --unix-socket``, a shell script, another
+    service) reuse one warm process and its sessions instead of starting
+    Python per call. Every connection is handled by its own task; requests
+    touching one session are serialized by the AsyncVoiceSessionManager and
+    never wait on other sessions.
+
+    Endpoints, all taking and returning JSON:
+
+    * ``POST /sessions``: create a session from VoiceConfig fields, plus an
+      optional ``compact`` flag.
+    * ``GET /sessions/{id}``: session ID, state, config and utterance count.
+    * ``POST /sessions/{id}/utterances``: add ``{"utterances": [...]}`` in
+      one batch.
+    * ``GET /sessions/{id}/transcript``: the transcript.
+    * ``POST /sessions/{id}/state``: set ``{"state": ...}``.
+    * ``POST /route``: handler IDs for ``{"utterances": [...]}``.
+    * ``POST /batch``: run ``{"requests": [{"method", "path", "body"}]}`` in
+      order, returning ``{"responses": [{"status", "body"}]}``.
+    * ``GET /metrics``: Prometheus text exposition, when metrics are given.
+
+    Errors are answered with ``{"error": message}`` and status 400 for
+    invalid input, 404 for unknown sessions or paths, 405 for a wrong
+    method and 413 for an oversized body.
+
+    Over TCP, a request whose ``Host`` header is not a loopback name or
+    the address it arrived on, with the listening port, is refused with
+    403, so a web page cannot reach the API through DNS rebinding. A POST
+    without ``Content-Type: application/json`` is refused with 415, which
+    keeps browsers from sending one cross-site without a CORS preflight.
+    More than 100 header lines are refused with 431.
+
+    Args:
+        manager: The manager hosting the sessions. Defaults to a new
+            in-memory manager.
+        router: Router for ``/route``. Defaults to a new VoiceRouter.
+        metrics: Metrics exposed on ``/metrics``; the endpoint is absent
+            when None.
+        max_body: Largest accepted request body in bytes.
+    """
+
+    def __init__(
+        self,
+        manager: AsyncVoiceSessionManager | None = None,
+        *,
+        router: VoiceRouter | None = None,
+        metrics: Metrics | None = None,
+        max_body: int = 16 << 20,
+    ) -> None:
+        self._manager = manager if manager is not None else AsyncVoiceSessionManager()
+        self._router = router if router is not None else VoiceRouter()
+        self._metrics = metrics
+        self._max_body = max_body
+
+    @property
+    def manager(self) -> AsyncVoiceSessionManager:
+        """The manager hosting the sessions."""
+        return self._manager
+
+    async def start_tcp(self, port: int, host: str = "127.0.0.1") -> asyncio.Server:
+        """Start listening on a TCP port; pass 0 for any free port."""
+        return await asyncio.start_server(self._connection, host, port)
+
+    async def start_unix(self, path: str | os.PathLike[str]) -> asyncio.Server:
+        """Start listening on a Unix socket, replacing a stale socket file.
+
+        Raises:
+            FileExistsError: If *path* exists and is not a socket.
+        """
+        socket_path = Path(path)
+        with contextlib.suppress(FileNotFoundError):
+            if not stat.S_ISSOCK(socket_path.lstat().st_mode):
+                raise FileExistsError(f"{socket_path} exists and is not a socket.")
+            socket_path.unlink()
+        return await asyncio.start_unix_server(self._connection, socket_path)
+
+    async def serve(
+        self,
+        *,
+        port: int | None = None,
+        socket_path: str | os.PathLike[str] | None = None,
+        ready: Callable[[str], object] | None = None,
+    ) -> None:
+        """Serve until cancelled or sent SIGINT or SIGTERM, then close the manager.
+
+        Args:
+            port: Localhost TCP port; used when socket_path is None.
+            socket_path: Unix socket to listen on instead of a port.
+            ready: Called with the listening address once accepting.
+        """
+        if socket_path is not None:
+            server = await self.start_unix(socket_path)
+            address = f"unix:{socket_path}"
+        else:
+            server = await self.start_tcp(port if port is not None else 8765)
+            host, bound = server.sockets[0].getsockname()[:2]
+            address = f"http://{host}:{bound}"
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError, RuntimeError):
+                if task is not None:
+                    loop.add_signal_handler(signum, task.cancel)
+        try:
+            async with server:
+                if ready is not None:
+                    ready(address)
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                with contextlib.suppress(NotImplementedError, RuntimeError):
+                    loop.remove_signal_handler(signum)
+            if socket_path is not None:
+                Path(socket_path).unlink(missing_ok=True)
+            await self._manager.close()
+
+    async def handle(self, method: str, path: str, body: object = None) -> _Response:
+        """Answer one API request given its method, path and decoded body."""
+        try:
+            return await self._route(method.upper(), path, body)
+        except _HTTPError as exc:
+            return _Response(exc.status, {"error": str(exc)})
+        except ValueError as exc:
+            return _Response(400, {"error": str(exc)})
+        except Exception as exc:
+            # Keep the connection, and the other requests of a batch, alive.
+            return _Response(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+    async def _route(self, method: str, path: str, body: object) -> _Response:
+        parts = [unquote(part) for part in urlsplit(path).path.strip("/").split("/")]
+        call: Callable[[], Awaitable[_Response]]
+        match parts:
+            case ["sessions"]:
+                allowed, call = "POST", lambda: self._create(body)
+            case ["sessions", session_id]:
+                allowed, call = "GET", lambda: self._describe(session_id)
+            case ["sessions", session_id, "utterances"]:
+                allowed, call = "POST", lambda: self._add(session_id, body)
+            case ["sessions", session_id, "transcript"]:
+                allowed, call = "GET", lambda: self._transcript(session_id)
+            case ["sessions", session_id, "state"]:
+                allowed, call = "POST", lambda: self._set_state(session_id, body)
+            case ["route"]:
+                allowed, call = "POST", lambda: self._route_utterances(body)
+            case ["batch"]:
+                allowed, call = "POST", lambda: self._batch(body)
+            case ["metrics"] if self._metrics is not None:
+                allowed, call = "GET", self._metrics_text
+            case _:
+                raise _HTTPError(404, f"No endpoint at {path}.")
+        if method != allowed:
+            raise _HTTPError(405, f"{method} is not allowed on {path}.")
+        return await call()
+
+    async def _create(self, body: object) -> _Response:
+        fields = dict(_object(body))
+        compact = bool(fields.pop("compact", False))
+        config = VoiceConfig.model_validate(fields)
+        session = await self._manager.create_session(config, compact=compact)
+        return _Response(201, {"session_id": session.session_id})
+
+    async def _describe(self, session_id: str) -> _Response:
+        session = await self._session(session_id)
+        return _Response(
+            200,
+            {
+                "session_id": session.session_id,
+                "state": session.state,
+                "config": session.config.model_dump(mode="json"),
+                "utterances": len(session.utterances),
+            },
+        )
+
+    async def _add(self, session_id: str, body: object) -> _Response:
+        records = _object(body).get("utterances")
+        if not isinstance(records, list):
+            raise _HTTPError(400, "Body must hold an 'utterances' list.")
+        session = await self._session(session_id)
+        added = await self._manager.add_utterances(session, records)
+        return _Response(
+            200, {"added": len(added), "utterances": len(session.utterances)}
+        )
+
+    async def _transcript(self, session_id: str) -> _Response:
+        session = await self._session(session_id)
+        return _Response(
+            200, {"transcript": await self._manager.get_transcript(session)}
+        )
+
+    async def _set_state(self, session_id: str, body: object) -> _Response:
+        state = _state.validate_python(_object(body).get("state"))
+        session = await self._session(session_id)
+        await self._manager.set_state(session, state)
+        return _Response(200, {"state": session.state})
+
+    async def _route_utterances(self, body: object) -> _Response:
+        utterances = _utterances.validate_python(_object(body).get("utterances"))
+        handlers: list[str] = [""] * len(utterances)
+        for handler_id, indices in self._router.route_many(utterances).items():
+            for index in indices:
+                handlers[index] = handler_id
+        return _Response(200, {"handlers": handlers})
+
+    async def _batch(self, body: object) -> _Response:
+        requests = _object(body).get("requests")
+        if not isinstance(requests, list):
+            raise _HTTPError(400, "Body must hold a 'requests' list.")
+        responses = []
+        for request in requests:
+            request = _object(request)
+            method, path = request.get("method", "GET"), request.get("path")
+            if not isinstance(method, str) or not isinstance(path, str):
+                raise _HTTPError(400, "Each request needs a 'method' and a 'path'.")
+            if urlsplit(path).path.strip("/") == "batch":
+                raise _HTTPError(400, "Batches cannot be nested.")
+            response = await self.handle(method, path, request.get("body"))
+            responses.append({"status": response.status, "body": response.payload})
+        return _Response(200, {"responses": responses})
+
+    async def _metrics_text(self) -> _Response:
+        assert self._metrics is not None  # noqa: S101 - guarded by _route
+        return _Response(200, self._metrics.render(), CONTENT_TYPE)
+
+    async def _session(self, session_id: str) -> VoiceSession:
+        try:
+            return await self._manager.get_session(session_id)
+        except KeyError:
+            raise _HTTPError(404, f"No session '{session_id}'.") from None
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        hosts = _allowed_hosts(writer.get_extra_info("sockname"))
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                keep_alive, response = await self._exchange(request_line, reader, hosts)
+                writer.write(response.encode(keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # A peer that disconnects mid-request, or sends a line longer
+            # than the stream limit, just loses its connection.
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _exchange(
+        self,
+        request_line: bytes,
+        reader: asyncio.StreamReader,
+        hosts: frozenset[str] | None,
+    ) -> tuple[bool, _Response]:
+        """Read the rest of one request and answer it.
+
+        *hosts* holds the accepted Host header values, or None to accept
+        any, as on a Unix socket.
+        """
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            return False, _Response(400, {"error": "Malformed request line."})
+        headers: dict[str, str] = {}
+        while (line := await reader.readline()).strip():
+            if len(headers) >= _MAX_HEADERS:
+                return False, _Response(
+                    431, {"error": f"More than {_MAX_HEADERS} header lines."}
+                )
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+        if hosts is not None and headers.get("host", "").lower() not in hosts:
+            return False, _Response(403, {"error": "Host is not this local server."})
+        if "transfer-encoding" in headers:
+            return False, _Response(400, {"error": "Send a Content-Length body."})
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return False, _Response(400, {"error": "Invalid Content-Length."})
+        if not 0 <= length <= self._max_body:
+            return False, _Response(
+                413, {"error": f"Body exceeds {self._max_body} bytes."}
+            )
+        media_type = headers.get("content-type", "").partition(";")[0]
+        if method.upper() == "POST" and media_type.strip().lower() != _JSON:
+            return False, _Response(415, {"error": f"POST bodies must be {_JSON}."})
+        body: Any = None
+        if length:
+            try:
+                body = json.loads(await reader.readexactly(length))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                return keep_alive, _Response(400, {"error": "Body is not valid JSON."})
+        return keep_alive, await self.handle(method, target, body)
+
+
+def _allowed_hosts(sockname: object) -> frozenset[str] | None:
+    """Return the Host values naming a TCP listener, or None for a Unix socket."""
+    if not isinstance(sockname, tuple):
+        return None
+    address, port = sockname[0], sockname[1]
+    names = {*_LOOPBACK_HOSTS, f"[{address}]" if ":" in address else address}
+    hosts = {f"{name}:{port}" for name in names}
+    if port == 80:
+        hosts |= names
+    return frozenset(hosts)
+
+
+def _object(body: object) -> dict[str, Any]:
+    if body is None:
+        return {}
+    if not isinstance(body, dict):
+        raise _HTTPError(400, "Body must be a JSON object.")
+    return body
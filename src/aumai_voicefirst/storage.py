@@ -0,0 +1,298 @@
+"""Durable session storage backends for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic import TypeAdapter
+
+from aumai_voicefirst.models import (
+    SessionState,
+    Utterance,
+    UtteranceList,
+    VoiceSession,
+)
+from aumai_voicefirst.store import UtteranceStore
+
+__all__ = ["SessionStorage", "WriteAheadLogStorage"]
+
+_FRAME = struct.Struct("<II")  # payload length, crc32 of payload
+_utterance_list: TypeAdapter[list[Utterance]] = TypeAdapter(list[Utterance])
+
+
+class SessionStorage(Protocol):
+    """Persistence hooks invoked by VoiceSessionManager.
+
+    Each hook records one change and must cost O(size of the change), not
+    O(size of the session).
+    """
+
+    def load(self) -> dict[str, VoiceSession]:
+        """Return every persisted session keyed by session ID."""
+        ...
+
+    def session_created(self, session: VoiceSession) -> None:
+        """Record a newly created session."""
+        ...
+
+    def utterances_added(
+        self, session_id: str, utterances: Sequence[Utterance]
+    ) -> None:
+        """Record utterances added to a session, in arrival order."""
+        ...
+
+    def state_changed(self, session_id: str, state: SessionState) -> None:
+        """Record a session state transition."""
+        ...
+
+    def compact(self, sessions: Iterable[VoiceSession]) -> None:
+        """Replace the change history with a snapshot of *sessions*."""
+        ...
+
+    def close(self) -> None:
+        """Flush pending writes and release resources."""
+        ...
+
+
+class WriteAheadLogStorage:
+    """Append-only write-ahead log with snapshot compaction on local disk.
+
+    Every change is appended to ``wal.log`` as a length-prefixed, CRC-checked
+    JSON record carrying a log sequence number (LSN). Each record is handed
+    to the operating system before its hook returns, so a crashed process
+    loses nothing. Durability against power loss uses group commit: ``fsync``
+    runs once ``sync_every`` records are pending or, from a background timer,
+    ``sync_interval`` seconds after the first unsynced record, whichever comes
+    first, so an OS crash loses at most that window.
+
+    ``compact`` writes ``snapshot.jsonl`` atomically and truncates the log.
+    On startup ``load`` reads the snapshot, then replays log records newer
+    than the snapshot's LSN through a read-only memory map. A torn record at
+    the end of the log, left by a crash mid-write, is discarded.
+
+    Args:
+        directory: Directory holding the snapshot and log files.
+        sync_every: Maximum records buffered before an fsync.
+        sync_interval: Maximum seconds a record waits for its fsync.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        sync_every: int = 64,
+        sync_interval: float = 0.05,
+    ) -> None:
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1.")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._log_path = self._directory / "wal.log"
+        self._snapshot_path = self._directory / "snapshot.jsonl"
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._lsn = 0
+        self._pending = 0
+        self._timer: threading.Timer | None = None
+        self._log = open(self._log_path, "ab")
+
+    def load(self) -> dict[str, VoiceSession]:
+        """Rebuild sessions from the snapshot and the log tail.
+
+        Returns:
+            Every persisted session keyed by session ID.
+        """
+        with self._lock:
+            sessions, compact_ids, snapshot_lsn = self._read_snapshot()
+            self._lsn = snapshot_lsn
+            valid_bytes = 0
+            for end_offset, record in self._read_log():
+                valid_bytes = end_offset
+                lsn = int(record["lsn"])
+                self._lsn = max(self._lsn, lsn)
+                if lsn > snapshot_lsn:
+                    _apply(sessions, compact_ids, record)
+            self._truncate_torn_tail(valid_bytes)
+
+        for session_id, session in sessions.items():
+            ordered = sorted(session.utterances, key=lambda u: u.start_ms)
+            if session_id in compact_ids:
+                session.utterances = UtteranceStore(ordered)
+            else:
+                session.utterances = UtteranceList(ordered)
+        return sessions
+
+    def session_created(self, session: VoiceSession) -> None:
+        """Append a session creation record."""
+        payload = {
+            "op": "create",
+            "compact": isinstance(session.utterances, UtteranceStore),
+            "session": session.model_dump(mode="json"),
+        }
+        self._append(payload)
+
+    def utterances_added(
+        self, session_id: str, utterances: Sequence[Utterance]
+    ) -> None:
+        """Append one record holding the added utterances."""
+        payload = {
+            "op": "add",
+            "session_id": session_id,
+            "utterances": _utterance_list.dump_python(list(utterances), mode="json"),
+        }
+        self._append(payload)
+
+    def state_changed(self, session_id: str, state: SessionState) -> None:
+        """Append a session state record."""
+        self._append({"op": "state", "session_id": session_id, "state": state})
+
+    def compact(self, sessions: Iterable[VoiceSession]) -> None:
+        """Atomically snapshot *sessions* and truncate the log.
+
+        Args:
+            sessions: The complete current set of sessions.
+        """
+        with self._lock:
+            self._sync()
+            temporary = self._snapshot_path.with_suffix(".tmp")
+            with open(temporary, "wb") as handle:
+                handle.write(json.dumps({"lsn": self._lsn}).encode() + b"\n")
+                for session in sessions:
+                    compact = isinstance(session.utterances, UtteranceStore)
+                    line = b'{"compact":%s,"session":%s}\n' % (
+                        b"true" if compact else b"false",
+                        session.model_dump_json().encode(),
+                    )
+                    handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, self._snapshot_path)
+            self._fsync_directory()
+            # Records up to the snapshot LSN are skipped on replay, so a crash
+            # before this truncation cannot apply them twice.
+            self._log.truncate(0)
+            self._log.seek(0)
+            self._sync()
+
+    def sync(self) -> None:
+        """Force pending log records to stable storage."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """Sync pending records and close the log file."""
+        with self._lock:
+            if self._log.closed:
+                return
+            self._sync()
+            self._log.close()
+
+    def _append(self, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._lsn += 1
+            payload["lsn"] = self._lsn
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            self._log.write(_FRAME.pack(len(body), zlib.crc32(body)) + body)
+            self._log.flush()
+            self._pending += 1
+            if self._pending >= self._sync_every:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._sync_interval, self._sync_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _sync_due(self) -> None:
+        with self._lock:
+            # A sync that raced this timer may already have armed a new one.
+            if self._timer is threading.current_thread():
+                self._timer = None
+            if self._pending and not self._log.closed:
+                self._sync()
+
+    def _sync(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = 0
+
+    def _read_snapshot(self) -> tuple[dict[str, VoiceSession], set[str], int]:
+        sessions: dict[str, VoiceSession] = {}
+        compact_ids: set[str] = set()
+        if not self._snapshot_path.exists():
+            return sessions, compact_ids, 0
+        with open(self._snapshot_path, "rb") as handle:
+            header = json.loads(handle.readline())
+            for line in handle:
+                entry = json.loads(line)
+                session = VoiceSession.model_validate(entry["session"])
+                sessions[session.session_id] = session
+                if entry["compact"]:
+                    compact_ids.add(session.session_id)
+        return sessions, compact_ids, int(header["lsn"])
+
+    def _read_log(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        self._log.flush()
+        if self._log_path.stat().st_size == 0:
+            return
+        with (
+            open(self._log_path, "rb") as handle,
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view,
+        ):
+            offset = 0
+            size = len(view)
+            while offset + _FRAME.size <= size:
+                length, checksum = _FRAME.unpack_from(view, offset)
+                start = offset + _FRAME.size
+                body = view[start : start + length]
+                if len(body) < length or zlib.crc32(body) != checksum:
+                    return
+                offset = start + length
+                yield offset, json.loads(body)
+
+    def _truncate_torn_tail(self, valid_bytes: int) -> None:
+        if self._log_path.stat().st_size > valid_bytes:
+            self._log.truncate(valid_bytes)
+            self._sync()
+
+    def _fsync_directory(self) -> None:
+        if os.name != "posix":
+            return
+        descriptor = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+def _apply(
+    sessions: dict[str, VoiceSession],
+    compact_ids: set[str],
+    record: dict[str, Any],
+) -> None:
+    """Apply one replayed log record to *sessions*."""
+    op = record["op"]
+    if op == "create":
+        created = VoiceSession.model_validate(record["session"])
+        sessions[created.session_id] = created
+        if record["compact"]:
+            compact_ids.add(created.session_id)
+        return
+    session = sessions.get(record["session_id"])
+    if session is None:
+        return
+    if op == "add":
+        session.utterances.extend(_utterance_list.validate_python(record["utterances"]))
+    elif op == "state":
+        session.state = record["state"]
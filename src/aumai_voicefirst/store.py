@@ -0,0 +1,403 @@
+"""Compact array-backed utterance storage for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence
+from types import ModuleType
+from typing import overload
+
+from aumai_voicefirst.models import Utterance
+
+__all__ = ["StoreColumns", "UtteranceStore"]
+
+_MAX_LANGUAGES = 1 << 16
+
+
+class StoreColumns:
+    """The column buffers behind an UtteranceStore.
+
+    Attributes:
+        starts: start_ms of each utterance (``array("d")``).
+        ends: end_ms of each utterance (``array("d")``).
+        confidences: confidence of each utterance (``array("d")``).
+        offsets: Byte offset of each text in ``text``, plus the end of the
+            last one (``array("Q")`` with one more item than utterances).
+        language_ids: Index into ``languages`` of each utterance's tag
+            (``array("H")``).
+        languages: The distinct language tags.
+        text: Every utterance text, UTF-8 encoded back to back.
+    """
+
+    __slots__ = (
+        "confidences",
+        "ends",
+        "language_ids",
+        "languages",
+        "offsets",
+        "starts",
+        "text",
+    )
+
+    def __init__(
+        self,
+        starts: array[float],
+        ends: array[float],
+        confidences: array[float],
+        offsets: array[int],
+        language_ids: array[int],
+        languages: list[str],
+        text: bytes | bytearray | memoryview,
+    ) -> None:
+        self.starts = starts
+        self.ends = ends
+        self.confidences = confidences
+        self.offsets = offsets
+        self.language_ids = language_ids
+        self.languages = languages
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"StoreColumns(<{len(self.starts)} utterances>)"
+
+
+class UtteranceStore(MutableSequence[Utterance]):
+    """Columnar utterance sequence for very long sessions.
+
+    Timings and confidences live in typed ``double`` arrays, language tags are
+    interned to 16-bit ids and texts are packed into a single UTF-8 buffer
+    with an offset table. Indexing returns a freshly built ``Utterance`` view;
+    editing that view does not change the store.
+
+    A store can replace the plain list in ``VoiceSession.utterances`` and
+    serializes to the same JSON as a list of utterances. Like UtteranceList it
+    counts in-place rewrites in ``generation``.
+    """
+
+    __slots__ = (
+        "_starts",
+        "_ends",
+        "_confidences",
+        "_languages",
+        "_language_table",
+        "_language_ids",
+        "_text",
+        "_offsets",
+        "_generation",
+    )
+
+    def __init__(self, utterances: Iterable[Utterance] = ()) -> None:
+        self._starts = array("d")
+        self._ends = array("d")
+        self._confidences = array("d")
+        self._languages = array("H")
+        self._language_table: list[str] = []
+        self._language_ids: dict[str, int] = {}
+        self._text = bytearray()
+        self._offsets = array("Q", [0])
+        self._generation = 0
+        for utterance in utterances:
+            self.append(utterance)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"UtteranceStore(<{len(self)} utterances, {self.nbytes} bytes>)"
+
+    @classmethod
+    def from_columns(cls, columns: StoreColumns) -> UtteranceStore:
+        """Build a store directly from column buffers, without per-row work.
+
+        The store takes ownership of the arrays; the text is copied.
+
+        Args:
+            columns: Column buffers as returned by ``columns``.
+
+        Returns:
+            A store holding the utterances the columns describe.
+
+        Raises:
+            ValueError: If the columns have inconsistent lengths, the offsets
+                do not span the text, or a language id has no tag.
+        """
+        count = len(columns.starts)
+        if (
+            len(columns.ends) != count
+            or len(columns.confidences) != count
+            or len(columns.language_ids) != count
+            or len(columns.offsets) != count + 1
+        ):
+            raise ValueError("UtteranceStore columns have inconsistent lengths.")
+        if columns.offsets[0] != 0 or columns.offsets[-1] != len(columns.text):
+            raise ValueError("UtteranceStore text offsets do not span the text.")
+        if max(columns.language_ids, default=-1) >= len(columns.languages):
+            raise ValueError("UtteranceStore language id has no language tag.")
+        store = cls()
+        store._starts = columns.starts
+        store._ends = columns.ends
+        store._confidences = columns.confidences
+        store._offsets = columns.offsets
+        store._languages = columns.language_ids
+        store._language_table = list(columns.languages)
+        store._language_ids = {tag: i for i, tag in enumerate(columns.languages)}
+        store._text = bytearray(columns.text)
+        return store
+
+    def columns(self) -> StoreColumns:
+        """Return the store's column buffers, for bulk serialization.
+
+        The buffers are shared with the store, not copied: read them before
+        the store changes again, and never modify them.
+        """
+        return StoreColumns(
+            self._starts,
+            self._ends,
+            self._confidences,
+            self._offsets,
+            self._languages,
+            self._language_table,
+            self._text,
+        )
+
+    @property
+    def generation(self) -> int:
+        """Number of in-place rewrites so far; appending leaves it unchanged."""
+        return self._generation
+
+    @overload
+    def __getitem__(self, index: int) -> Utterance: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Utterance]: ...
+
+    def __getitem__(self, index: int | slice) -> Utterance | list[Utterance]:
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        return self._view(self._normalize(index))
+
+    @overload
+    def __setitem__(self, index: int, value: Utterance) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Utterance]) -> None: ...
+
+    def __setitem__(
+        self, index: int | slice, value: Utterance | Iterable[Utterance]
+    ) -> None:
+        if isinstance(index, slice):
+            if isinstance(value, Utterance):
+                raise TypeError("can only assign an iterable of utterances")
+            positions = range(*index.indices(len(self)))
+            values = list(value)
+            if index.step not in (None, 1):
+                if len(values) != len(positions):
+                    raise ValueError(
+                        f"attempt to assign sequence of size {len(values)} "
+                        f"to extended slice of size {len(positions)}"
+                    )
+                for position, utterance in zip(positions, values, strict=True):
+                    self[position] = utterance
+                return
+            del self[index]
+            for offset, utterance in enumerate(values):
+                self.insert(positions.start + offset, utterance)
+            return
+        if not isinstance(value, Utterance):
+            raise TypeError("can only assign an Utterance")
+        position = self._normalize(index)
+        self._delete(position)
+        self.insert(position, value)
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            for position in sorted(range(*index.indices(len(self))), reverse=True):
+                self._delete(position)
+            return
+        self._delete(self._normalize(index))
+
+    def insert(self, index: int, value: Utterance) -> None:
+        """Insert an utterance before *index*, with list.insert semantics."""
+        size = len(self)
+        if index < 0:
+            index = max(size + index, 0)
+        position = min(index, size)
+        encoded = value.text.encode("utf-8")
+        language = self._intern(value.language)
+        if position == size:
+            self._text += encoded
+            self._offsets.append(self._offsets[-1] + len(encoded))
+            self._starts.append(value.start_ms)
+            self._ends.append(value.end_ms)
+            self._confidences.append(value.confidence)
+            self._languages.append(language)
+            return
+
+        self._generation += 1
+        offset = self._offsets[position]
+        self._text[offset:offset] = encoded
+        self._offsets.insert(position + 1, offset)
+        _shift(self._offsets, position + 1, len(encoded))
+        self._starts.insert(position, value.start_ms)
+        self._ends.insert(position, value.end_ms)
+        self._confidences.insert(position, value.confidence)
+        self._languages.insert(position, language)
+
+    def insort(self, utterance: Utterance) -> int:
+        """Insert an utterance after any others with the same start_ms.
+
+        Assumes the store is already ordered by start_ms.
+
+        Args:
+            utterance: The utterance to insert.
+
+        Returns:
+            The position the utterance was stored at.
+        """
+        position = self.bisect(utterance.start_ms)
+        self.insert(position, utterance)
+        return position
+
+    def bisect(self, start_ms: float) -> int:
+        """Return the position after the last entry starting at or before start_ms.
+
+        Assumes the store is already ordered by start_ms.
+        """
+        starts = self._starts
+        if not starts or start_ms >= starts[-1]:
+            return len(starts)
+        return bisect.bisect_right(starts, start_ms)
+
+    def is_ordered(self, start: int = 0) -> bool:
+        """Return True if entries from *start* onward continue start_ms order."""
+        starts = self._starts
+        previous = starts[start - 1] if start > 0 else 0.0
+        for index in range(start, len(starts)):
+            current = starts[index]
+            if current < previous:
+                return False
+            previous = current
+        return True
+
+    def start_times(self, start: int = 0) -> Iterator[float]:
+        """Yield start_ms values from *start* onward without building views."""
+        return iter(self._starts[start:])
+
+    def end_times(self, start: int = 0) -> Iterator[float]:
+        """Yield end_ms values from *start* onward without building views."""
+        return iter(self._ends[start:])
+
+    def iter_texts(self, start: int = 0) -> Iterator[str]:
+        """Yield utterance texts from *start* onward without building views."""
+        text, offsets = self._text, self._offsets
+        for index in range(start, len(self)):
+            yield text[offsets[index] : offsets[index + 1]].decode("utf-8")
+
+    def iter_languages(self, start: int = 0) -> Iterator[str]:
+        """Yield utterance language tags from *start* onward without building views."""
+        table = self._language_table
+        return (table[language] for language in self._languages[start:])
+
+    def ordered_copy(self) -> UtteranceStore:
+        """Return a new store holding the same utterances sorted by start_ms."""
+        if self.is_ordered():
+            copy = UtteranceStore()
+            copy._starts = array("d", self._starts)
+            copy._ends = array("d", self._ends)
+            copy._confidences = array("d", self._confidences)
+            copy._languages = array("H", self._languages)
+            copy._language_table = list(self._language_table)
+            copy._language_ids = dict(self._language_ids)
+            copy._text = bytearray(self._text)
+            copy._offsets = array("Q", self._offsets)
+            return copy
+        order = sorted(range(len(self)), key=self._starts.__getitem__)
+        return UtteranceStore(self._view(index) for index in order)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the column buffers."""
+        columns = (
+            self._starts,
+            self._ends,
+            self._confidences,
+            self._languages,
+            self._offsets,
+        )
+        return sum(column.itemsize * len(column) for column in columns) + len(
+            self._text
+        )
+
+    def _view(self, index: int) -> Utterance:
+        offsets = self._offsets
+        return Utterance.model_construct(
+            text=self._text[offsets[index] : offsets[index + 1]].decode("utf-8"),
+            language=self._language_table[self._languages[index]],
+            start_ms=self._starts[index],
+            end_ms=self._ends[index],
+            confidence=self._confidences[index],
+        )
+
+    def _delete(self, position: int) -> None:
+        self._generation += 1
+        offsets = self._offsets
+        begin, end = offsets[position], offsets[position + 1]
+        del self._text[begin:end]
+        del offsets[position + 1]
+        _shift(offsets, position + 1, begin - end)
+        del self._starts[position]
+        del self._ends[position]
+        del self._confidences[position]
+        del self._languages[position]
+
+    def _intern(self, language: str) -> int:
+        language_id = self._language_ids.get(language)
+        if language_id is None:
+            if len(self._language_table) >= _MAX_LANGUAGES:
+                raise ValueError(
+                    f"UtteranceStore supports at most {_MAX_LANGUAGES} "
+                    "distinct language tags."
+                )
+            language_id = len(self._language_table)
+            self._language_table.append(language)
+            self._language_ids[language] = language_id
+        return language_id
+
+    def _normalize(self, index: int) -> int:
+        size = len(self)
+        position = index + size if index < 0 else index
+        if not 0 <= position < size:
+            raise IndexError("UtteranceStore index out of range")
+        return position
+
+
+def _shift(offsets: array[int], start: int, delta: int) -> None:
+    """Add *delta* to every offset from *start* onward, in place.
+
+    With NumPy installed the buffer is updated in place at memory speed;
+    otherwise the tail is rebuilt in one C-level pass instead of an
+    interpreted loop over the following utterances.
+    """
+    np = _numpy()
+    if np is None:
+        offsets[start:] = array("Q", map(delta.__add__, offsets[start:]))
+        return
+    tail = np.frombuffer(offsets, dtype=np.uint64)[start:]
+    if delta >= 0:
+        tail += np.uint64(delta)
+    else:
+        tail -= np.uint64(-delta)
+    # Release the buffer export so the array can be resized again.
+    del tail
+
+
+@functools.cache
+def _numpy() -> ModuleType | None:
+    """Return NumPy if it is installed; it is an optional dependency."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,276 @@
+"""Streaming transcript extraction from session JSON for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import struct
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+__all__ = ["iter_transcript", "iter_utterance_records"]
+
+_TOKEN = re.compile(r"[^ \t\n\r]")
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+_CHUNK_SIZE = 1 << 20
+# Spilled run record: start_ms, arrival sequence, UTF-8 text length.
+_RUN_RECORD = struct.Struct("<dQI")
+# Rough per-line overhead of a buffered (start_ms, sequence, text) tuple.
+_LINE_OVERHEAD = 120
+
+
+class _JsonStream:
+    """Pull parser over a text stream that keeps only a small window in memory."""
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at end of input."""
+        while True:
+            token = _TOKEN.search(self._buffer, self._position)
+            if token is not None:
+                self._position = token.start()
+                return token.group()
+            self._position = len(self._buffer)
+            if self._eof:
+                return ""
+            self._fill()
+
+    def expect(self, character: str) -> None:
+        found = self.peek()
+        if found != character:
+            found = repr(found) if found else "end of file"
+            raise ValueError(f"Expected {character!r} in session JSON, found {found}.")
+        self._position += 1
+
+    def value(self) -> object:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as exc:
+                if self._eof:
+                    raise ValueError(f"Invalid session JSON: {exc.msg}.") from exc
+                self._fill()
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number may continue in the next chunk.
+                self._fill()
+                continue
+            self._position = end
+            return value
+
+    def elements(self) -> Iterator[object]:
+        """Yield the elements of the array whose "[" was just consumed."""
+        if self.peek() == "]":
+            self._position += 1
+            return
+        decode = self._decoder.raw_decode
+        while True:
+            try:
+                value, end = decode(self._buffer, self._position)
+            except json.JSONDecodeError as exc:
+                if self._eof:
+                    raise ValueError(f"Invalid session JSON: {exc.msg}.") from exc
+                self._fill()
+                continue
+            # One match consumes the separator and the whitespace around it.
+            separator = _SEPARATOR.match(self._buffer, end)
+            if separator is None or separator.end() == len(self._buffer):
+                if not self._eof:
+                    self._fill()
+                    continue
+                if separator is None:
+                    raise ValueError("Expected ',' or ']' in session JSON.")
+            self._position = separator.end()
+            yield value
+            if separator.group(1) == "]":
+                return
+
+    def _fill(self) -> None:
+        # Read at least as much as is buffered so a value spanning many
+        # chunks is re-scanned a logarithmic number of times.
+        pending = len(self._buffer) - self._position
+        chunk = self._stream.read(max(self._chunk_size, pending))
+        if not chunk:
+            self._eof = True
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+
+
+def iter_utterance_records(
+    stream: IO[str], *, chunk_size: int = _CHUNK_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Yield the raw utterance objects of a session JSON document one by one.
+
+    The document is read in ``chunk_size`` pieces and only the utterance
+    being decoded is held in memory. Records are plain dicts, not validated
+    Utterance models; other top-level fields are skipped.
+
+    Args:
+        stream: Text stream positioned at the start of a VoiceSession JSON
+            document.
+        chunk_size: Characters read per refill.
+
+    Yields:
+        Each element of the ``utterances`` array, in file order.
+
+    Raises:
+        ValueError: If the document is not a JSON object or is malformed.
+    """
+    parser = _JsonStream(stream, chunk_size)
+    parser.expect("{")
+    if parser.peek() == "}":
+        return
+    while True:
+        key = parser.value()
+        parser.expect(":")
+        if key == "utterances":
+            parser.expect("[")
+            for record in parser.elements():
+                if not isinstance(record, dict):
+                    raise ValueError("Utterances must be JSON objects.")
+                yield record
+        else:
+            parser.value()
+        if parser.peek() == ",":
+            parser.expect(",")
+            continue
+        parser.expect("}")
+        return
+
+
+def iter_transcript(
+    path: str | os.PathLike[str],
+    *,
+    presorted: bool = False,
+    memory_limit: int = 64 << 20,
+    temp_dir: str | os.PathLike[str] | None = None,
+) -> Iterator[str]:
+    """Yield the transcript lines of a session JSON file in start_ms order.
+
+    Produces the same lines as VoiceSessionManager.get_transcript on the
+    loaded session, without loading or validating it. Utterances sharing a
+    start_ms keep their file order.
+
+    With ``presorted`` each line is yielded as soon as its utterance is
+    parsed, which suits files written by VoiceSessionManager since it keeps
+    utterances ordered. Otherwise lines are buffered up to ``memory_limit``
+    bytes, then sorted and spilled to temporary files that are merged at the
+    end, so memory stays bounded however large the file is. Ordered input
+    skips the sort and merge work.
+
+    Args:
+        path: Session JSON file.
+        presorted: Stream lines as they are parsed; the file must be ordered.
+        memory_limit: Approximate bytes of transcript held before spilling.
+        temp_dir: Directory for spilled runs; the system default if None.
+
+    Yields:
+        Utterance texts.
+
+    Raises:
+        ValueError: If the file is malformed, an utterance lacks text or
+            start_ms, or ``presorted`` is set and the file is not ordered.
+    """
+    with Path(path).open(encoding="utf-8") as stream:
+        records = iter_utterance_records(stream)
+        if presorted:
+            yield from _stream_ordered(records)
+        else:
+            yield from _external_sort(records, memory_limit, temp_dir)
+
+
+def _fields(record: dict[str, Any], sequence: int) -> tuple[float, str]:
+    try:
+        start_ms, text = record["start_ms"], record["text"]
+    except KeyError as exc:
+        raise ValueError(f"Utterance {sequence} has no {exc.args[0]}.") from None
+    if not isinstance(text, str) or not isinstance(start_ms, int | float):
+        raise ValueError(f"Utterance {sequence} has an invalid text or start_ms.")
+    return float(start_ms), text
+
+
+def _stream_ordered(records: Iterator[dict[str, Any]]) -> Iterator[str]:
+    previous = 0.0
+    for sequence, record in enumerate(records):
+        start_ms, text = _fields(record, sequence)
+        if start_ms < previous:
+            raise ValueError(
+                f"Utterance {sequence} starts at {start_ms} ms, before the one "
+                f"preceding it; the file is not ordered by start_ms."
+            )
+        previous = start_ms
+        yield text
+
+
+def _external_sort(
+    records: Iterator[dict[str, Any]],
+    memory_limit: int,
+    temp_dir: str | os.PathLike[str] | None,
+) -> Iterator[str]:
+    with tempfile.TemporaryDirectory(
+        prefix="voicefirst-transcript-", dir=temp_dir
+    ) as directory:
+        runs: list[Path] = []
+        run: list[tuple[float, int, str]] = []
+        run_bytes = 0
+        ordered = True
+        previous = 0.0
+        for sequence, record in enumerate(records):
+            start_ms, text = _fields(record, sequence)
+            ordered = ordered and start_ms >= previous
+            previous = start_ms
+            run.append((start_ms, sequence, text))
+            run_bytes += len(text) + _LINE_OVERHEAD
+            if run_bytes >= memory_limit:
+                runs.append(_spill(run, ordered, Path(directory), len(runs)))
+                run = []
+                run_bytes = 0
+
+        if not ordered:
+            run.sort()
+        if not runs:
+            yield from (text for _, _, text in run)
+            return
+        if run:
+            runs.append(_spill(run, True, Path(directory), len(runs)))
+        if ordered:
+            # Consecutive runs of ordered input never interleave.
+            for run_path in runs:
+                yield from (text for _, _, text in _read_run(run_path))
+            return
+        merged = heapq.merge(*(_read_run(run_path) for run_path in runs))
+        yield from (text for _, _, text in merged)
+
+
+def _spill(
+    run: list[tuple[float, int, str]], ordered: bool, directory: Path, number: int
+) -> Path:
+    if not ordered:
+        run.sort()
+    path = directory / f"run-{number}"
+    with path.open("wb", buffering=_CHUNK_SIZE) as handle:
+        for start_ms, sequence, text in run:
+            encoded = text.encode("utf-8")
+            handle.write(_RUN_RECORD.pack(start_ms, sequence, len(encoded)))
+            handle.write(encoded)
+    return path
+
+
+def _read_run(path: Path) -> Iterator[tuple[float, int, str]]:
+    with path.open("rb", buffering=_CHUNK_SIZE) as handle:
+        while header := handle.read(_RUN_RECORD.size):
+            start_ms, sequence, size = _RUN_RECORD.unpack(header)
+            yield start_ms, sequence, handle.read(size).decode("utf-8")
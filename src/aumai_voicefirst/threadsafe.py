@@ -0,0 +1,193 @@
+"""Thread-safe session management for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack
+from typing import Any
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.ids import IdFactory, uuid7
+from aumai_voicefirst.metrics import Metrics
+from aumai_voicefirst.models import (
+    SessionState,
+    Utterance,
+    VoiceConfig,
+    VoiceSession,
+)
+from aumai_voicefirst.registry import RegistryStats, SessionRegistry
+from aumai_voicefirst.storage import SessionStorage
+
+__all__ = ["ThreadSafeVoiceSessionManager"]
+
+
+class _StripedRegistry(SessionRegistry):
+    """SessionRegistry sharded across independently locked stripes."""
+
+    def __init__(self, shards: Sequence[SessionRegistry]) -> None:
+        super().__init__()
+        self._shards = list(shards)
+        self._shard_locks = [threading.Lock() for _ in self._shards]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, session_id: object) -> bool:
+        if not isinstance(session_id, str):
+            return False
+        lock, shard = self._shard(session_id)
+        with lock:
+            return session_id in shard
+
+    def add(self, session: VoiceSession) -> None:
+        lock, shard = self._shard(session.session_id)
+        with lock:
+            shard.add(session)
+
+    def get(self, session_id: str) -> VoiceSession:
+        lock, shard = self._shard(session_id)
+        with lock:
+            return shard.get(session_id)
+
+    def touch(self, session: VoiceSession, added: Sequence[Utterance] = ()) -> None:
+        lock, shard = self._shard(session.session_id)
+        with lock:
+            shard.touch(session, added)
+
+    def demote(self, session_id: str) -> None:
+        lock, shard = self._shard(session_id)
+        with lock:
+            shard.demote(session_id)
+
+    def sweep(self) -> None:
+        for lock, shard in zip(self._shard_locks, self._shards, strict=True):
+            with lock:
+                shard.sweep()
+
+    def add_discard_listener(self, listener: Callable[[VoiceSession], None]) -> None:
+        for lock, shard in zip(self._shard_locks, self._shards, strict=True):
+            with lock:
+                shard.add_discard_listener(listener)
+
+    def sessions(self) -> Iterator[VoiceSession]:
+        for lock, shard in zip(self._shard_locks, self._shards, strict=True):
+            with lock:
+                sessions = list(shard.sessions())
+            yield from sessions
+
+    def stats(self) -> RegistryStats:
+        totals: dict[str, int] = {}
+        for lock, shard in zip(self._shard_locks, self._shards, strict=True):
+            with lock:
+                for name, value in shard.stats():
+                    totals[name] = totals.get(name, 0) + value
+        return RegistryStats.model_validate(totals)
+
+    def _shard(self, session_id: str) -> tuple[threading.Lock, SessionRegistry]:
+        stripe = hash(session_id) % len(self._shards)
+        return self._shard_locks[stripe], self._shards[stripe]
+
+
+class ThreadSafeVoiceSessionManager(VoiceSessionManager):
+    """VoiceSessionManager that is safe to share between threads.
+
+    Sessions hash onto ``stripes`` lock stripes. Each stripe owns one shard
+    of the session registry and serializes the mutations of the sessions
+    mapped to it, so work on different sessions rarely contends. Transcript
+    reads are lock-free whenever the session's cached transcript snapshot is
+    current; only a stale snapshot takes the stripe lock to rebuild it.
+
+    Range queries return an iterator over a snapshot taken under the lock.
+    ``checkpoint`` briefly acquires every stripe so the snapshot it writes
+    matches the storage log exactly.
+
+    Args:
+        storage: Optional durable backend, as for VoiceSessionManager.
+        stripes: Number of lock stripes and registry shards.
+        registry_factory: Builds the registry for each shard. Bounds such as
+            max_sessions and max_bytes therefore apply per shard.
+        audio_budget: Maximum total bytes of audio buffers, across all
+            stripes.
+        metrics: Optional Metrics, as for VoiceSessionManager.
+        id_factory: Session ID factory, as for VoiceSessionManager; it is
+            called concurrently, so it must be thread-safe.
+    """
+
+    def __init__(
+        self,
+        storage: SessionStorage | None = None,
+        *,
+        stripes: int = 16,
+        registry_factory: Callable[[], SessionRegistry] = SessionRegistry,
+        audio_budget: int | None = None,
+        metrics: Metrics | None = None,
+        id_factory: IdFactory = uuid7,
+    ) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1.")
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        shards = [registry_factory() for _ in range(stripes)]
+        super().__init__(
+            storage,
+            _StripedRegistry(shards),
+            audio_budget=audio_budget,
+            metrics=metrics,
+            id_factory=id_factory,
+        )
+
+    def create_session(
+        self, config: VoiceConfig, *, compact: bool = False
+    ) -> VoiceSession:
+        # Nobody else can reach the new session yet; holding any stripe is
+        # only needed to keep creation out of a concurrent checkpoint.
+        with self._stripes[threading.get_ident() % len(self._stripes)]:
+            return super().create_session(config, compact=compact)
+
+    def add_utterance(self, session: VoiceSession, utterance: Utterance) -> None:
+        with self._stripe(session.session_id):
+            super().add_utterance(session, utterance)
+
+    def add_utterances(
+        self,
+        session: VoiceSession,
+        utterances: Iterable[Utterance | Mapping[str, Any]],
+        *,
+        trusted: bool = False,
+    ) -> list[Utterance]:
+        with self._stripe(session.session_id):
+            return super().add_utterances(session, utterances, trusted=trusted)
+
+    def get_transcript(self, session: VoiceSession) -> str:
+        text = self._cached_transcript(session)
+        if text is not None:
+            return text
+        with self._stripe(session.session_id):
+            return super().get_transcript(session)
+
+    def utterances_in_range(
+        self, session: VoiceSession, start_ms: float, end_ms: float
+    ) -> Iterator[Utterance]:
+        with self._stripe(session.session_id):
+            found = list(super().utterances_in_range(session, start_ms, end_ms))
+        return iter(found)
+
+    def utterances_at(
+        self, session: VoiceSession, time_ms: float
+    ) -> Iterator[Utterance]:
+        with self._stripe(session.session_id):
+            found = list(super().utterances_at(session, time_ms))
+        return iter(found)
+
+    def set_state(self, session: VoiceSession, state: SessionState) -> None:
+        with self._stripe(session.session_id):
+            super().set_state(session, state)
+
+    def checkpoint(self) -> None:
+        with ExitStack() as stack:
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            super().checkpoint()
+
+    def _stripe(self, session_id: str) -> threading.Lock:
+        return self._stripes[hash(session_id) % len(self._stripes)]
@@ -0,0 +1,220 @@
+"""Voice activity detection for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "aumai_voicefirst.vad requires NumPy; install aumai-voicefirst[audio]."
+    ) from exc
+
+from aumai_voicefirst.models import Utterance, VoiceSession
+
+__all__ = ["VoiceActivityDetector"]
+
+# Keeps log10 finite for digital silence; about -200 dBFS.
+_ENERGY_FLOOR = 1e-20
+
+
+class VoiceActivityDetector:
+    """Energy and zero-crossing voice activity detector.
+
+    Audio is cut into ``frame_ms`` frames and every block of frames is
+    classified at once with NumPy: a frame is speech when its energy reaches
+    ``threshold_db`` (dBFS), or when it is at most ``weak_margin_db`` below
+    that and its zero-crossing rate reaches ``zcr_threshold``, which keeps
+    quiet unvoiced consonants such as "s" or "f" inside words.
+
+    Speech frames separated by fewer than ``min_silence_ms`` of silence form
+    one segment, and segments shorter than ``min_speech_ms`` are dropped.
+    Segments are emitted as Utterances with empty text, the session's
+    language, their start_ms and end_ms, and the share of their frames
+    classified as speech as confidence.
+
+    ``feed`` accepts a live stream in chunks of any size. A segment is
+    emitted as soon as ``min_silence_ms`` of silence follows it, so the
+    detector never looks further ahead than that plus one frame.
+
+    Args:
+        session: Session whose config supplies sample rate, channel count and
+            language.
+        frame_ms: Analysis frame duration in milliseconds.
+        threshold_db: Frame energy, in dB relative to full scale, at or
+            above which a frame is speech.
+        zcr_threshold: Zero crossings per sample at or above which a weak
+            frame is speech.
+        weak_margin_db: How far below threshold_db a high-ZCR frame may be.
+        min_speech_ms: Shortest segment emitted.
+        min_silence_ms: Silence that ends a segment.
+        start_ms: Time of the first sample fed, in session time.
+
+    Raises:
+        ValueError: If a duration is out of range.
+    """
+
+    def __init__(
+        self,
+        session: VoiceSession,
+        *,
+        frame_ms: float = 20.0,
+        threshold_db: float = -35.0,
+        zcr_threshold: float = 0.25,
+        weak_margin_db: float = 10.0,
+        min_speech_ms: float = 120.0,
+        min_silence_ms: float = 300.0,
+        start_ms: float = 0.0,
+    ) -> None:
+        if frame_ms <= 0 or min_speech_ms < 0 or min_silence_ms <= 0:
+            raise ValueError(
+                "frame_ms and min_silence_ms must be positive and min_speech_ms "
+                "non-negative."
+            )
+        config = session.config
+        self._language = config.language
+        self._channels = config.channels
+        self._frame_samples = max(2, round(config.sample_rate * frame_ms / 1000))
+        self._frame_ms = self._frame_samples * 1000.0 / config.sample_rate
+        self._threshold_db = threshold_db
+        self._weak_db = threshold_db - weak_margin_db
+        self._zcr_threshold = zcr_threshold
+        self._min_frames = max(1, math.ceil(min_speech_ms / self._frame_ms))
+        self._hangover = max(1, math.ceil(min_silence_ms / self._frame_ms))
+        self._start_ms = start_ms
+
+        self._pending: npt.NDArray[np.float32] = np.empty(0, dtype=np.float32)
+        self._frames_seen = 0
+        # Open segment: first and last speech frame, and speech frames in it.
+        self._open_start: int | None = None
+        self._open_last = 0
+        self._open_speech = 0
+
+    @property
+    def frame_ms(self) -> float:
+        """Exact analysis frame duration after rounding to whole samples."""
+        return self._frame_ms
+
+    def classify(self, samples: npt.NDArray[np.generic]) -> npt.NDArray[np.bool_]:
+        """Return the speech/non-speech decision of each whole frame.
+
+        Stateless: the samples are framed from their first sample and a
+        trailing partial frame is ignored.
+
+        Args:
+            samples: Mono samples, or ``(n, channels)`` / interleaved samples
+                matching the session's channel count. Integer samples are
+                scaled to [-1, 1).
+        """
+        mono = self._mono(samples)
+        count = len(mono) // self._frame_samples
+        frames = mono[: count * self._frame_samples].reshape(count, -1)
+        return self._classify(frames)
+
+    def feed(self, samples: npt.NDArray[np.generic]) -> list[Utterance]:
+        """Process the next chunk of a stream.
+
+        Args:
+            samples: The next samples, in the same layouts ``classify``
+                accepts.
+
+        Returns:
+            Segments that ended within the audio fed so far.
+        """
+        mono = self._mono(samples)
+        if self._pending.size:
+            mono = np.concatenate((self._pending, mono))
+        count = len(mono) // self._frame_samples
+        used = count * self._frame_samples
+        self._pending = mono[used:].copy()
+        mask = self._classify(mono[:used].reshape(count, self._frame_samples))
+        return self._advance(mask)
+
+    def flush(self) -> list[Utterance]:
+        """End the stream, emitting any open segment.
+
+        A trailing partial frame is discarded. The detector can then be fed
+        again; the new audio is timed from the end of the last whole frame.
+        """
+        self._pending = np.empty(0, dtype=np.float32)
+        segments: list[Utterance] = []
+        self._close(segments)
+        return segments
+
+    def detect(self, samples: npt.NDArray[np.generic]) -> list[Utterance]:
+        """Feed a complete recording and flush, returning all its segments."""
+        return self.feed(samples) + self.flush()
+
+    def _mono(self, samples: npt.NDArray[np.generic]) -> npt.NDArray[np.float32]:
+        data = np.asarray(samples)
+        if np.issubdtype(data.dtype, np.integer):
+            scale = float(np.iinfo(data.dtype).max) + 1.0
+            data = data.astype(np.float32) / np.float32(scale)
+        else:
+            data = data.astype(np.float32, copy=False)
+        if self._channels > 1:
+            data = data.reshape(-1, self._channels).mean(axis=1, dtype=np.float32)
+        elif data.ndim != 1:
+            data = data.reshape(-1)
+        return data
+
+    def _classify(self, frames: npt.NDArray[np.float32]) -> npt.NDArray[np.bool_]:
+        energy = np.einsum("ij,ij->i", frames, frames) / frames.shape[1]
+        energy_db = 10.0 * np.log10(np.maximum(energy, _ENERGY_FLOOR))
+        negative = np.signbit(frames)
+        zcr = np.count_nonzero(negative[:, 1:] != negative[:, :-1], axis=1) / (
+            frames.shape[1] - 1
+        )
+        speech: npt.NDArray[np.bool_] = (energy_db >= self._threshold_db) | (
+            (energy_db >= self._weak_db) & (zcr >= self._zcr_threshold)
+        )
+        return speech
+
+    def _advance(self, mask: npt.NDArray[np.bool_]) -> list[Utterance]:
+        base = self._frames_seen
+        self._frames_seen += len(mask)
+        segments: list[Utterance] = []
+        speech = np.flatnonzero(mask) + base
+        if speech.size:
+            # Group speech frames separated by less than the hangover.
+            breaks = np.flatnonzero(np.diff(speech) > self._hangover) + 1
+            firsts = np.concatenate(([0], breaks))
+            lasts = np.concatenate((breaks - 1, [speech.size - 1]))
+            for first, last in zip(firsts.tolist(), lasts.tolist(), strict=True):
+                start, end = int(speech[first]), int(speech[last])
+                if (
+                    self._open_start is not None
+                    and start - self._open_last > self._hangover
+                ):
+                    self._close(segments)
+                if self._open_start is None:
+                    self._open_start = start
+                    self._open_speech = 0
+                self._open_last = end
+                self._open_speech += last - first + 1
+        if (
+            self._open_start is not None
+            and self._frames_seen - 1 - self._open_last >= self._hangover
+        ):
+            self._close(segments)
+        return segments
+
+    def _close(self, segments: list[Utterance]) -> None:
+        start = self._open_start
+        if start is None:
+            return
+        self._open_start = None
+        length = self._open_last - start + 1
+        if length < self._min_frames:
+            return
+        segments.append(
+            Utterance(
+                text="",
+                language=self._language,
+                start_ms=self._start_ms + start * self._frame_ms,
+                end_ms=self._start_ms + (self._open_last + 1) * self._frame_ms,
+                confidence=self._open_speech / length,
+            )
+        )
@@ -0,0 +1,199 @@
+"""Streaming WAV ingestion for aumai-voicefirst."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+
+from aumai_voicefirst.models import AudioFormat, VoiceConfig
+
+__all__ = ["WavReader"]
+
+_FORMAT_PCM = 0x0001
+_FORMAT_FLOAT = 0x0003
+_FORMAT_EXTENSIBLE = 0xFFFE
+_CHUNK_HEADER = struct.Struct("<4sI")
+_FMT_CHUNK = struct.Struct("<HHIIHH")
+
+
+class WavReader:
+    """Memory-mapped reader that streams a WAV file as fixed-duration frames.
+
+    The file is mapped read-only and never copied: ``frames`` yields
+    ``memoryview`` slices of the mapping, each holding ``frame_ms`` worth of
+    interleaved samples in the file's own encoding. Pages are faulted in as
+    frames are touched and can be dropped by the OS once consumed, so memory
+    use stays flat however long the recording is.
+
+    When a VoiceConfig is given, the header must match its format, sample
+    rate and channel count.
+
+    Frames are only valid while the reader is open. Closing a reader while
+    frames are still referenced defers unmapping until the last one is
+    released.
+
+    Args:
+        path: Path of the WAV file.
+        config: Session configuration to validate the header against.
+        frame_ms: Duration of each yielded frame in milliseconds.
+
+    Raises:
+        ValueError: If the file is not a PCM or IEEE float WAV file, or it
+            does not match the config.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        config: VoiceConfig | None = None,
+        *,
+        frame_ms: float = 20.0,
+    ) -> None:
+        if frame_ms <= 0:
+            raise ValueError("frame_ms must be positive.")
+        self._path = Path(path)
+        with self._path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                raise ValueError(f"{self._path} is empty.")
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse_header()
+            if config is not None:
+                self._validate(config)
+        except BaseException:
+            self._mmap.close()
+            raise
+        if hasattr(self._mmap, "madvise"):
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        self._frame_samples = max(1, round(self._sample_rate * frame_ms / 1000))
+
+    def __enter__(self) -> WavReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def sample_rate(self) -> int:
+        """Samples per second per channel."""
+        return self._sample_rate
+
+    @property
+    def channels(self) -> int:
+        """Number of interleaved channels."""
+        return self._channels
+
+    @property
+    def sample_width(self) -> int:
+        """Bytes per sample of one channel."""
+        return self._sample_width
+
+    @property
+    def is_float(self) -> bool:
+        """True for IEEE float samples, False for integer PCM."""
+        return self._is_float
+
+    @property
+    def num_samples(self) -> int:
+        """Number of sample frames (samples per channel) in the file."""
+        return self._data_size // self._block_align
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration of the audio in milliseconds."""
+        return self.num_samples * 1000.0 / self._sample_rate
+
+    @property
+    def frame_bytes(self) -> int:
+        """Size in bytes of every full frame yielded by ``frames``."""
+        return self._frame_samples * self._block_align
+
+    def frames(self, start_ms: float = 0.0) -> Iterator[memoryview]:
+        """Yield consecutive frames of raw interleaved samples.
+
+        Every frame but possibly the last holds exactly ``frame_bytes``
+        bytes; the last holds the remaining whole samples.
+
+        Args:
+            start_ms: Position to start streaming from, rounded down to a
+                whole sample.
+
+        Yields:
+            Read-only memoryviews into the mapped file.
+        """
+        block_align = self._block_align
+        first_sample = max(0, int(start_ms * self._sample_rate / 1000))
+        start = self._data_offset + first_sample * block_align
+        end = self._data_offset + self.num_samples * block_align
+        step = self.frame_bytes
+        with memoryview(self._mmap) as view:
+            for offset in range(start, end, step):
+                yield view[offset : min(offset + step, end)]
+
+    def close(self) -> None:
+        """Unmap the file, or arrange for that once outstanding frames go."""
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Frames are still exported; the mapping is released with them.
+            pass
+
+    def _parse_header(self) -> None:
+        data = self._mmap
+        if len(data) < 12 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+            raise ValueError(f"{self._path} is not a RIFF/WAVE file.")
+        fmt: tuple[int, int, int, int, int, int] | None = None
+        subformat = None
+        position = 12
+        while position + _CHUNK_HEADER.size <= len(data):
+            chunk_id, size = _CHUNK_HEADER.unpack_from(data, position)
+            body = position + _CHUNK_HEADER.size
+            if chunk_id == b"fmt ":
+                if size < _FMT_CHUNK.size:
+                    raise ValueError(f"{self._path} has a truncated fmt chunk.")
+                fmt = _FMT_CHUNK.unpack_from(data, body)
+                if fmt[0] == _FORMAT_EXTENSIBLE and size >= 26:
+                    # The first two bytes of the SubFormat GUID are the tag.
+                    (subformat,) = struct.unpack_from("<H", data, body + 24)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"{self._path} has data before its fmt chunk.")
+                # Tolerate writers that leave a streaming placeholder size.
+                self._data_offset: int = body
+                self._data_size: int = min(size, len(data) - body)
+                break
+            position = body + size + (size & 1)
+        else:
+            raise ValueError(f"{self._path} has no data chunk.")
+
+        tag, channels, sample_rate, _, block_align, bits = fmt
+        if tag == _FORMAT_EXTENSIBLE and subformat is not None:
+            tag = subformat
+        if tag not in (_FORMAT_PCM, _FORMAT_FLOAT):
+            raise ValueError(f"{self._path} uses unsupported WAV format {tag:#x}.")
+        if channels < 1 or sample_rate < 1 or bits % 8 or not bits:
+            raise ValueError(f"{self._path} has an invalid fmt chunk.")
+        if block_align != channels * bits // 8:
+            raise ValueError(f"{self._path} has an inconsistent block alignment.")
+        self._is_float = tag == _FORMAT_FLOAT
+        self._channels = channels
+        self._sample_rate = sample_rate
+        self._sample_width = bits // 8
+        self._block_align = block_align
+
+    def _validate(self, config: VoiceConfig) -> None:
+        if config.format != AudioFormat.wav:
+            raise ValueError(f"Session expects {config.format.value}, not wav audio.")
+        if self._sample_rate != config.sample_rate:
+            raise ValueError(
+                f"{self._path} is {self._sample_rate} Hz; "
+                f"session expects {config.sample_rate} Hz."
+            )
+        if self._channels != config.channels:
+            raise ValueError(
+                f"{self._path} has {self._channels} channel(s); "
+                f"session expects {config.channels}."
+            )
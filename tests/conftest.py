@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -59,6 +60,29 @@ def hindi_utterance() -> Utterance:
     )
 
 
+@pytest.fixture()
+def make_utterance() -> Callable[..., Utterance]:
+    """Factory for utterances; end_ms defaults to 10 ms after start_ms."""
+
+    def make(
+        text: str = "test",
+        start_ms: float = 0.0,
+        end_ms: float | None = None,
+        *,
+        language: str = "en",
+        confidence: float = 0.9,
+    ) -> Utterance:
+        return Utterance(
+            text=text,
+            language=language,
+            start_ms=start_ms,
+            end_ms=start_ms + 10.0 if end_ms is None else end_ms,
+            confidence=confidence,
+        )
+
+    return make
+
+
 @pytest.fixture()
 def active_session(
     manager: VoiceSessionManager,
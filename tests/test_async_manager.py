@@ -0,0 +1,148 @@
+"""Tests for the asyncio session manager."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.async_manager import AsyncVoiceSessionManager
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig
+from aumai_voicefirst.storage import WriteAheadLogStorage
+from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+
+class TestAsyncVoiceSessionManager:
+    async def test_create_add_and_transcript(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = AsyncVoiceSessionManager()
+        session = await manager.create_session(english_config)
+        await manager.add_utterance(session, make_utterance("hello", 0.0))
+        await manager.add_utterances(session, [make_utterance("world", 20.0)])
+        assert await manager.get_session(session.session_id) is session
+        assert await manager.get_transcript(session) == "hello\nworld"
+
+    async def test_concurrent_tasks_on_one_session(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = AsyncVoiceSessionManager()
+        session = await manager.create_session(english_config)
+        await asyncio.gather(
+            *(
+                manager.add_utterance(session, make_utterance(str(i), float(i)))
+                for i in range(200)
+            )
+        )
+        expected = "\n".join(str(i) for i in range(200))
+        assert await manager.get_transcript(session) == expected
+
+    async def test_stream_yields_new_utterances(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = AsyncVoiceSessionManager()
+        session = await manager.create_session(english_config)
+        await manager.add_utterance(session, make_utterance("before", 0.0))
+
+        async def consume() -> list[str]:
+            return [u.text async for u in manager.stream(session)]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        await manager.add_utterance(session, make_utterance("one", 20.0))
+        await manager.add_utterances(
+            session, [make_utterance("three", 40.0), make_utterance("two", 30.0)]
+        )
+        await manager.set_state(session, "completed")
+        assert await consumer == ["one", "two", "three"]
+
+    async def test_stream_replay(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = AsyncVoiceSessionManager()
+        session = await manager.create_session(english_config)
+        await manager.add_utterance(session, make_utterance("b", 10.0))
+        await manager.add_utterance(session, make_utterance("a", 0.0))
+        stream = manager.stream(session, replay=True)
+        assert (await anext(stream)).text == "a"
+        assert (await anext(stream)).text == "b"
+        await manager.add_utterance(session, make_utterance("c", 20.0))
+        assert (await anext(stream)).text == "c"
+        await stream.aclose()
+        assert not manager._subscribers
+
+    async def test_slow_consumer_is_dropped_without_blocking_writers(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = AsyncVoiceSessionManager(stream_buffer=3)
+        session = await manager.create_session(english_config)
+        slow = manager.stream(session)
+        fast = manager.stream(session)
+        first = asyncio.ensure_future(anext(slow))
+        received = asyncio.ensure_future(anext(fast))
+        await asyncio.sleep(0)
+        for i in range(5):
+            await manager.add_utterance(session, make_utterance(str(i), float(i)))
+            assert (await received).text == str(i)
+            received = asyncio.ensure_future(anext(fast))
+        assert (await first).text == "0"
+        assert [(await anext(slow)).text for _ in range(3)] == ["1", "2", "3"]
+        with pytest.raises(RuntimeError):
+            await anext(slow)
+        await manager.set_state(session, "completed")
+        with pytest.raises(StopAsyncIteration):
+            await received
+
+    def test_stream_buffer_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            AsyncVoiceSessionManager(stream_buffer=0)
+
+    async def test_stream_of_finished_session_ends(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = AsyncVoiceSessionManager()
+        session = await manager.create_session(english_config)
+        await manager.add_utterance(session, make_utterance("done", 0.0))
+        await manager.set_state(session, "completed")
+        assert [u.text async for u in manager.stream(session, replay=True)] == ["done"]
+
+    async def test_close_ends_streams(self, english_config: VoiceConfig) -> None:
+        manager = AsyncVoiceSessionManager()
+        session = await manager.create_session(english_config)
+        consumer = asyncio.create_task(
+            asyncio.wait_for(_drain(manager, session), timeout=5)
+        )
+        await asyncio.sleep(0)
+        await manager.close()
+        assert await consumer == 0
+
+    async def test_offloaded_storage(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = AsyncVoiceSessionManager(
+            ThreadSafeVoiceSessionManager(WriteAheadLogStorage(tmp_path))
+        )
+        session = await manager.create_session(english_config)
+        await asyncio.gather(
+            *(
+                manager.add_utterance(session, make_utterance(str(i), float(i)))
+                for i in range(50)
+            )
+        )
+        await manager.close()
+        recovered = VoiceSessionManager(WriteAheadLogStorage(tmp_path))
+        assert len(recovered.get_session(session.session_id).utterances) == 50
+
+    def test_offload_requires_thread_safe_manager(self) -> None:
+        with pytest.raises(ValueError):
+            AsyncVoiceSessionManager(VoiceSessionManager(), offload=True)
+
+
+async def _drain(manager: AsyncVoiceSessionManager, session: object) -> int:
+    return len([u async for u in manager.stream(session)])  # type: ignore[arg-type]
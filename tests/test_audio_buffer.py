@@ -0,0 +1,151 @@
+"""Tests for per-session audio ring buffers."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from aumai_voicefirst.audio_buffer import AudioRingBuffer
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import VoiceConfig, VoiceSession
+
+# 8 kHz mono 16-bit: 16 bytes per millisecond.
+_CONFIG = VoiceConfig(language="en", sample_rate=8000)
+
+
+def _pcm(start: int, count: int) -> bytes:
+    """Return count 16-bit samples whose low byte counts up from start."""
+    return b"".join(((start + i) % 256).to_bytes(2, "little") for i in range(count))
+
+
+def _join(parts: tuple[memoryview, ...]) -> bytes:
+    return b"".join(parts)
+
+
+class TestAudioRingBuffer:
+    def test_sized_from_config(self) -> None:
+        stereo = VoiceConfig(language="en", sample_rate=16000, channels=2)
+        buffer = AudioRingBuffer(stereo, 0.5)
+        assert buffer.capacity == 16000 * 2 * 2 // 2
+        assert buffer.block_align == 4
+        assert len(buffer) == 0
+
+    def test_window_by_time(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 1.0)
+        buffer.write(_pcm(0, 800))
+        assert buffer.end_ms == 100.0
+        assert _join(buffer.window(10.0, 20.0)) == _pcm(80, 80)
+        assert _join(buffer.latest(5.0)) == _pcm(760, 40)
+        assert buffer.window(200.0) == ()
+
+    def test_overwrite_keeps_newest_and_wraps_zero_copy(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 0.1)  # 800 samples
+        buffer.write(_pcm(0, 600))
+        buffer.write(_pcm(600, 600))
+        assert len(buffer) == buffer.capacity
+        assert buffer.start_ms == 50.0
+        parts = buffer.window(50.0)
+        assert len(parts) == 2
+        assert all(part.readonly for part in parts)
+        assert _join(parts) == _pcm(400, 800)
+        with pytest.raises(ValueError, match="no longer retained"):
+            buffer.window(10.0)
+
+    def test_oversized_overwrite_write(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 0.01)  # 80 samples
+        buffer.write(_pcm(0, 200))
+        assert buffer.start_ms == 15.0
+        assert _join(buffer.window(15.0)) == _pcm(120, 80)
+
+    def test_read_consumes_and_counts_drops(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 0.01)
+        buffer.write(_pcm(0, 50))
+        assert _join(buffer.read(41)) == _pcm(0, 20)
+        assert buffer.unread == 60
+        buffer.write(_pcm(50, 60))
+        assert buffer.dropped == 20  # bytes of samples 20-29
+        assert _join(buffer.read()) == _pcm(30, 80)
+        assert buffer.read() == ()
+
+    def test_block_policy_waits_for_reader(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 0.01, policy="block")
+        buffer.write(_pcm(0, 80))
+        with pytest.raises(TimeoutError):
+            buffer.write(_pcm(80, 1), timeout=0.01)
+        writer = threading.Thread(target=buffer.write, args=(_pcm(80, 40),))
+        writer.start()
+        assert _join(buffer.read(80)) == _pcm(0, 40)
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        assert _join(buffer.read()) == _pcm(40, 80)
+        assert buffer.dropped == 0
+        with pytest.raises(ValueError):
+            buffer.write(_pcm(0, 81))
+
+    def test_close_wakes_blocked_writer(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 0.01, policy="block")
+        buffer.write(_pcm(0, 80))
+        errors: list[BaseException] = []
+
+        def write() -> None:
+            try:
+                buffer.write(_pcm(0, 1))
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        buffer.close()
+        writer.join(timeout=5)
+        assert len(errors) == 1
+        assert len(buffer.read()) == 1
+
+    def test_rejects_partial_frames_and_bad_arguments(self) -> None:
+        buffer = AudioRingBuffer(_CONFIG, 0.01)
+        with pytest.raises(ValueError):
+            buffer.write(b"\0")
+        with pytest.raises(ValueError):
+            buffer.window(20.0, 10.0)
+        with pytest.raises(ValueError):
+            AudioRingBuffer(_CONFIG, 0.0)
+        with pytest.raises(ValueError):
+            AudioRingBuffer(_CONFIG, policy="drop")  # type: ignore[arg-type]
+
+
+class TestManagerAudio:
+    def test_open_and_account(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        buffer = manager.open_audio(active_session, 1.0)
+        assert manager.open_audio(active_session) is buffer
+        assert manager.audio_buffer(active_session) is buffer
+        buffer.write(_pcm(0, 100))
+        stats = manager.audio_stats()
+        assert stats.buffers == 1
+        assert stats.allocated_bytes == buffer.capacity
+        assert stats.buffered_bytes == stats.unread_bytes == 200
+
+    def test_budget(self, english_config: VoiceConfig) -> None:
+        manager = VoiceSessionManager(audio_budget=100_000)
+        first = manager.create_session(english_config)
+        second = manager.create_session(english_config)
+        manager.open_audio(first, 2.0)
+        with pytest.raises(ValueError, match="audio budget"):
+            manager.open_audio(second, 2.0)
+        manager.release_audio(first)
+        manager.open_audio(second, 2.0)
+        assert manager.audio_stats().buffers == 1
+
+    def test_finished_sessions_release_audio(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        buffer = manager.open_audio(active_session, 0.1)
+        manager.set_state(active_session, "completed")
+        assert manager.audio_stats().allocated_bytes == 0
+        with pytest.raises(KeyError):
+            manager.audio_buffer(active_session)
+        with pytest.raises(RuntimeError):
+            buffer.write(b"\0\0")
+        with pytest.raises(ValueError):
+            manager.open_audio(active_session)
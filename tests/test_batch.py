@@ -0,0 +1,92 @@
+"""Tests for parallel batch transcript extraction."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.batch import collect_paths, run_batch, transcribe_file
+from aumai_voicefirst.models import Utterance, VoiceConfig, VoiceSession
+from aumai_voicefirst.packed import pack_session
+
+
+def _session(name: str, count: int) -> VoiceSession:
+    session = VoiceSession(session_id=name, config=VoiceConfig(language="en"))
+    session.utterances.extend(
+        Utterance(
+            text=f"{name} {i}",
+            language="en",
+            start_ms=float(count - i),
+            end_ms=float(count - i + 1),
+            confidence=1.0,
+        )
+        for i in range(count)
+    )
+    return session
+
+
+@pytest.fixture()
+def export_dir(tmp_path: Path) -> Path:
+    for index in range(6):
+        session = _session(f"s{index}", index)
+        (tmp_path / f"s{index}.json").write_text(session.model_dump_json(), encoding="utf-8")
+    (tmp_path / "p.avfs").write_bytes(pack_session(_session("p", 2)))
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "n.json").write_text(
+        _session("n", 1).model_dump_json(), encoding="utf-8"
+    )
+    return tmp_path
+
+
+class TestCollectPaths:
+    def test_directory(self, export_dir: Path) -> None:
+        names = [path.name for path in collect_paths(export_dir)]
+        assert names == ["p.avfs"] + [f"s{i}.json" for i in range(6)]
+
+    def test_glob(self, export_dir: Path) -> None:
+        assert len(collect_paths(export_dir / "s*.json")) == 6
+        assert len(collect_paths(f"{export_dir}/**/*.json")) == 7
+        assert collect_paths(export_dir / "*.missing") == []
+
+
+class TestTranscribeFile:
+    def test_json_and_packed(self, export_dir: Path) -> None:
+        result = transcribe_file(export_dir / "s2.json")
+        assert result.ok
+        assert result.transcript == "s2 1\ns2 0"
+        assert result.lines == 2
+        packed = transcribe_file(export_dir / "p.avfs")
+        assert packed.transcript == "p 1\np 0"
+
+    def test_errors_are_reported(self, tmp_path: Path) -> None:
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json", encoding="utf-8")
+        result = transcribe_file(bad)
+        assert not result.ok
+        assert result.error
+        assert not transcribe_file(tmp_path / "missing.json").ok
+
+    def test_malformed_packed_file_is_reported(self, tmp_path: Path) -> None:
+        data = pack_session(_session("p", 1))
+        size = int.from_bytes(data[12:16], "little")
+        bad = tmp_path / "bad.avfs"
+        bad.write_bytes(data[:32] + b"[]".ljust(size) + data[32 + size :])
+        result = transcribe_file(bad)
+        assert not result.ok
+        assert "malformed" in (result.error or "")
+
+
+class TestRunBatch:
+    @pytest.mark.parametrize(("workers", "chunksize"), [(1, None), (2, 2), (3, None)])
+    def test_results_keep_input_order(
+        self, export_dir: Path, workers: int, chunksize: int | None
+    ) -> None:
+        paths = collect_paths(export_dir)
+        results = list(run_batch(paths, workers=workers, chunksize=chunksize))
+        assert [r.path for r in results] == [str(p) for p in paths]
+        assert [r.lines for r in results] == [2, 0, 1, 2, 3, 4, 5]
+
+    def test_rejects_bad_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            list(run_batch([], workers=0))
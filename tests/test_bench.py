@@ -0,0 +1,76 @@
+"""Tests for the benchmark suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from aumai_voicefirst.bench import (
+    BENCHMARKS,
+    BenchmarkReport,
+    BenchmarkResult,
+    Workload,
+    compare,
+    run_benchmarks,
+)
+
+_TINY = Workload(session_size=20, rounds=2, out_of_order=0.3)
+
+
+def _report(ops_per_sec: float, p99_us: float, memory: int | None) -> BenchmarkReport:
+    result = BenchmarkResult(
+        ops=10,
+        ops_per_sec=ops_per_sec,
+        p50_us=1.0,
+        p99_us=p99_us,
+        peak_memory_bytes=memory,
+    )
+    return BenchmarkReport(workload=_TINY, results={"route": result})
+
+
+class TestRunBenchmarks:
+    def test_all_benchmarks(self) -> None:
+        report = run_benchmarks(_TINY)
+        assert list(report.results) == list(BENCHMARKS)
+        assert report.results["add_utterance"].ops == 40
+        assert report.results["json_roundtrip"].ops == 2
+        for result in report.results.values():
+            assert result.ops_per_sec > 0
+            assert 0 < result.p50_us <= result.p99_us
+            assert result.peak_memory_bytes is not None
+
+    def test_selection_without_memory(self) -> None:
+        report = run_benchmarks(_TINY, ["route"], measure_memory=False)
+        assert list(report.results) == ["route"]
+        assert report.results["route"].peak_memory_bytes is None
+
+    def test_report_round_trips_as_json(self) -> None:
+        report = run_benchmarks(_TINY, ["create_session"])
+        assert BenchmarkReport.model_validate_json(report.model_dump_json()) == report
+
+    def test_unknown_benchmark(self) -> None:
+        with pytest.raises(ValueError, match="Unknown benchmark"):
+            run_benchmarks(_TINY, ["nope"])
+
+
+class TestCompare:
+    def test_within_tolerance(self) -> None:
+        assert compare(_report(95.0, 10.5, 1050), _report(100.0, 10.0, 1000)) == []
+
+    def test_regressions(self) -> None:
+        lines = compare(_report(80.0, 12.0, 2000), _report(100.0, 10.0, 1000))
+        assert len(lines) == 3
+        assert lines[0].startswith("route: ops/s 100 -> 80")
+
+    def test_tolerance_and_missing_memory(self) -> None:
+        assert (
+            compare(
+                _report(80.0, 10.0, None), _report(100.0, 10.0, 1000), tolerance=0.25
+            )
+            == []
+        )
+
+    def test_workload_mismatch(self) -> None:
+        other = _report(1.0, 1.0, None)
+        other.workload = Workload(session_size=21)
+        with pytest.raises(ValueError, match="different workload"):
+            compare(_report(1.0, 1.0, None), other)
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
+from aumai_voicefirst import cli
+from aumai_voicefirst.bench import BENCHMARKS
 from aumai_voicefirst.cli import main
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import AudioFormat, Utterance, VoiceConfig, VoiceSession
+from aumai_voicefirst.packed import PackedSession, pack_session
 
 
 def _fresh_runner() -> CliRunner:
@@ -28,6 +36,60 @@ class TestCLIVersion:
         assert "VoiceFirst" in result.output or "voice" in result.output.lower()
 
 
+# Cold import of the CLI module, measured at about 75 ms (280 ms when every
+# subcommand's dependencies were imported eagerly); most of it is click.
+_IMPORT_BUDGET_S = 0.15
+_HEAVY_MODULES = (
+    "pydantic",
+    "numpy",
+    "concurrent.futures",
+    "aumai_voicefirst.core",
+    "aumai_voicefirst.models",
+    "aumai_voicefirst.bench",
+    "aumai_voicefirst.batch",
+)
+
+
+def _run_python(*args: str) -> str:
+    completed = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+    return completed.stdout + completed.stderr
+
+
+class TestCLIStartup:
+    def test_help_imports_no_heavy_modules(self) -> None:
+        loaded = _run_python(
+            "-c",
+            "import sys\n"
+            "from aumai_voicefirst import cli\n"
+            "cli.main(['--help'], standalone_mode=False)\n"
+            "assert cli._manager is None\n"
+            "print('\\n'.join(sys.modules))",
+        ).split()
+        assert "Usage:" in loaded
+        heavy = [m for m in loaded if m.startswith(_HEAVY_MODULES)]
+        assert heavy == []
+
+    @pytest.mark.skipif(
+        not os.environ.get("VOICEFIRST_TIMING_TESTS"),
+        reason="wall-clock budget; set VOICEFIRST_TIMING_TESTS=1 to run",
+    )
+    def test_import_time_budget(self) -> None:
+        timings = []
+        for _ in range(3):
+            report = _run_python("-X", "importtime", "-c", "import aumai_voicefirst.cli")
+            line = next(
+                line for line in report.splitlines() if line.endswith("| aumai_voicefirst.cli")
+            )
+            timings.append(int(line.split("|")[1]) / 1e6)
+        assert min(timings) < _IMPORT_BUDGET_S
+
+    def test_choices_match_their_sources(self) -> None:
+        assert cli._AUDIO_FORMATS == tuple(f.value for f in AudioFormat)
+        assert cli._BENCHMARKS == BENCHMARKS
+
+
 class TestSessionCommand:
     def test_session_default_language(self) -> None:
         result = _fresh_runner().invoke(main, ["session"])
@@ -90,6 +152,16 @@ class TestSessionCommand:
         result = _fresh_runner().invoke(main, ["session", "--output", str(output)])
         assert "my_session.json" in result.output or str(output) in result.output
 
+    def test_session_saves_packed_file(self, tmp_path: Path) -> None:
+        output = tmp_path / "session.avfs"
+        result = _fresh_runner().invoke(
+            main,
+            ["session", "--language", "ta", "--output", str(output), "--output-format", "packed"],
+        )
+        assert result.exit_code == 0
+        packed = PackedSession.from_file(output)
+        assert packed.config.language == "ta"
+
     def test_session_help(self) -> None:
         result = _fresh_runner().invoke(main, ["session", "--help"])
         assert result.exit_code == 0
@@ -147,7 +219,134 @@ class TestTranscriptCommand:
         assert lines[0] == "first line"
         assert lines[1] == "second line"
 
+    def test_transcript_detects_packed_file(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        english_utterance: Utterance,
+        tmp_path: Path,
+    ) -> None:
+        manager.add_utterance(active_session, english_utterance)
+        session_file = tmp_path / "session.bin"
+        session_file.write_bytes(pack_session(active_session))
+        result = _fresh_runner().invoke(main, ["transcript", "--session", str(session_file)])
+        assert result.exit_code == 0
+        assert "Hello, how are you?" in result.output
+
+    def test_transcript_presorted(self, session_json_file: Path) -> None:
+        result = _fresh_runner().invoke(
+            main, ["transcript", "--session", str(session_json_file), "--presorted"]
+        )
+        assert result.exit_code == 0
+        assert "Hello, how are you?" in result.output
+
+    def test_transcript_presorted_unordered_errors(self, tmp_path: Path) -> None:
+        session_file = tmp_path / "unordered.json"
+        session_file.write_text(
+            '{"utterances": [{"text": "b", "start_ms": 5}, {"text": "a", "start_ms": 1}]}',
+            encoding="utf-8",
+        )
+        result = _fresh_runner().invoke(
+            main, ["transcript", "--session", str(session_file), "--presorted"]
+        )
+        assert result.exit_code != 0
+        assert "not ordered" in result.output
+
     def test_transcript_help(self) -> None:
         result = _fresh_runner().invoke(main, ["transcript", "--help"])
         assert result.exit_code == 0
         assert "session" in result.output.lower()
+
+
+class TestBatchCommand:
+    @pytest.fixture()
+    def exports(self, tmp_path: Path) -> Path:
+        for name, text in (("a", "alpha"), ("b", "beta")):
+            session = VoiceSession(session_id=name, config=VoiceConfig(language="en"))
+            session.utterances.append(
+                Utterance(text=text, language="en", start_ms=0.0, end_ms=1.0, confidence=1.0)
+            )
+            (tmp_path / f"{name}.json").write_text(session.model_dump_json(), encoding="utf-8")
+        return tmp_path
+
+    def test_batch_text_output(self, exports: Path) -> None:
+        result = _fresh_runner().invoke(main, ["batch", str(exports), "--workers", "2"])
+        assert result.exit_code == 0
+        assert result.output.index("alpha") < result.output.index("beta")
+        assert "Processed 2 files (0 failed)" in result.output
+
+    def test_batch_jsonl_output_file(self, exports: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out" / "all.jsonl"
+        output.parent.mkdir()
+        result = _fresh_runner().invoke(
+            main,
+            ["batch", str(exports / "*.json"), "--output-format", "jsonl", "--output", str(output)],
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert [r["transcript"] for r in records] == ["alpha", "beta"]
+        assert all(r["error"] is None for r in records)
+
+    def test_batch_reports_failures(self, exports: Path) -> None:
+        (exports / "c.json").write_text("[]", encoding="utf-8")
+        result = _fresh_runner().invoke(main, ["batch", str(exports), "--workers", "1"])
+        assert result.exit_code == 1
+        assert "(1 failed)" in result.output
+        assert "c.json" in result.output
+
+    def test_batch_text_output_marks_failures(self, exports: Path, tmp_path: Path) -> None:
+        (exports / "c.json").write_text("[]", encoding="utf-8")
+        output = tmp_path / "all.txt"
+        result = _fresh_runner().invoke(
+            main, ["batch", str(exports), "--workers", "1", "--output", str(output)]
+        )
+        assert result.exit_code == 1
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert lines[-1].startswith(f"==> {exports / 'c.json'} <== failed: ")
+
+    def test_batch_no_matches(self, tmp_path: Path) -> None:
+        result = _fresh_runner().invoke(main, ["batch", str(tmp_path / "*.json")])
+        assert result.exit_code != 0
+        assert "No session files" in result.output
+
+
+class TestBenchCommand:
+    _ARGS = [
+        "bench",
+        "--session-size",
+        "10",
+        "--rounds",
+        "1",
+        "--only",
+        "route",
+        "--only",
+        "add_utterance",
+    ]
+
+    def test_bench_writes_json(self) -> None:
+        result = _fresh_runner().invoke(main, [*self._ARGS, "--no-memory"])
+        assert result.exit_code == 0
+        payload = result.output[result.output.index("{") : result.output.rindex("}") + 1]
+        report = json.loads(payload)
+        assert set(report["results"]) == {"route", "add_utterance"}
+        assert report["results"]["route"]["ops_per_sec"] > 0
+
+    def test_bench_against_baseline(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        result = _fresh_runner().invoke(main, [*self._ARGS, "--output", str(baseline)])
+        assert result.exit_code == 0
+        data = json.loads(baseline.read_text(encoding="utf-8"))
+        data["results"]["route"]["ops_per_sec"] *= 1000
+        baseline.write_text(json.dumps(data), encoding="utf-8")
+        result = _fresh_runner().invoke(main, [*self._ARGS, "--baseline", str(baseline)])
+        assert result.exit_code == 1
+        assert "REGRESSION route: ops/s" in result.output
+
+    def test_bench_rejects_mismatched_baseline(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        _fresh_runner().invoke(main, [*self._ARGS, "--output", str(baseline)])
+        result = _fresh_runner().invoke(
+            main, [*self._ARGS, "--seed", "1", "--baseline", str(baseline)]
+        )
+        assert result.exit_code != 0
+        assert "different workload" in result.output
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import pickle
+from collections.abc import Callable
+
 import pytest
+from pydantic import ValidationError
 
 from aumai_voicefirst.core import VoiceRouter, VoiceSessionManager
 from aumai_voicefirst.models import (
     AudioFormat,
     TextToSpeechConfig,
     Utterance,
+    UtteranceList,
     VoiceConfig,
     VoiceSession,
 )
+from aumai_voicefirst.registry import SessionRegistry
 
 
 # ---------------------------------------------------------------------------
@@ -242,6 +248,20 @@ class TestVoiceSessionManager:
         transcript = manager.get_transcript(active_session)
         assert transcript == "line one\nline two"
 
+    def test_session_hooks(self, english_config: VoiceConfig) -> None:
+        manager = VoiceSessionManager(registry=SessionRegistry(max_sessions=1))
+        transitions: list[tuple[str, str]] = []
+        discarded: list[str] = []
+        manager.add_state_listener(lambda previous, state: transitions.append((previous, state)))
+        manager.add_discard_listener(lambda session: discarded.append(session.session_id))
+        done = manager.create_session(english_config)
+        manager.set_state(done, "completed")
+        assert [s.session_id for s in manager.sessions()] == [done.session_id]
+        live = manager.create_session(english_config)
+        assert transitions == [("active", "completed")]
+        assert discarded == [done.session_id]
+        assert list(manager.sessions()) == [live]
+
 
 # ---------------------------------------------------------------------------
 # VoiceRouter tests
@@ -305,3 +325,310 @@ class TestVoiceRouter:
         for lang in indic_langs:
             result = router.route(self._make_utterance(lang))
             assert result == "handler.indic", f"Expected indic handler for {lang}"
+
+    def test_script_subtag_decides_family(self, router: VoiceRouter) -> None:
+        assert router.route(self._make_utterance("pa-Arab")) == "handler.arabic"
+        assert router.route(self._make_utterance("pa-Guru-IN")) == "handler.indic"
+        assert router.route(self._make_utterance("sd-Deva")) == "handler.indic"
+        assert router.route(self._make_utterance("sd-Arab-PK")) == "handler.arabic"
+        assert router.route(self._make_utterance("ur-Arab")) == "handler.arabic"
+
+    def test_shared_languages_without_script_route_to_indic(
+        self, router: VoiceRouter
+    ) -> None:
+        for lang in ("ur", "ks", "sd", "ur-PK"):
+            assert router.route(self._make_utterance(lang)) == "handler.indic"
+
+    def test_unmapped_script_falls_back_to_language(self, router: VoiceRouter) -> None:
+        assert router.route(self._make_utterance("ja-Latn")) == "handler.cjk"
+        assert router.route(self._make_utterance("zh-Hant-TW")) == "handler.cjk"
+        assert router.route(self._make_utterance("en-Latn-US")) == "handler.default"
+
+    def test_tag_parsing_is_lenient(self, router: VoiceRouter) -> None:
+        assert router.route(self._make_utterance("PA_arab")) == "handler.arabic"
+        assert router.route(self._make_utterance("hi-x-Arab")) == "handler.indic"
+
+    def test_route_cache_is_bounded(self) -> None:
+        router = VoiceRouter(cache_size=2)
+        for lang in ("hi", "en", "ja", "hi"):
+            router.route(self._make_utterance(lang))
+        info = router._resolve.cache_info()
+        assert info.maxsize == 2
+        assert info.currsize == 2
+
+    def test_invalid_cache_size(self) -> None:
+        with pytest.raises(ValueError):
+            VoiceRouter(cache_size=0)
+
+    def test_route_many_groups_indices_by_handler(self, router: VoiceRouter) -> None:
+        utterances = [
+            self._make_utterance(lang) for lang in ("hi", "en", "ja", "hi-IN", "ur-Arab")
+        ]
+        assert router.route_many(utterances) == {
+            "handler.indic": [0, 3],
+            "handler.default": [1],
+            "handler.cjk": [2],
+            "handler.arabic": [4],
+        }
+
+    def test_route_many_resolves_each_tag_once(self) -> None:
+        router = VoiceRouter()
+        utterances = [self._make_utterance(lang) for lang in ("hi", "en") * 50]
+        groups = router.route_many(utterances)
+        assert len(groups["handler.indic"]) == 50
+        assert router._resolve.cache_info().misses == 2
+        assert router._resolve.cache_info().hits == 0
+
+    def test_route_many_accepts_sessions(
+        self, router: VoiceRouter, manager: VoiceSessionManager, english_config: VoiceConfig
+    ) -> None:
+        for compact in (False, True):
+            session = manager.create_session(english_config, compact=compact)
+            manager.add_utterances(
+                session,
+                [
+                    Utterance(
+                        text="x", language=lang, start_ms=float(i), end_ms=i + 1.0,
+                        confidence=0.9,
+                    )
+                    for i, lang in enumerate(("zh", "ar", "zh"))
+                ],
+            )
+            assert router.route_many(session) == {
+                "handler.cjk": [0, 2],
+                "handler.arabic": [1],
+            }
+
+    def test_route_many_empty(self, router: VoiceRouter) -> None:
+        assert router.route_many([]) == {}
+
+
+class TestOrderedUtterancesAndTranscriptCache:
+    def test_late_utterance_inserted_in_start_order(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        for text, start in (("a", 0.0), ("c", 200.0), ("b", 100.0)):
+            manager.add_utterance(active_session, make_utterance(text, start))
+        assert [u.text for u in active_session.utterances] == ["a", "b", "c"]
+
+    def test_equal_start_keeps_arrival_order(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("x", 0.0))
+        manager.add_utterance(active_session, make_utterance("y", 500.0))
+        manager.add_utterance(active_session, make_utterance("first-at-100", 100.0))
+        manager.add_utterance(active_session, make_utterance("second-at-100", 100.0))
+        assert manager.get_transcript(active_session).split("\n") == [
+            "x",
+            "first-at-100",
+            "second-at-100",
+            "y",
+        ]
+
+    def test_repeated_transcript_is_cached(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("one", 0.0))
+        first = manager.get_transcript(active_session)
+        assert manager.get_transcript(active_session) is first
+
+    def test_cache_extends_with_in_order_appends(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("one", 0.0))
+        assert manager.get_transcript(active_session) == "one"
+        manager.add_utterance(active_session, make_utterance("two", 100.0))
+        manager.add_utterance(active_session, make_utterance("three", 200.0))
+        assert manager.get_transcript(active_session) == "one\ntwo\nthree"
+
+    def test_out_of_order_arrival_invalidates_cache(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("two", 100.0))
+        assert manager.get_transcript(active_session) == "two"
+        manager.add_utterance(active_session, make_utterance("one", 0.0))
+        assert manager.get_transcript(active_session) == "one\ntwo"
+
+    def test_replaced_utterance_list_is_not_served_from_cache(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("old", 0.0))
+        manager.get_transcript(active_session)
+        active_session.utterances = [make_utterance("new", 0.0)]
+        assert manager.get_transcript(active_session) == "new"
+
+    def test_direct_out_of_order_append_still_sorted(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("two", 100.0))
+        manager.get_transcript(active_session)
+        active_session.utterances.append(make_utterance("one", 0.0))
+        assert manager.get_transcript(active_session) == "one\ntwo"
+
+    def test_cache_not_serialized(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("one", 0.0))
+        manager.get_transcript(active_session)
+        assert "_transcript" not in active_session.model_dump_json()
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_in_place_replacement_invalidates_cache(
+        self,
+        manager: VoiceSessionManager,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+        compact: bool,
+    ) -> None:
+        session = manager.create_session(english_config, compact=compact)
+        manager.add_utterances(
+            session, [make_utterance("a", 0.0), make_utterance("b", 1.0)]
+        )
+        assert manager.get_transcript(session) == "a\nb"
+        session.utterances[0] = make_utterance("z", 0.0)
+        assert manager.get_transcript(session) == "z\nb"
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_pop_and_append_invalidates_cache(
+        self,
+        manager: VoiceSessionManager,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+        compact: bool,
+    ) -> None:
+        session = manager.create_session(english_config, compact=compact)
+        manager.add_utterances(
+            session, [make_utterance("a", 0.0), make_utterance("b", 1.0)]
+        )
+        assert manager.get_transcript(session) == "a\nb"
+        session.utterances.pop()
+        session.utterances.append(make_utterance("c", 2.0))
+        assert manager.get_transcript(session) == "a\nc"
+
+    def test_validated_sessions_track_rewrites(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSession(
+            session_id="s", config=english_config, utterances=[make_utterance()]
+        )
+        assert isinstance(session.utterances, UtteranceList)
+        restored = pickle.loads(pickle.dumps(session.utterances))
+        assert restored == session.utterances
+        assert restored.generation == 0
+
+    def test_hand_assigned_list_is_not_cached(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        active_session.utterances = [make_utterance("a", 0.0)]
+        assert manager.get_transcript(active_session) == "a"
+        active_session.utterances[0] = make_utterance("b", 0.0)
+        assert manager.get_transcript(active_session) == "b"
+
+
+class TestAddUtterances:
+    def _row(self, text: str, start_ms: float) -> dict[str, object]:
+        return {
+            "text": text,
+            "language": "en",
+            "start_ms": start_ms,
+            "end_ms": start_ms + 100.0,
+            "confidence": 0.9,
+        }
+
+    def test_validates_raw_dicts(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        manager.add_utterances(active_session, [self._row("a", 0), self._row("b", 100)])
+        assert all(isinstance(u, Utterance) for u in active_session.utterances)
+        assert manager.get_transcript(active_session) == "a\nb"
+
+    def test_invalid_row_rejects_whole_batch(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        bad = self._row("bad", 100) | {"confidence": 2.0}
+        with pytest.raises(ValidationError):
+            manager.add_utterances(active_session, [self._row("ok", 0), bad])
+        assert len(active_session.utterances) == 0
+
+    def test_batch_sorted_before_append(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        manager.add_utterances(
+            active_session, [self._row("c", 200), self._row("a", 0), self._row("b", 100)]
+        )
+        assert manager.get_transcript(active_session) == "a\nb\nc"
+
+    def test_batch_merged_with_existing(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        manager.add_utterances(active_session, [self._row("a", 0), self._row("c", 200)])
+        assert manager.get_transcript(active_session) == "a\nc"
+        manager.add_utterances(
+            active_session, [self._row("d", 300), self._row("b", 100)]
+        )
+        assert manager.get_transcript(active_session) == "a\nb\nc\nd"
+
+    def test_existing_utterances_precede_equal_starts(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        manager.add_utterances(active_session, [self._row("old", 100), self._row("z", 500)])
+        manager.add_utterances(active_session, [self._row("new", 100)])
+        assert manager.get_transcript(active_session) == "old\nnew\nz"
+
+    def test_trusted_mode_accepts_utterances(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        batch = [Utterance.model_validate(self._row(str(i), i)) for i in range(3)]
+        manager.add_utterances(active_session, batch, trusted=True)
+        assert active_session.utterances == batch
+
+    def test_checks_state(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        active_session.state = "completed"
+        with pytest.raises(ValueError, match="completed"):
+            manager.add_utterances(active_session, [self._row("a", 0)])
+
+    def test_keeps_range_index_current(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        manager.add_utterances(active_session, [self._row("a", 0)])
+        assert list(manager.transcript_slice(active_session, 0, 50)) == ["a"]
+        manager.add_utterances(active_session, [self._row("b", 1_000)])
+        manager.add_utterances(active_session, [self._row("late", 20)])
+        assert list(manager.transcript_slice(active_session, 0, 50)) == ["a", "late"]
+
+    def test_compact_session_merge(
+        self, manager: VoiceSessionManager, english_config: VoiceConfig
+    ) -> None:
+        session = manager.create_session(english_config, compact=True)
+        manager.add_utterances(session, [self._row("a", 0), self._row("c", 200)])
+        manager.add_utterances(session, [self._row("b", 100)])
+        assert manager.get_transcript(session) == "a\nb\nc"
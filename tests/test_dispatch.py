@@ -0,0 +1,173 @@
+"""Tests for the concurrent handler dispatcher."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import wait
+from operator import attrgetter
+
+import pytest
+
+from aumai_voicefirst.core import VoiceRouter, VoiceSessionManager
+from aumai_voicefirst.dispatch import HandlerDispatcher
+from aumai_voicefirst.models import Utterance, VoiceConfig
+
+
+class TestHandlerDispatcher:
+    def test_routes_to_registered_handlers(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+        with HandlerDispatcher() as dispatcher:
+            dispatcher.register_handler("handler.indic", lambda u: f"indic:{u.text}")
+            dispatcher.register_handler("handler.default", lambda u: f"default:{u.text}")
+            futures = [
+                dispatcher.submit(session, make_utterance("a", language="hi")),
+                dispatcher.submit(session, make_utterance("b", language="en")),
+            ]
+            assert [f.result(timeout=5) for f in futures] == ["indic:a", "default:b"]
+
+    def test_unregistered_handler(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+        with HandlerDispatcher() as dispatcher:
+            with pytest.raises(KeyError):
+                dispatcher.submit(session, make_utterance("a", language="ja"))
+
+    def test_completion_is_in_order_per_session(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+        release = threading.Event()
+        completed: list[str] = []
+
+        def slow(utterance: Utterance) -> str:
+            release.wait(5)
+            return utterance.text
+
+        with HandlerDispatcher() as dispatcher:
+            dispatcher.register_handler("handler.indic", slow)
+            dispatcher.register_handler("handler.default", attrgetter("text"), workers=4)
+            futures = dispatcher.submit_many(
+                session,
+                [
+                    make_utterance("0", language="hi"),
+                    *(make_utterance(str(i)) for i in range(1, 20)),
+                ],
+            )
+            for future in futures:
+                future.add_done_callback(lambda f: completed.append(f.result()))
+            time.sleep(0.05)
+            assert completed == []
+            release.set()
+            wait(futures, timeout=5)
+        assert completed == [str(i) for i in range(20)]
+
+    def test_slow_family_does_not_block_other_sessions(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = VoiceSessionManager()
+        indic_session = manager.create_session(english_config)
+        english_session = manager.create_session(english_config)
+        release = threading.Event()
+        with HandlerDispatcher() as dispatcher:
+            dispatcher.register_handler("handler.indic", lambda u: release.wait(5))
+            dispatcher.register_handler("handler.default", attrgetter("text"))
+            blocked = dispatcher.submit(
+                indic_session, make_utterance("a", language="hi")
+            )
+            done = dispatcher.submit(english_session, make_utterance("b"))
+            assert done.result(timeout=5) == "b"
+            assert not blocked.done()
+            release.set()
+
+    def test_backpressure(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+        release = threading.Event()
+        with HandlerDispatcher() as dispatcher:
+            dispatcher.register_handler(
+                "handler.default", lambda u: release.wait(5), max_pending=2
+            )
+            dispatcher.submit(session, make_utterance("a"))
+            dispatcher.submit(session, make_utterance("b"))
+            with pytest.raises(TimeoutError):
+                dispatcher.submit(session, make_utterance("c"), timeout=0.01)
+            release.set()
+            future = dispatcher.submit(session, make_utterance("d"), timeout=5)
+            assert future.result(timeout=5)
+
+    def test_worker_limit(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def tracked(utterance: Utterance) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.005)
+            with lock:
+                active -= 1
+
+        with HandlerDispatcher() as dispatcher:
+            dispatcher.register_handler("handler.default", tracked, workers=3)
+            utterances = [make_utterance(str(i)) for i in range(30)]
+            wait(dispatcher.submit_many(session, utterances))
+        assert peak <= 3
+
+    def test_errors_propagate_in_order(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+
+        def fail(utterance: Utterance) -> str:
+            if utterance.text == "bad":
+                raise RuntimeError("boom")
+            return utterance.text
+
+        with HandlerDispatcher() as dispatcher:
+            dispatcher.register_handler("handler.default", fail)
+            first, second = dispatcher.submit_many(
+                session, [make_utterance("bad"), make_utterance("ok")]
+            )
+            with pytest.raises(RuntimeError):
+                first.result(timeout=5)
+            assert second.result(timeout=5) == "ok"
+
+    def test_process_pool(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = VoiceSessionManager()
+        session = manager.create_session(english_config)
+        manager.add_utterances(
+            session, [make_utterance(str(i), start_ms=i) for i in range(8)]
+        )
+        with HandlerDispatcher(VoiceRouter()) as dispatcher:
+            dispatcher.register_handler(
+                "handler.default", attrgetter("text"), workers=2, pool="process"
+            )
+            futures = dispatcher.submit_many(session)
+            assert [f.result(timeout=30) for f in futures] == [str(i) for i in range(8)]
+
+    def test_register_and_close_errors(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        session = VoiceSessionManager().create_session(english_config)
+        dispatcher = HandlerDispatcher()
+        dispatcher.register_handler("handler.default", attrgetter("text"))
+        with pytest.raises(ValueError):
+            dispatcher.register_handler("handler.default", attrgetter("text"))
+        with pytest.raises(ValueError):
+            dispatcher.register_handler("handler.cjk", attrgetter("text"), workers=0)
+        dispatcher.close()
+        with pytest.raises(RuntimeError):
+            dispatcher.submit(session, make_utterance("a"))
@@ -0,0 +1,123 @@
+"""Tests for session ID generation."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.ids import UUID7Generator, random_id, timestamp_ms, uuid7
+from aumai_voicefirst.models import VoiceConfig
+from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+_MS = 1_000_000
+
+
+class _Clock:
+    def __init__(self, now_ms: int) -> None:
+        self.now_ms = now_ms
+
+    def __call__(self) -> int:
+        return self.now_ms * _MS
+
+
+class TestUUID7Generator:
+    def test_ids_are_uuid7_with_timestamp(self) -> None:
+        generate = UUID7Generator(clock=_Clock(1_700_000_000_123), seed=1)
+        session_id = generate()
+        parsed = uuid.UUID(session_id)
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == session_id
+        assert timestamp_ms(session_id) == 1_700_000_000_123
+
+    def test_ids_sort_by_creation_time(self) -> None:
+        clock = _Clock(1_000)
+        generate = UUID7Generator(clock=clock, seed=2)
+        ids = []
+        for now_ms in (1_000, 1_000, 1_001, 5_000, 5_000, 5_000):
+            clock.now_ms = now_ms
+            ids.append(generate())
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert [timestamp_ms(i) for i in ids] == [1_000, 1_000, 1_001, 5_000, 5_000, 5_000]
+
+    def test_clock_going_backwards_stays_monotonic(self) -> None:
+        clock = _Clock(2_000)
+        generate = UUID7Generator(clock=clock, seed=3)
+        first = generate()
+        clock.now_ms = 1_500
+        second = generate()
+        assert second > first
+        assert timestamp_ms(second) == 2_000
+
+    def test_counter_overflow_borrows_next_millisecond(self) -> None:
+        generate = UUID7Generator(clock=_Clock(3_000), seed=4)
+        first = generate()
+        generate._counter = (1 << 74) - 1
+        second = generate()
+        assert second > first
+        assert timestamp_ms(second) == 3_001
+
+    def test_seed_is_reproducible(self) -> None:
+        ids = [UUID7Generator(clock=_Clock(9), seed=5)() for _ in range(2)]
+        assert ids[0] == ids[1]
+
+    def test_unique_across_threads(self) -> None:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            batches = list(pool.map(lambda _: [uuid7() for _ in range(2_000)], range(8)))
+        ids = [i for batch in batches for i in batch]
+        assert len(set(ids)) == len(ids)
+        for batch in batches:
+            assert batch == sorted(batch)
+
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_forked_child_does_not_repeat_parent_ids(self) -> None:
+        generate = UUID7Generator(clock=_Clock(7_000), seed=6)
+        generate()
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            os.write(write_end, " ".join(generate() for _ in range(5)).encode())
+            os._exit(0)
+        os.close(write_end)
+        parent_ids = {generate() for _ in range(5)}
+        with os.fdopen(read_end, "rb") as pipe:
+            child_ids = set(pipe.read().decode().split())
+        os.waitpid(pid, 0)
+        assert len(child_ids) == 5
+        assert not parent_ids & child_ids
+
+
+class TestTimestamp:
+    def test_rejects_other_ids(self) -> None:
+        with pytest.raises(ValueError, match="UUIDv7"):
+            timestamp_ms(random_id())
+        with pytest.raises(ValueError, match="not a UUID"):
+            timestamp_ms("session-1")
+
+
+class TestManagerIds:
+    def test_default_ids_follow_creation_order(
+        self, manager: VoiceSessionManager, english_config: VoiceConfig
+    ) -> None:
+        ids = [manager.create_session(english_config).session_id for _ in range(50)]
+        assert ids == sorted(ids)
+        assert all(uuid.UUID(i).version == 7 for i in ids)
+
+    def test_custom_factory(self, english_config: VoiceConfig) -> None:
+        counter = iter(range(3))
+        manager = VoiceSessionManager(id_factory=lambda: f"s-{next(counter)}")
+        session = manager.create_session(english_config)
+        assert session.session_id == "s-0"
+        assert manager.get_session("s-0") is session
+
+    def test_random_ids(self, english_config: VoiceConfig) -> None:
+        manager = ThreadSafeVoiceSessionManager(id_factory=random_id)
+        session = manager.create_session(english_config)
+        assert uuid.UUID(session.session_id).version == 4
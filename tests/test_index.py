@@ -0,0 +1,163 @@
+"""Tests for the utterance time-range index."""
+
+from __future__ import annotations
+
+import random
+from array import array
+from collections.abc import Callable
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.index import UtteranceIndex
+from aumai_voicefirst.models import Utterance, VoiceSession
+
+
+def _brute_force(
+    utterances: list[Utterance], start_ms: float, end_ms: float
+) -> list[Utterance]:
+    ordered = sorted(utterances, key=lambda u: u.start_ms)
+    return [u for u in ordered if u.start_ms <= end_ms and u.end_ms >= start_ms]
+
+
+class _CountingArray(array):
+    reads = 0
+
+    def __getitem__(self, index: int) -> float:
+        self.reads += 1
+        return float(super().__getitem__(index))
+
+
+class TestUtteranceIndex:
+    def test_empty_index_yields_nothing(self) -> None:
+        assert list(UtteranceIndex().overlapping(0.0, 1000.0)) == []
+
+    def test_overlapping_window(self, make_utterance: Callable[..., Utterance]) -> None:
+        a = make_utterance("a", 0, 100)
+        b = make_utterance("b", 150, 300)
+        c = make_utterance("c", 400, 500)
+        index = UtteranceIndex([a, b, c])
+        assert list(index.overlapping(90.0, 160.0)) == [a, b]
+
+    def test_window_bounds_are_inclusive(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        a, b = make_utterance("a", 0, 100), make_utterance("b", 200, 300)
+        index = UtteranceIndex([a, b])
+        assert list(index.overlapping(100.0, 200.0)) == [a, b]
+
+    def test_long_utterance_spanning_window_is_found(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        long = make_utterance("long", 0, 10_000)
+        short = make_utterance("short", 100, 200)
+        index = UtteranceIndex([long, short])
+        assert list(index.overlapping(5_000.0, 6_000.0)) == [long]
+
+    def test_long_utterance_does_not_force_linear_scans(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        background = make_utterance("background", 0, 1e9)
+        short = [make_utterance(str(i), i * 100, i * 100 + 50) for i in range(10_000)]
+        index = UtteranceIndex([background, *short])
+        index._tree = tree = _CountingArray("d", index._tree)
+        found = list(index.overlapping(500_000, 500_200))
+        assert found == [background, short[5_000], short[5_001], short[5_002]]
+        assert tree.reads < 200
+
+    def test_point_query(self, make_utterance: Callable[..., Utterance]) -> None:
+        a, b = make_utterance("a", 0, 100), make_utterance("b", 50, 150)
+        index = UtteranceIndex([a, b])
+        assert list(index.at(75.0)) == [a, b]
+        assert list(index.at(125.0)) == [b]
+
+    def test_inverted_window_raises(self) -> None:
+        with pytest.raises(ValueError):
+            UtteranceIndex().overlapping(10.0, 5.0)
+
+    def test_late_add_matches_brute_force(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        rng = random.Random(7)
+        utterances = []
+        index = UtteranceIndex()
+        for i in range(300):
+            start = rng.uniform(0, 60_000)
+            utterance = make_utterance(str(i), start, start + rng.uniform(0, 5_000))
+            utterances.append(utterance)
+            index.add(utterance)
+        for _ in range(50):
+            start = rng.uniform(0, 65_000)
+            end = start + rng.uniform(0, 3_000)
+            assert list(index.overlapping(start, end)) == _brute_force(
+                utterances, start, end
+            )
+
+
+class TestManagerRangeQueries:
+    def test_index_maintained_by_add_utterance(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("b", 200, 300))
+        assert [u.text for u in manager.utterances_at(active_session, 250)] == ["b"]
+        manager.add_utterance(active_session, make_utterance("a", 0, 260))
+        manager.add_utterance(active_session, make_utterance("c", 400, 500))
+        assert active_session._index is not None
+        assert len(active_session._index) == 3
+        found = manager.utterances_in_range(active_session, 250, 450)
+        assert [u.text for u in found] == ["a", "b", "c"]
+
+    def test_index_rebuilt_after_direct_list_edit(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("a", 0, 100))
+        assert len(list(manager.utterances_at(active_session, 50))) == 1
+        active_session.utterances.append(make_utterance("b", 40, 60))
+        assert [u.text for u in manager.utterances_at(active_session, 50)] == [
+            "a",
+            "b",
+        ]
+
+    def test_index_rebuilt_after_in_place_replacement(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager.add_utterance(active_session, make_utterance("a", 0, 100))
+        assert len(list(manager.utterances_at(active_session, 50))) == 1
+        active_session.utterances[0] = make_utterance("b", 200, 300)
+        assert list(manager.utterances_at(active_session, 50)) == []
+        assert [u.text for u in manager.utterances_at(active_session, 250)] == ["b"]
+
+    def test_transcript_slice_streams_texts(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        for text, start in (("one", 0), ("two", 1_000), ("three", 2_000)):
+            manager.add_utterance(
+                active_session, make_utterance(text, start, start + 500)
+            )
+        lines = manager.transcript_slice(active_session, 900, 2_100)
+        assert next(lines) == "two"
+        assert list(lines) == ["three"]
+
+    def test_unsorted_session_is_queried_in_start_order(
+        self,
+        manager: VoiceSessionManager,
+        active_session: VoiceSession,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        active_session.utterances.extend(
+            [make_utterance("late", 500, 600), make_utterance("early", 0, 550)]
+        )
+        found = manager.utterances_in_range(active_session, 0, 1_000)
+        assert [u.text for u in found] == ["early", "late"]
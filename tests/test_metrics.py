@@ -0,0 +1,229 @@
+"""Tests for hot-path instrumentation."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aumai_voicefirst.core import VoiceRouter, VoiceSessionManager
+from aumai_voicefirst.metrics import Metrics, Observation
+from aumai_voicefirst.models import Utterance, VoiceConfig
+from aumai_voicefirst.registry import SessionRegistry
+from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+_COUNT = 'voicefirst_operation_seconds_count{{operation="{}"}}'
+_ERRORS = 'voicefirst_operation_errors_total{{operation="{}"}}'
+
+
+def _samples(text: str) -> dict[str, float]:
+    samples: dict[str, float] = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class TestDisabled:
+    def test_methods_are_untouched(self) -> None:
+        manager = VoiceSessionManager()
+        router = VoiceRouter()
+        assert "add_utterance" not in vars(manager)
+        assert "route" not in vars(router)
+
+    def test_instrumentation_is_per_instance(
+        self, english_config: VoiceConfig
+    ) -> None:
+        metrics = Metrics()
+        VoiceSessionManager(metrics=metrics)
+        plain = VoiceSessionManager()
+        plain.create_session(english_config)
+        samples = _samples(metrics.render())
+        assert samples[_COUNT.format("create_session")] == 0
+
+
+class TestMetrics:
+    def test_manager_operations(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        metrics = Metrics()
+        manager = VoiceSessionManager(metrics=metrics)
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance())
+        manager.add_utterances(
+            session, [make_utterance(start_ms=10.0), make_utterance(start_ms=20.0)]
+        )
+        manager.get_transcript(session)
+        samples = _samples(metrics.render())
+        assert samples[_COUNT.format("add_utterance")] == 1
+        assert samples[_COUNT.format("get_transcript")] == 1
+        assert samples["voicefirst_utterances_added_total"] == 3
+        assert samples['voicefirst_sessions{state="active"}'] == 1
+
+    def test_histogram_buckets_are_cumulative(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        metrics = Metrics(buckets=[1e-9, 10.0])
+        manager = VoiceSessionManager(metrics=metrics)
+        session = manager.create_session(english_config)
+        for start in range(5):
+            manager.add_utterance(session, make_utterance(start_ms=float(start)))
+        samples = _samples(metrics.render())
+        bucket = 'voicefirst_operation_seconds_bucket{{operation="add_utterance",le="{}"}}'
+        assert samples[bucket.format("1e-09")] == 0
+        assert samples[bucket.format("10.0")] == 5
+        assert samples[bucket.format("+Inf")] == 5
+        assert samples['voicefirst_operation_seconds_sum{operation="add_utterance"}'] > 0
+
+    def test_errors_are_counted(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        metrics = Metrics()
+        manager = VoiceSessionManager(metrics=metrics)
+        session = manager.create_session(english_config)
+        manager.set_state(session, "completed")
+        with pytest.raises(ValueError):
+            manager.add_utterance(session, make_utterance())
+        samples = _samples(metrics.render())
+        assert samples[_ERRORS.format("add_utterance")] == 1
+        assert samples[_COUNT.format("add_utterance")] == 1
+        assert samples["voicefirst_utterances_added_total"] == 0
+
+    def test_sessions_by_state(self, english_config: VoiceConfig) -> None:
+        manager = VoiceSessionManager()
+        existing = manager.create_session(english_config)
+        manager.set_state(existing, "paused")
+        metrics = Metrics()
+        metrics.instrument_manager(manager)
+        first = manager.create_session(english_config)
+        manager.create_session(english_config)
+        manager.set_state(first, "completed")
+        manager.set_state(existing, "active")
+        samples = _samples(metrics.render())
+        assert samples['voicefirst_sessions{state="active"}'] == 2
+        assert samples['voicefirst_sessions{state="paused"}'] == 0
+        assert samples['voicefirst_sessions{state="completed"}'] == 1
+
+    def test_discarded_sessions_leave_the_gauge(
+        self, english_config: VoiceConfig
+    ) -> None:
+        metrics = Metrics()
+        manager = VoiceSessionManager(
+            registry=SessionRegistry(max_sessions=1), metrics=metrics
+        )
+        done = manager.create_session(english_config)
+        manager.set_state(done, "completed")
+        manager.create_session(english_config)
+        samples = _samples(metrics.render())
+        assert samples['voicefirst_sessions{state="active"}'] == 1
+        assert samples['voicefirst_sessions{state="completed"}'] == 0
+
+    def test_concurrent_set_state_keeps_gauge_exact(
+        self, english_config: VoiceConfig
+    ) -> None:
+        metrics = Metrics()
+        manager = ThreadSafeVoiceSessionManager(metrics=metrics)
+        session = manager.create_session(english_config)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                states = ("active", "paused") * 2_000
+                list(pool.map(lambda state: manager.set_state(session, state), states))
+        finally:
+            sys.setswitchinterval(interval)
+        samples = _samples(metrics.render())
+        gauge = {
+            key: value
+            for key, value in samples.items()
+            if key.startswith("voicefirst_sessions")
+        }
+        assert gauge[f'voicefirst_sessions{{state="{session.state}"}}'] == 1
+        assert sum(gauge.values()) == 1
+
+    def test_routes_by_handler(self, make_utterance: Callable[..., Utterance]) -> None:
+        metrics = Metrics()
+        router = VoiceRouter(metrics=metrics)
+        router.route(make_utterance(language="hi"))
+        router.route_many(
+            [
+                make_utterance(language="ja"),
+                make_utterance(start_ms=1.0, language="hi"),
+                make_utterance(start_ms=2.0),
+            ]
+        )
+        samples = _samples(metrics.render())
+        assert samples['voicefirst_routes_total{handler="handler.indic"}'] == 2
+        assert samples['voicefirst_routes_total{handler="handler.cjk"}'] == 1
+        assert samples['voicefirst_routes_total{handler="handler.default"}'] == 1
+        assert samples[_COUNT.format("route_many")] == 1
+
+    def test_label_values_are_escaped(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        metrics = Metrics()
+        router = VoiceRouter(metrics=metrics)
+        router.register("tlh", 'handler."quoted"\\')
+        router.route(make_utterance(language="tlh"))
+        assert 'handler="handler.\\"quoted\\"\\\\"' in metrics.render()
+
+    def test_threadsafe_manager(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        metrics = Metrics()
+        manager = ThreadSafeVoiceSessionManager(stripes=4, metrics=metrics)
+        sessions = [manager.create_session(english_config) for _ in range(8)]
+
+        def worker(index: int) -> None:
+            for start in range(250):
+                manager.add_utterance(
+                    sessions[index], make_utterance(start_ms=float(start))
+                )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+        samples = _samples(metrics.render())
+        assert samples["voicefirst_utterances_added_total"] == 2000
+        assert samples[_COUNT.format("add_utterance")] == 2000
+
+    def test_invalid_buckets(self) -> None:
+        with pytest.raises(ValueError, match="ascending"):
+            Metrics(buckets=[])
+        with pytest.raises(ValueError, match="ascending"):
+            Metrics(buckets=[0.1, 0.1])
+
+
+class TestHooks:
+    def test_hooks_observe_calls(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        seen: list[Observation] = []
+        metrics = Metrics(hooks=[seen.append])
+        manager = VoiceSessionManager(metrics=metrics)
+        session = manager.create_session(english_config)
+        manager.set_state(session, "completed")
+        with pytest.raises(ValueError):
+            manager.add_utterance(session, make_utterance())
+        assert [o.operation for o in seen] == [
+            "create_session",
+            "set_state",
+            "add_utterance",
+        ]
+        assert all(o.duration_ns > 0 and o.start_ns > 0 for o in seen)
+        assert isinstance(seen[-1].error, ValueError)
+        assert seen[0].error is None
+
+    def test_remove_hook(self, make_utterance: Callable[..., Utterance]) -> None:
+        seen: list[Observation] = []
+        metrics = Metrics()
+        router = VoiceRouter(metrics=metrics)
+        metrics.add_hook(seen.append)
+        router.route(make_utterance())
+        metrics.remove_hook(seen.append)
+        router.route(make_utterance())
+        assert len(seen) == 1
+        with pytest.raises(ValueError):
+            metrics.remove_hook(seen.append)
@@ -0,0 +1,84 @@
+"""Tests for the packed binary session format."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig, VoiceSession
+from aumai_voicefirst.packed import MAGIC, PackedSession, is_packed, pack_session
+from aumai_voicefirst.store import UtteranceStore
+
+
+def _utterances() -> list[Utterance]:
+    return [
+        Utterance(text="नमस्ते", language="hi", start_ms=0.0, end_ms=400.0, confidence=0.9),
+        Utterance(text="hello", language="en", start_ms=500.0, end_ms=900.0, confidence=0.8),
+        Utterance(text="", language="hi", start_ms=1000.0, end_ms=1000.0, confidence=0.0),
+    ]
+
+
+class TestPackedSession:
+    def test_round_trip(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        manager.add_utterances(active_session, _utterances())
+        manager.set_state(active_session, "paused")
+        data = pack_session(active_session)
+        assert is_packed(data)
+        decoded = PackedSession(data).to_session()
+        assert isinstance(decoded.utterances, UtteranceStore)
+        assert decoded.model_dump() == active_session.model_dump()
+
+    def test_metadata_and_languages(self, active_session: VoiceSession) -> None:
+        active_session.utterances = UtteranceStore(_utterances())
+        packed = PackedSession(pack_session(active_session))
+        assert packed.session_id == active_session.session_id
+        assert packed.config == active_session.config
+        assert packed.state == "active"
+        assert len(packed) == 3
+        assert packed.languages == ["hi", "en"]
+
+    def test_transcript_matches_manager(self, english_config: VoiceConfig) -> None:
+        session = VoiceSession(session_id="s", config=english_config)
+        first, second, third = _utterances()
+        # Stored out of order, with a start time tie kept in stored order.
+        tie = Utterance(text="tie", language="en", start_ms=0.0, end_ms=1.0, confidence=1.0)
+        session.utterances.extend([second, first, tie, third])
+        expected = VoiceSessionManager().get_transcript(session)
+        assert PackedSession(pack_session(session)).transcript() == expected
+        assert expected.splitlines()[:3] == ["नमस्ते", "tie", "hello"]
+
+    def test_empty_session(self, active_session: VoiceSession) -> None:
+        packed = PackedSession(pack_session(active_session))
+        assert len(packed) == 0
+        assert packed.transcript() == ""
+        assert list(packed.to_session().utterances) == []
+
+    def test_rejects_other_data(self, active_session: VoiceSession) -> None:
+        with pytest.raises(ValueError, match="not a packed"):
+            PackedSession(active_session.model_dump_json().encode())
+        data = pack_session(active_session)
+        with pytest.raises(ValueError, match="version"):
+            PackedSession(MAGIC + b"\x09\x00" + data[len(MAGIC) + 2 :])
+        active_session.utterances.extend(_utterances())
+        with pytest.raises(ValueError, match="truncated"):
+            PackedSession(pack_session(active_session)[:-1])
+
+    @pytest.mark.parametrize("metadata", [b"[]", b'{"session_id":"s"}'])
+    def test_rejects_malformed_metadata(
+        self, active_session: VoiceSession, metadata: bytes
+    ) -> None:
+        data = pack_session(active_session)
+        size = int.from_bytes(data[12:16], "little")
+        # Pad to the original size with JSON whitespace so the layout holds.
+        patched = data[:32] + metadata.ljust(size) + data[32 + size :]
+        with pytest.raises(ValueError, match="metadata is malformed"):
+            PackedSession(patched)
+
+    def test_from_file(self, active_session: VoiceSession, tmp_path: Path) -> None:
+        path = tmp_path / "session.avfs"
+        path.write_bytes(pack_session(active_session))
+        assert PackedSession.from_file(path).session_id == active_session.session_id
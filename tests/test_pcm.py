@@ -0,0 +1,116 @@
+"""Tests for PCM conversion and downmix."""
+
+from __future__ import annotations
+
+import struct
+import tracemalloc
+import wave
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.wav import WavReader
+
+np = pytest.importorskip("numpy")
+
+from aumai_voicefirst.pcm import PcmConverter, downmix, pcm_to_float32  # noqa: E402
+
+
+def _int24(values: list[int]) -> bytes:
+    return b"".join(v.to_bytes(3, "little", signed=True) for v in values)
+
+
+class TestPcmToFloat32:
+    def test_int16(self) -> None:
+        data = struct.pack("<4h", -32768, -1, 0, 16384)
+        out = pcm_to_float32(data, 2)
+        assert out.dtype == np.float32
+        assert out.tolist() == [-1.0, -1 / 32768, 0.0, 0.5]
+
+    def test_int24(self) -> None:
+        values = [-(2**23), -1, 0, 2**22, 2**23 - 1]
+        out = pcm_to_float32(_int24(values), 3)
+        np.testing.assert_allclose(out, np.array(values) / 2**23, rtol=1e-6)
+
+    def test_int32_uint8_and_float(self) -> None:
+        assert pcm_to_float32(struct.pack("<2i", -(2**31), 2**30), 4).tolist() == [
+            -1.0,
+            0.5,
+        ]
+        assert pcm_to_float32(bytes([0, 128, 192]), 1).tolist() == [-1.0, 0.0, 0.5]
+        floats = struct.pack("<2f", 0.25, -0.75)
+        assert pcm_to_float32(floats, 4, is_float=True).tolist() == [0.25, -0.75]
+
+    def test_writes_into_out(self) -> None:
+        out = np.zeros(8, dtype=np.float32)
+        result = pcm_to_float32(struct.pack("<2h", 16384, -16384), 2, out=out)
+        assert np.shares_memory(result, out)
+        assert out[:3].tolist() == [0.5, -0.5, 0.0]
+
+    def test_invalid_input(self) -> None:
+        with pytest.raises(ValueError):
+            pcm_to_float32(b"\0\0\0", 2)
+        with pytest.raises(ValueError):
+            pcm_to_float32(b"\0" * 5, 5)
+        with pytest.raises(ValueError):
+            pcm_to_float32(b"\0" * 4, 2, out=np.zeros(1, dtype=np.float32))
+        with pytest.raises(ValueError):
+            pcm_to_float32(b"\0" * 4, 2, out=np.zeros(2, dtype=np.float64))
+
+
+class TestDownmix:
+    def test_stereo_average(self) -> None:
+        stereo = np.array([1.0, 0.0, 0.5, 0.5, -1.0, 1.0], dtype=np.float32)
+        out = np.empty(3, dtype=np.float32)
+        assert downmix(stereo, 2, out=out) is not stereo
+        assert out.tolist() == [0.5, 0.5, 0.0]
+
+    def test_mono_is_returned_unchanged(self) -> None:
+        mono = np.zeros(4, dtype=np.float32)
+        assert downmix(mono, 1) is mono
+
+    def test_length_must_match_channels(self) -> None:
+        with pytest.raises(ValueError):
+            downmix(np.zeros(3, dtype=np.float32), 2)
+
+
+class TestPcmConverter:
+    def test_stereo_int24_frames(self) -> None:
+        converter = PcmConverter(3, 2, frame_samples=2)
+        frame = _int24([2**22, 0, -(2**22), -(2**22)])
+        assert converter.convert(frame).tolist() == [0.25, -0.5]
+
+    def test_reuses_buffers(self) -> None:
+        converter = PcmConverter(2, 2, frame_samples=4096)
+        frame = struct.pack("<8192h", *range(8192))
+        first = converter.convert(frame)
+        tracemalloc.start()
+        for _ in range(20):
+            second = converter.convert(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert np.shares_memory(first, second)
+        assert peak < 4096
+
+    def test_grows_for_larger_frames(self) -> None:
+        converter = PcmConverter(2, frame_samples=1)
+        assert converter.convert(struct.pack("<3h", 0, 0, 16384)).tolist() == [
+            0.0,
+            0.0,
+            0.5,
+        ]
+
+    def test_for_reader(self, tmp_path: Path) -> None:
+        path = tmp_path / "stereo.wav"
+        with wave.open(str(path), "wb") as handle:
+            handle.setnchannels(2)
+            handle.setsampwidth(2)
+            handle.setframerate(8000)
+            handle.writeframes(struct.pack("<320h", *([16384, 0] * 160)))
+        with WavReader(path, frame_ms=10.0) as reader:
+            converter = PcmConverter.for_reader(reader)
+            for frame in reader.frames():
+                mono = converter.convert(frame)
+                assert len(mono) == 80
+                assert np.all(mono == 0.25)
+            del frame
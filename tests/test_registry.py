@@ -0,0 +1,205 @@
+"""Tests for the bounded session registry."""
+
+from __future__ import annotations
+
+import gc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig
+from aumai_voicefirst.registry import SessionRegistry
+from aumai_voicefirst.store import UtteranceStore
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSessionRegistry:
+    def test_unbounded_by_default(
+        self, manager: VoiceSessionManager, english_config: VoiceConfig
+    ) -> None:
+        sessions = [manager.create_session(english_config) for _ in range(50)]
+        assert manager.get_session(sessions[0].session_id) is sessions[0]
+        assert manager.registry_stats().evictions == 0
+
+    def test_max_sessions_spills_least_recently_used(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        registry = SessionRegistry(max_sessions=2, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        first = manager.create_session(english_config)
+        manager.add_utterance(first, make_utterance("kept on disk", 0.0))
+        manager.create_session(english_config)
+        third = manager.create_session(english_config)
+
+        stats = manager.registry_stats()
+        assert stats.resident_sessions == 2
+        assert stats.spilled_sessions == 1
+        assert stats.evictions == 1
+        assert (tmp_path / f"{first.session_id}.json").exists()
+
+        reloaded = manager.get_session(first.session_id)
+        assert manager.get_transcript(reloaded) == "kept on disk"
+        assert manager.get_session(third.session_id) is third
+        stats = manager.registry_stats()
+        assert stats.reloads == 1
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+    def test_finished_sessions_without_spill_directory_are_discarded(
+        self, english_config: VoiceConfig
+    ) -> None:
+        manager = VoiceSessionManager(registry=SessionRegistry(max_sessions=1))
+        first = manager.create_session(english_config)
+        manager.set_state(first, "completed")
+        manager.create_session(english_config)
+        with pytest.raises(KeyError):
+            manager.get_session(first.session_id)
+
+    def test_live_sessions_without_spill_directory_are_kept(
+        self, english_config: VoiceConfig
+    ) -> None:
+        clock = [0.0]
+        registry = SessionRegistry(max_sessions=1, idle_ttl=5, clock=lambda: clock[0])
+        manager = VoiceSessionManager(registry=registry)
+        active = manager.create_session(english_config)
+        paused = manager.create_session(english_config)
+        manager.set_state(paused, "paused")
+        errored = manager.create_session(english_config)
+        manager.set_state(errored, "error")
+        clock[0] = 10.0
+        latest = manager.create_session(english_config)
+        assert manager.get_session(active.session_id) is active
+        assert manager.get_session(paused.session_id) is paused
+        assert manager.get_session(latest.session_id) is latest
+        with pytest.raises(KeyError):
+            manager.get_session(errored.session_id)
+        assert manager.registry_stats().resident_sessions == 3
+
+    def test_max_bytes(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        registry = SessionRegistry(max_bytes=20_000, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        big = manager.create_session(english_config)
+        manager.add_utterances(
+            big, [make_utterance("x" * 100, float(i)) for i in range(20)]
+        )
+        manager.create_session(english_config)
+        assert manager.registry_stats().spilled_sessions == 1
+        assert manager.registry_stats().resident_bytes <= 20_000
+
+    def test_idle_ttl_expires_sessions(
+        self, tmp_path: Path, english_config: VoiceConfig
+    ) -> None:
+        clock = _FakeClock()
+        registry = SessionRegistry(idle_ttl=60, spill_directory=tmp_path, clock=clock)
+        manager = VoiceSessionManager(registry=registry)
+        idle = manager.create_session(english_config)
+        clock.now = 30
+        busy = manager.create_session(english_config)
+        clock.now = 70
+        registry.sweep()
+        stats = manager.registry_stats()
+        assert stats.expirations == 1
+        assert stats.spilled_sessions == 1
+        assert manager.get_session(idle.session_id).session_id == idle.session_id
+        assert manager.get_session(busy.session_id) is busy
+
+    def test_completed_sessions_are_evicted_first(
+        self, tmp_path: Path, english_config: VoiceConfig
+    ) -> None:
+        registry = SessionRegistry(max_sessions=2, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        live = manager.create_session(english_config)
+        done = manager.create_session(english_config)
+        manager.set_state(done, "completed")
+        manager.create_session(english_config)
+        assert manager.get_session(live.session_id) is live
+        assert (tmp_path / f"{done.session_id}.json").exists()
+
+    def test_caller_reference_to_spilled_session_is_readmitted(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        registry = SessionRegistry(max_sessions=1, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        held = manager.create_session(english_config)
+        manager.create_session(english_config)
+        manager.add_utterance(held, make_utterance("still counted", 0.0))
+        assert manager.get_session(held.session_id) is held
+
+    def test_spilled_session_keeps_its_identity(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        registry = SessionRegistry(max_sessions=1, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        held = manager.create_session(english_config)
+        manager.create_session(english_config)
+        assert any(session is held for session in registry.sessions())
+        assert registry.get(held.session_id) is held
+
+        manager.create_session(english_config)
+        copy = held.model_copy(deep=True)
+        registry.touch(copy)
+        manager.add_utterance(held, make_utterance("kept", 0.0))
+        assert registry.get(held.session_id) is held
+        registry.touch(copy)
+        assert registry.get(held.session_id) is held
+
+    def test_unreferenced_spilled_session_reloads_from_disk(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        registry = SessionRegistry(max_sessions=1, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance("from disk", 0.0))
+        session_id = session.session_id
+        manager.create_session(english_config)
+        del session
+        gc.collect()
+        assert manager.get_transcript(manager.get_session(session_id)) == "from disk"
+
+    def test_leftover_spill_files_are_removed(self, tmp_path: Path) -> None:
+        (tmp_path / "old.json").write_text("{}")
+        (tmp_path / "old.tmp").write_text("{")
+        registry = SessionRegistry(spill_directory=tmp_path)
+        assert list(tmp_path.iterdir()) == []
+        assert len(registry) == 0
+
+    def test_compact_sessions_reload_compact(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        registry = SessionRegistry(max_sessions=1, spill_directory=tmp_path)
+        manager = VoiceSessionManager(registry=registry)
+        compact = manager.create_session(english_config, compact=True)
+        manager.add_utterance(compact, make_utterance("packed", 0.0))
+        manager.create_session(english_config)
+        reloaded = manager.get_session(compact.session_id)
+        assert isinstance(reloaded.utterances, UtteranceStore)
+        assert manager.get_transcript(reloaded) == "packed"
@@ -0,0 +1,81 @@
+"""Tests for the polyphase resampler."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from aumai_voicefirst.models import VoiceConfig
+
+np = pytest.importorskip("numpy")
+
+from aumai_voicefirst.resample import Resampler, _kernel, resample  # noqa: E402
+
+_RATE_PAIRS = [(8000, 16000), (48000, 16000), (44100, 16000), (22050, 16000), (16000, 8000)]
+
+
+def _tone(rate: int, seconds: float, frequency: float) -> object:
+    t = np.arange(int(rate * seconds)) / rate
+    return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+
+
+class TestResample:
+    @pytest.mark.parametrize(("src", "dst"), _RATE_PAIRS)
+    def test_preserves_in_band_tone(self, src: int, dst: int) -> None:
+        samples = _tone(src, 0.5, 1000.0)
+        out = resample(samples, src, dst)
+        assert len(out) == math.ceil(len(samples) * dst / src)
+        expected = _tone(dst, 0.5, 1000.0)[: len(out)]
+        interior = slice(100, len(out) - 100)
+        assert np.max(np.abs(out[interior] - expected[interior])) < 1e-3
+
+    def test_rejects_aliasing_tone(self) -> None:
+        # 6 kHz cannot be represented at 8 kHz and must be filtered out.
+        out = resample(_tone(16000, 0.5, 6000.0), 16000, 8000)
+        assert np.sqrt(np.mean(out[100:-100] ** 2)) < 1e-3
+
+    def test_equal_rates_pass_through(self) -> None:
+        samples = np.random.default_rng(0).standard_normal(500).astype(np.float32)
+        assert np.array_equal(resample(samples, 16000, 16000), samples)
+
+    @pytest.mark.parametrize(("src", "dst"), _RATE_PAIRS)
+    def test_streaming_matches_one_shot(self, src: int, dst: int) -> None:
+        samples = np.random.default_rng(1).standard_normal(src // 4).astype(np.float32)
+        resampler = Resampler(src, dst)
+        parts = [resampler.process(samples[i : i + 173]) for i in range(0, len(samples), 173)]
+        parts.append(resampler.flush())
+        np.testing.assert_allclose(
+            np.concatenate(parts), resample(samples, src, dst), atol=1e-6
+        )
+
+    def test_latency_is_bounded(self) -> None:
+        resampler = Resampler(8000, 16000, taps=32)
+        out = resampler.process(np.zeros(160, dtype=np.float32))
+        assert 320 - len(out) <= 2 * 16
+
+    def test_flush_resets_the_stream(self) -> None:
+        resampler = Resampler(8000, 16000)
+        samples = _tone(8000, 0.1, 500.0)
+        first = np.concatenate((resampler.process(samples), resampler.flush()))
+        second = np.concatenate((resampler.process(samples), resampler.flush()))
+        assert np.array_equal(first, second)
+
+    def test_kernels_are_cached_and_shared(self) -> None:
+        _kernel.cache_clear()
+        resamplers = [Resampler(8000, 16000) for _ in range(100)]
+        assert _kernel.cache_info().misses == 1
+        assert resamplers[0]._kernel is resamplers[-1]._kernel
+        assert not resamplers[0]._kernel.phases.flags.writeable
+
+    def test_for_config(self) -> None:
+        resampler = Resampler.for_config(VoiceConfig(language="en"), 8000)
+        assert (resampler.src_rate, resampler.dst_rate) == (8000, 16000)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            Resampler(0, 16000)
+        with pytest.raises(ValueError):
+            Resampler(8000, 16000, taps=1)
+        with pytest.raises(ValueError):
+            Resampler(8000, 16000).process(np.zeros((2, 2)))
@@ -0,0 +1,120 @@
+"""Tests for trie-backed handler tables and router hot reload."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.core import VoiceRouter
+from aumai_voicefirst.models import Utterance
+from aumai_voicefirst.routing import HandlerTable
+
+
+class TestHandlerTable:
+    def test_longest_prefix_wins(self) -> None:
+        table = HandlerTable(
+            {"hi": "hindi", "hi-IN": "hindi.india", "zh": "chinese", "zh-Hant-TW": "tw"}
+        )
+        assert table.resolve("hi") == "hindi"
+        assert table.resolve("hi-IN") == "hindi.india"
+        assert table.resolve("hi-in-x-test") == "hindi.india"
+        assert table.resolve("hi-Deva-IN") == "hindi"
+        assert table.resolve("zh-Hant-TW") == "tw"
+        assert table.resolve("zh-Hant") == "chinese"
+        assert table.resolve("zh_hant_tw") == "tw"
+        assert table.resolve("fr") == "handler.default"
+
+    def test_script_routes(self) -> None:
+        table = HandlerTable(
+            {"pa": "indic", "zh-Hant": "traditional"},
+            scripts={"Arab": "arabic", "Hant": "cjk"},
+        )
+        assert table.resolve("pa-Arab") == "arabic"
+        assert table.resolve("en-Arab") == "arabic"
+        assert table.resolve("pa-Guru") == "indic"
+        assert table.resolve("zh-Hant-HK") == "traditional"
+
+    def test_custom_default(self) -> None:
+        assert HandlerTable({}, default="fallback").resolve("en") == "fallback"
+
+    def test_with_and_without_routes_copy(self) -> None:
+        table = HandlerTable({"hi": "hindi"})
+        extended = table.with_routes({"hi-IN": "india"})
+        assert table.resolve("hi-IN") == "hindi"
+        assert extended.resolve("hi-IN") == "india"
+        assert extended.without_routes(["HI-in"]).resolve("hi-IN") == "hindi"
+        with pytest.raises(KeyError):
+            table.without_routes(["fr"])
+
+    def test_invalid_patterns(self) -> None:
+        with pytest.raises(ValueError):
+            HandlerTable({"hi--IN": "x"})
+        with pytest.raises(ValueError):
+            HandlerTable(scripts={"Arabic": "x"})
+
+    def test_from_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "handlers.json"
+        path.write_text(json.dumps({"routes": {"hi-IN": "india"}, "default": "other"}))
+        table = HandlerTable.from_file(path)
+        assert table.resolve("hi-IN") == "india"
+        assert table.resolve("hi") == "other"
+        path.write_text("[]")
+        with pytest.raises(ValueError):
+            HandlerTable.from_file(path)
+
+
+class TestVoiceRouterHandlerTable:
+    def test_default_table_matches_families(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        router = VoiceRouter()
+        assert router.route(make_utterance(language="hi-IN")) == "handler.indic"
+        assert router.route(make_utterance(language="sd-Arab")) == "handler.arabic"
+        assert router.route(make_utterance(language="zh-Hant-TW")) == "handler.cjk"
+
+    def test_register_overrides_family(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        router = VoiceRouter()
+        router.route(make_utterance(language="hi-IN"))
+        router.register("hi-IN", "handler.hindi.india")
+        assert router.route(make_utterance(language="hi-IN")) == "handler.hindi.india"
+        assert router.route(make_utterance(language="hi")) == "handler.indic"
+        utterances = [make_utterance(language="hi-IN"), make_utterance(language="hi")]
+        assert router.route_many(utterances) == {
+            "handler.hindi.india": [0],
+            "handler.indic": [1],
+        }
+
+    def test_reload_replaces_table(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        router = VoiceRouter(HandlerTable({"en": "english"}))
+        assert router.route(make_utterance(language="en-US")) == "english"
+        router.reload(HandlerTable({"en-US": "us"}))
+        assert router.route(make_utterance(language="en-US")) == "us"
+        assert router.route(make_utterance(language="en")) == "handler.default"
+
+    def test_reload_while_routing(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        router = VoiceRouter(HandlerTable({"en": "old"}))
+        stop = threading.Event()
+        seen: set[str] = set()
+
+        def route() -> None:
+            while not stop.is_set():
+                seen.add(router.route(make_utterance(language="en")))
+
+        thread = threading.Thread(target=route)
+        thread.start()
+        for i in range(200):
+            router.reload(HandlerTable({"en": "new" if i % 2 else "old"}))
+        stop.set()
+        thread.join()
+        assert seen <= {"old", "new"}
+        assert router.route(make_utterance(language="en")) == "new"
@@ -0,0 +1,329 @@
+"""Tests for the resident session HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aumai_voicefirst.core import VoiceRouter
+from aumai_voicefirst.metrics import Metrics
+from aumai_voicefirst.models import Utterance
+from aumai_voicefirst.server import SessionServer
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    body: object = None,
+) -> tuple[int, Any]:
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    peer = writer.get_extra_info("peername")
+    host = f"127.0.0.1:{peer[1]}" if isinstance(peer, tuple) else "localhost"
+    return await _send(
+        reader,
+        writer,
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data,
+    )
+
+
+async def _send(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: bytes
+) -> tuple[int, Any]:
+    writer.write(request)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()).strip():
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    payload = await reader.readexactly(int(headers["content-length"]))
+    if headers["content-type"] == "application/json":
+        return status, json.loads(payload)
+    return status, payload.decode("utf-8")
+
+
+class TestHandle:
+    async def test_session_lifecycle(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        server = SessionServer()
+        response = await server.handle("POST", "/sessions", {"language": "hi"})
+        assert response.status == 201
+        session_id = response.payload["session_id"]  # type: ignore[index]
+        added = await server.handle(
+            "POST",
+            f"/sessions/{session_id}/utterances",
+            {
+                "utterances": [
+                    make_utterance("world", 20.0).model_dump(),
+                    make_utterance("hello", 0.0).model_dump(),
+                ]
+            },
+        )
+        assert added.payload == {"added": 2, "utterances": 2}
+        transcript = await server.handle("GET", f"/sessions/{session_id}/transcript")
+        assert transcript.payload == {"transcript": "hello\nworld"}
+        state = await server.handle(
+            "POST", f"/sessions/{session_id}/state", {"state": "completed"}
+        )
+        assert state.payload == {"state": "completed"}
+        described = await server.handle("GET", f"/sessions/{session_id}")
+        assert described.payload["state"] == "completed"  # type: ignore[index]
+        assert described.payload["config"]["language"] == "hi"  # type: ignore[index]
+
+    async def test_route(self, make_utterance: Callable[..., Utterance]) -> None:
+        server = SessionServer()
+        response = await server.handle(
+            "POST",
+            "/route",
+            {
+                "utterances": [
+                    make_utterance("a", 0, language="ja").model_dump(),
+                    make_utterance("b", 1, language="hi").model_dump(),
+                    make_utterance("c", 2).model_dump(),
+                ]
+            },
+        )
+        assert response.payload == {
+            "handlers": ["handler.cjk", "handler.indic", "handler.default"]
+        }
+
+    async def test_batch_runs_requests_in_order(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        server = SessionServer()
+        created = await server.handle("POST", "/sessions", {"language": "en"})
+        session_id = created.payload["session_id"]  # type: ignore[index]
+        response = await server.handle(
+            "POST",
+            "/batch",
+            {
+                "requests": [
+                    {
+                        "method": "POST",
+                        "path": f"/sessions/{session_id}/utterances",
+                        "body": {
+                            "utterances": [make_utterance("one", 0.0).model_dump()]
+                        },
+                    },
+                    {"method": "GET", "path": f"/sessions/{session_id}/transcript"},
+                    {"method": "GET", "path": "/sessions/missing/transcript"},
+                ]
+            },
+        )
+        assert response.payload == {
+            "responses": [
+                {"status": 200, "body": {"added": 1, "utterances": 1}},
+                {"status": 200, "body": {"transcript": "one"}},
+                {"status": 404, "body": {"error": "No session 'missing'."}},
+            ]
+        }
+
+    @pytest.mark.parametrize(
+        ("method", "path", "body", "status"),
+        [
+            ("GET", "/nowhere", None, 404),
+            ("GET", "/metrics", None, 404),
+            ("DELETE", "/sessions", None, 405),
+            ("POST", "/sessions", {"language": "en", "channels": 9}, 400),
+            ("POST", "/sessions", [1, 2], 400),
+            ("POST", "/route", {"utterances": [{"text": "x"}]}, 400),
+            ("POST", "/batch", {"requests": [{"method": "POST", "path": "/batch"}]}, 400),
+        ],
+    )
+    async def test_errors(
+        self, method: str, path: str, body: object, status: int
+    ) -> None:
+        response = await SessionServer().handle(method, path, body)
+        assert response.status == status
+        assert "error" in response.payload  # type: ignore[operator]
+
+    async def test_invalid_state_and_finished_session(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        server = SessionServer()
+        created = await server.handle("POST", "/sessions", {"language": "en"})
+        path = f"/sessions/{created.payload['session_id']}"  # type: ignore[index]
+        assert (await server.handle("POST", f"{path}/state", {"state": "x"})).status == 400
+        await server.handle("POST", f"{path}/state", {"state": "completed"})
+        added = await server.handle(
+            "POST",
+            f"{path}/utterances",
+            {"utterances": [make_utterance("late", 0.0).model_dump()]},
+        )
+        assert added.status == 400
+
+    async def test_metrics_endpoint(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        metrics = Metrics()
+        server = SessionServer(router=VoiceRouter(metrics=metrics), metrics=metrics)
+        utterance = make_utterance("a", 0, language="hi").model_dump()
+        await server.handle("POST", "/route", {"utterances": [utterance]})
+        response = await server.handle("GET", "/metrics")
+        assert response.status == 200
+        assert 'voicefirst_routes_total{handler="handler.indic"} 1' in str(
+            response.payload
+        )
+
+
+class TestTransport:
+    async def test_keep_alive_and_concurrent_clients(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        server = SessionServer()
+        listener = await server.start_tcp(0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def client(index: int) -> str:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                status, created = await _request(
+                    reader, writer, "POST", "/sessions", {"language": "en"}
+                )
+                assert status == 201
+                path = f"/sessions/{created['session_id']}"
+                for start in range(5):
+                    await _request(
+                        reader,
+                        writer,
+                        "POST",
+                        f"{path}/utterances",
+                        {
+                            "utterances": [
+                                make_utterance(
+                                    f"{index}-{start}", float(start)
+                                ).model_dump()
+                            ]
+                        },
+                    )
+                _, body = await _request(reader, writer, "GET", f"{path}/transcript")
+                return str(body["transcript"])
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+        async with listener:
+            transcripts = await asyncio.gather(*(client(i) for i in range(10)))
+        for index, text in enumerate(transcripts):
+            assert text.splitlines() == [f"{index}-{start}" for start in range(5)]
+
+    async def test_malformed_and_oversized_requests(self) -> None:
+        server = SessionServer(max_body=10)
+        listener = await server.start_tcp(0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, body = await _request(reader, writer, "POST", "/sessions", {"language": "en"})
+            assert status == 413
+            assert await reader.read() == b""
+            writer.close()
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, body = await _send(
+                reader,
+                writer,
+                f"POST /route HTTP/1.1\r\nHost: localhost:{port}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: 3\r\n\r\n{{x}}".encode("latin-1"),
+            )
+            assert status == 400
+            writer.close()
+
+    @pytest.mark.parametrize(
+        ("host", "status"),
+        [
+            ("localhost:{port}", 201),
+            ("[::1]:{port}", 201),
+            ("evil.example:{port}", 403),
+            ("localhost", 403),
+            ("127.0.0.1:1", 403),
+            (None, 403),
+        ],
+    )
+    async def test_host_must_name_this_server(
+        self, host: str | None, status: int
+    ) -> None:
+        server = SessionServer()
+        listener = await server.start_tcp(0)
+        port = listener.sockets[0].getsockname()[1]
+        header = "" if host is None else f"Host: {host.format(port=port)}\r\n"
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            answer, _ = await _send(
+                reader,
+                writer,
+                f"POST /sessions HTTP/1.1\r\n{header}"
+                "Content-Type: application/json\r\n"
+                'Content-Length: 18\r\n\r\n{"language": "en"}'.encode("latin-1"),
+            )
+            writer.close()
+        assert answer == status
+
+    @pytest.mark.parametrize(
+        "content_type", [None, "text/plain", "application/x-www-form-urlencoded"]
+    )
+    async def test_post_requires_json_content_type(
+        self, content_type: str | None
+    ) -> None:
+        server = SessionServer()
+        listener = await server.start_tcp(0)
+        port = listener.sockets[0].getsockname()[1]
+        header = "" if content_type is None else f"Content-Type: {content_type}\r\n"
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, _ = await _send(
+                reader,
+                writer,
+                f"POST /sessions HTTP/1.1\r\nHost: localhost:{port}\r\n{header}"
+                'Content-Length: 18\r\n\r\n{"language": "en"}'.encode("latin-1"),
+            )
+            assert status == 415
+            assert await reader.read() == b""
+            writer.close()
+        assert server.manager.manager.registry_stats().resident_sessions == 0
+
+    async def test_too_many_headers(self) -> None:
+        server = SessionServer()
+        listener = await server.start_tcp(0)
+        port = listener.sockets[0].getsockname()[1]
+        headers = "".join(f"X-Filler-{i}: {i}\r\n" for i in range(200))
+        request = f"GET /sessions/x HTTP/1.1\r\nHost: localhost:{port}\r\n{headers}"
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, _ = await _send(reader, writer, f"{request}\r\n".encode())
+            assert status == 431
+            writer.close()
+
+    async def test_unix_socket(self, tmp_path: Path) -> None:
+        socket_path = tmp_path / "voicefirst.sock"
+        server = SessionServer()
+        addresses: list[str] = []
+        serving = asyncio.create_task(
+            server.serve(socket_path=socket_path, ready=addresses.append)
+        )
+        while not addresses:
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        status, body = await _request(reader, writer, "POST", "/sessions", {"language": "en"})
+        writer.close()
+        assert status == 201 and "session_id" in body
+        assert addresses == [f"unix:{socket_path}"]
+        serving.cancel()
+        await serving
+        assert not socket_path.exists()
+
+    async def test_refuses_to_replace_regular_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "not-a-socket"
+        path.write_text("data", encoding="utf-8")
+        with pytest.raises(FileExistsError):
+            await SessionServer().start_unix(path)
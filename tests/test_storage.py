@@ -0,0 +1,214 @@
+"""Tests for durable session storage."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import (
+    Utterance,
+    UtteranceList,
+    VoiceConfig,
+    VoiceSession,
+)
+from aumai_voicefirst.storage import WriteAheadLogStorage
+from aumai_voicefirst.store import UtteranceStore
+
+
+def _reopen(directory: Path) -> VoiceSessionManager:
+    return VoiceSessionManager(storage=WriteAheadLogStorage(directory))
+
+
+class TestWriteAheadLogStorage:
+    def test_recovers_sessions_from_log(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance("two", 100.0))
+        manager.add_utterance(session, make_utterance("one", 0.0))
+        manager.add_utterances(session, [make_utterance("three", 200.0)])
+        manager.set_state(session, "paused")
+        manager.close()
+
+        recovered = _reopen(tmp_path).get_session(session.session_id)
+        assert recovered.state == "paused"
+        assert [u.text for u in recovered.utterances] == ["one", "two", "three"]
+
+    def test_appends_are_constant_size(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config)
+        log = tmp_path / "wal.log"
+        sizes = []
+        for i in range(20):
+            manager.add_utterance(session, make_utterance("same length", 5.0))
+            manager.storage.sync()  # type: ignore[union-attr]
+            sizes.append(log.stat().st_size)
+        deltas = {later - earlier for earlier, later in zip(sizes, sizes[1:])}
+        assert len(deltas) <= 2  # only the LSN digit count may change
+
+    def test_torn_tail_is_discarded(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance("kept", 0.0))
+        manager.close()
+        with open(tmp_path / "wal.log", "ab") as handle:
+            handle.write(b"\x40\x00\x00\x00garbage")
+
+        recovered = _reopen(tmp_path)
+        assert [u.text for u in recovered.get_session(session.session_id).utterances] == [
+            "kept"
+        ]
+        recovered.add_utterance(
+            recovered.get_session(session.session_id), make_utterance("new", 1)
+        )
+        recovered.close()
+        again = _reopen(tmp_path).get_session(session.session_id)
+        assert [u.text for u in again.utterances] == ["kept", "new"]
+
+    def test_checkpoint_then_tail(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance("before", 0.0))
+        manager.checkpoint()
+        assert (tmp_path / "wal.log").stat().st_size == 0
+        manager.add_utterance(session, make_utterance("after", 100.0))
+        manager.close()
+
+        recovered = _reopen(tmp_path).get_session(session.session_id)
+        assert [u.text for u in recovered.utterances] == ["before", "after"]
+
+    def test_crash_before_log_truncation_does_not_duplicate(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance("once", 0.0))
+        manager.storage.sync()  # type: ignore[union-attr]
+        stale_log = tmp_path / "stale.log"
+        shutil.copy(tmp_path / "wal.log", stale_log)
+        manager.checkpoint()
+        manager.close()
+        os.replace(stale_log, tmp_path / "wal.log")
+
+        recovered = _reopen(tmp_path).get_session(session.session_id)
+        assert [u.text for u in recovered.utterances] == ["once"]
+
+    def test_recovered_sessions_keep_caching(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config)
+        manager.add_utterances(
+            session, [make_utterance(str(i), i * 100.0) for i in range(10)]
+        )
+        manager.close()
+
+        reopened = _reopen(tmp_path)
+        recovered = reopened.get_session(session.session_id)
+        assert isinstance(recovered.utterances, UtteranceList)
+        transcript = reopened.get_transcript(recovered)
+        assert reopened.get_transcript(recovered) is transcript
+        reopened.utterances_in_range(recovered, 0.0, 250.0)
+        index = recovered._index
+        assert index is not None
+        assert len(list(reopened.utterances_in_range(recovered, 300.0, 550.0))) == 3
+        assert recovered._index is index
+
+    def test_compact_sessions_stay_compact(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = _reopen(tmp_path)
+        session = manager.create_session(english_config, compact=True)
+        manager.add_utterance(session, make_utterance("x", 0.0))
+        manager.close()
+        recovered = _reopen(tmp_path).get_session(session.session_id)
+        assert isinstance(recovered.utterances, UtteranceStore)
+
+    def test_group_commit_batches_fsyncs(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        storage = WriteAheadLogStorage(tmp_path, sync_every=10, sync_interval=3600)
+        manager = VoiceSessionManager(storage=storage)
+        session = manager.create_session(english_config)
+        calls: list[int] = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: calls.append(fd) or real_fsync(fd))
+        for i in range(29):
+            manager.add_utterance(session, make_utterance(str(i), float(i)))
+        assert len(calls) == 3
+
+    def test_reopen_without_close_keeps_every_record(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        storage = WriteAheadLogStorage(tmp_path, sync_every=1000, sync_interval=3600)
+        manager = VoiceSessionManager(storage=storage)
+        session = manager.create_session(english_config)
+        for i in range(10):
+            manager.add_utterance(session, make_utterance(str(i), float(i)))
+
+        recovered = _reopen(tmp_path).get_session(session.session_id)
+        assert [u.text for u in recovered.utterances] == [str(i) for i in range(10)]
+
+    def test_interval_syncs_idle_log(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        storage = WriteAheadLogStorage(tmp_path, sync_every=1000, sync_interval=0.01)
+        manager = VoiceSessionManager(storage=storage)
+        session = manager.create_session(english_config)
+        synced = threading.Event()
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.set() or real_fsync(fd))
+        manager.add_utterance(session, make_utterance("idle", 0.0))
+        assert synced.wait(timeout=5)
+        manager.close()
+
+    def test_set_state_rejects_unknown_state(
+        self, manager: VoiceSessionManager, active_session: VoiceSession
+    ) -> None:
+        with pytest.raises(ValueError):
+            manager.set_state(active_session, "closed")  # type: ignore[arg-type]
@@ -0,0 +1,209 @@
+"""Tests for the columnar utterance store."""
+
+from __future__ import annotations
+
+import json
+import random
+import tracemalloc
+from array import array
+from collections.abc import Callable
+
+import pytest
+
+from aumai_voicefirst import store as store_module
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig, VoiceSession
+from aumai_voicefirst.store import UtteranceStore
+
+
+class TestUtteranceStore:
+    def test_round_trips_fields(self, make_utterance: Callable[..., Utterance]) -> None:
+        original = make_utterance("नमस्ते दुनिया", 12.5, language="hi-IN")
+        store = UtteranceStore([original])
+        assert store[0] == original
+        assert store[-1].language == "hi-IN"
+
+    def test_languages_are_interned(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        store = UtteranceStore(
+            make_utterance(str(i), i, language="en" if i % 2 else "hi")
+            for i in range(10)
+        )
+        assert store._language_table == ["hi", "en"]
+
+    def test_iter_languages(self, make_utterance: Callable[..., Utterance]) -> None:
+        store = UtteranceStore(
+            [
+                make_utterance("a", 0, language="hi"),
+                make_utterance("b", 1),
+                make_utterance("c", 2, language="hi"),
+            ]
+        )
+        assert list(store.iter_languages()) == ["hi", "en", "hi"]
+        assert list(store.iter_languages(1)) == ["en", "hi"]
+
+    def test_insert_in_the_middle_shifts_texts(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        store = UtteranceStore([make_utterance("aa", 0), make_utterance("cccc", 200)])
+        store.insert(1, make_utterance("b", 100))
+        assert list(store.iter_texts()) == ["aa", "b", "cccc"]
+
+    def test_delete_and_setitem(self, make_utterance: Callable[..., Utterance]) -> None:
+        store = UtteranceStore(
+            [
+                make_utterance("one", 0),
+                make_utterance("two", 1),
+                make_utterance("three", 2),
+            ]
+        )
+        del store[1]
+        assert [u.text for u in store] == ["one", "three"]
+        store[0] = make_utterance("uno", 0)
+        assert [u.text for u in store] == ["uno", "three"]
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_random_edits_match_a_list(
+        self,
+        make_utterance: Callable[..., Utterance],
+        monkeypatch: pytest.MonkeyPatch,
+        numpy: bool,
+    ) -> None:
+        if not numpy:
+            monkeypatch.setattr(store_module, "_numpy", lambda: None)
+        rng = random.Random(3)  # noqa: S311 - deterministic test data
+        model = [make_utterance("x" * rng.randint(0, 5), i) for i in range(50)]
+        store = UtteranceStore(model)
+        for i in range(200):
+            position = rng.randrange(len(model) + 1)
+            if model and rng.random() < 0.5:
+                del model[position - 1]
+                del store[position - 1]
+            else:
+                utterance = make_utterance("é" * rng.randint(0, 4) + str(i), i)
+                model.insert(position, utterance)
+                store.insert(position, utterance)
+        assert list(store.iter_texts()) == [u.text for u in model]
+
+    def test_slice_access(self, make_utterance: Callable[..., Utterance]) -> None:
+        store = UtteranceStore(make_utterance(str(i), i) for i in range(5))
+        assert [u.text for u in store[1:3]] == ["1", "2"]
+        store[1:3] = [make_utterance("x", 1)]
+        assert [u.text for u in store] == ["0", "x", "3", "4"]
+
+    def test_index_out_of_range(self) -> None:
+        with pytest.raises(IndexError):
+            UtteranceStore()[0]
+
+    def test_insort_keeps_arrival_order_for_equal_starts(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        store = UtteranceStore([make_utterance("a", 0), make_utterance("c", 200)])
+        assert store.insort(make_utterance("b1", 100)) == 1
+        assert store.insort(make_utterance("b2", 100)) == 2
+        assert list(store.iter_texts()) == ["a", "b1", "b2", "c"]
+
+    def test_ordered_copy_sorts_unordered_store(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        store = UtteranceStore(
+            [make_utterance("late", 500), make_utterance("early", 0)]
+        )
+        assert list(store.ordered_copy().iter_texts()) == ["early", "late"]
+
+    def test_columns_round_trip(self, make_utterance: Callable[..., Utterance]) -> None:
+        utterances = [
+            make_utterance("नमस्ते", 0, language="hi"),
+            make_utterance("hello", 5),
+        ]
+        columns = UtteranceStore(utterances).columns()
+        assert columns.languages == ["hi", "en"]
+        assert list(UtteranceStore.from_columns(columns)) == utterances
+
+    def test_from_columns_rejects_inconsistent_columns(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        columns = UtteranceStore([make_utterance("a", 0)]).columns()
+        columns.ends = array("d")
+        with pytest.raises(ValueError):
+            UtteranceStore.from_columns(columns)
+        columns = UtteranceStore([make_utterance("a", 0)]).columns()
+        columns.text = b"ab"
+        with pytest.raises(ValueError):
+            UtteranceStore.from_columns(columns)
+        columns = UtteranceStore([make_utterance("a", 0)]).columns()
+        columns.languages = []
+        with pytest.raises(ValueError):
+            UtteranceStore.from_columns(columns)
+
+    def test_uses_far_less_memory_than_models(
+        self, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        rows = [(f"utterance number {i}", float(i * 10)) for i in range(2_000)]
+        models = [make_utterance(text, start) for text, start in rows]
+
+        tracemalloc.start()
+        as_list = [m.model_copy() for m in models]
+        list_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        store = UtteranceStore(models)
+        store_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert len(as_list) == len(store)
+        assert store_bytes * 4 < list_bytes
+
+
+class TestCompactSessions:
+    def test_create_compact_session(
+        self, manager: VoiceSessionManager, english_config: VoiceConfig
+    ) -> None:
+        session = manager.create_session(english_config, compact=True)
+        assert isinstance(session.utterances, UtteranceStore)
+
+    def test_transcript_and_ordering(
+        self,
+        manager: VoiceSessionManager,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        session = manager.create_session(english_config, compact=True)
+        for text, start in (("two", 100.0), ("three", 200.0), ("one", 0.0)):
+            manager.add_utterance(session, make_utterance(text, start))
+        assert manager.get_transcript(session) == "one\ntwo\nthree"
+        manager.add_utterance(session, make_utterance("four", 300.0))
+        assert manager.get_transcript(session) == "one\ntwo\nthree\nfour"
+
+    def test_range_queries(
+        self,
+        manager: VoiceSessionManager,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        session = manager.create_session(english_config, compact=True)
+        for i in range(10):
+            start = i * 1_000.0
+            manager.add_utterance(session, make_utterance(str(i), start, start + 100))
+        assert list(manager.transcript_slice(session, 2_050, 4_000)) == ["2", "3", "4"]
+        manager.add_utterance(session, make_utterance("late", 2_500.0, 2_600.0))
+        assert list(manager.transcript_slice(session, 2_550, 2_560)) == ["late"]
+
+    def test_json_round_trip_matches_list_session(
+        self,
+        manager: VoiceSessionManager,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        compact = manager.create_session(english_config, compact=True)
+        plain = VoiceSession(session_id=compact.session_id, config=english_config)
+        for text, start in (("hello", 0.0), ("world", 100.0)):
+            manager.add_utterance(compact, make_utterance(text, start))
+            manager.add_utterance(plain, make_utterance(text, start))
+
+        dumped = compact.model_dump_json()
+        assert json.loads(dumped) == json.loads(plain.model_dump_json())
+        restored = VoiceSession.model_validate_json(dumped)
+        assert manager.get_transcript(restored) == "hello\nworld"
@@ -0,0 +1,89 @@
+"""Tests for streaming transcript extraction."""
+
+from __future__ import annotations
+
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import Utterance, VoiceConfig, VoiceSession
+from aumai_voicefirst.streaming import iter_transcript, iter_utterance_records
+
+
+def _session(starts: list[float]) -> VoiceSession:
+    session = VoiceSession(session_id="s", config=VoiceConfig(language="en"))
+    session.utterances.extend(
+        Utterance(
+            text=f"line {i} ✓",
+            language="en",
+            start_ms=start,
+            end_ms=start + 1.0,
+            confidence=0.5,
+        )
+        for i, start in enumerate(starts)
+    )
+    return session
+
+
+def _write(tmp_path: Path, session: VoiceSession) -> Path:
+    path = tmp_path / "session.json"
+    path.write_text(session.model_dump_json(indent=2), encoding="utf-8")
+    return path
+
+
+class TestIterUtteranceRecords:
+    def test_small_chunks(self) -> None:
+        session = _session([0.0, 12.5, 1000.0])
+        text = session.model_dump_json(indent=2)
+        records = list(iter_utterance_records(io.StringIO(text), chunk_size=3))
+        assert [r["start_ms"] for r in records] == [0.0, 12.5, 1000.0]
+        assert records[1]["text"] == "line 1 ✓"
+
+    def test_utterances_before_other_fields_and_empty(self) -> None:
+        document = '{"utterances": [{"text": "a", "start_ms": 10}], "state": "active"}'
+        records = list(iter_utterance_records(io.StringIO(document), chunk_size=4))
+        assert records == [{"text": "a", "start_ms": 10}]
+        assert list(iter_utterance_records(io.StringIO('{"utterances": []}'))) == []
+        assert list(iter_utterance_records(io.StringIO("{}"))) == []
+
+    def test_malformed(self) -> None:
+        for document in ("[]", '{"utterances": [1]}', '{"utterances": [{"a": 1}', "{"):
+            with pytest.raises(ValueError):
+                list(iter_utterance_records(io.StringIO(document)))
+
+
+class TestIterTranscript:
+    def test_ordered_file(self, tmp_path: Path) -> None:
+        session = _session([0.0, 5.0, 5.0, 9.0])
+        path = _write(tmp_path, session)
+        expected = VoiceSessionManager().get_transcript(session).split("\n")
+        assert list(iter_transcript(path)) == expected
+        assert list(iter_transcript(path, presorted=True)) == expected
+
+    @pytest.mark.parametrize("memory_limit", [1, 2_000, 1 << 20])
+    def test_unordered_file_matches_manager(
+        self, tmp_path: Path, memory_limit: int
+    ) -> None:
+        rng = random.Random(7)
+        session = _session([float(rng.randrange(50)) for _ in range(300)])
+        path = _write(tmp_path, session)
+        expected = VoiceSessionManager().get_transcript(session).split("\n")
+        spill = tmp_path / "spill"
+        spill.mkdir()
+        lines = list(iter_transcript(path, memory_limit=memory_limit, temp_dir=spill))
+        assert lines == expected
+        assert list(spill.iterdir()) == []
+
+    def test_presorted_rejects_unordered_file(self, tmp_path: Path) -> None:
+        path = _write(tmp_path, _session([5.0, 1.0]))
+        with pytest.raises(ValueError, match="not ordered"):
+            list(iter_transcript(path, presorted=True))
+
+    def test_missing_fields(self, tmp_path: Path) -> None:
+        path = tmp_path / "session.json"
+        path.write_text('{"utterances": [{"text": "a"}]}', encoding="utf-8")
+        with pytest.raises(ValueError, match="start_ms"):
+            list(iter_transcript(path))
@@ -0,0 +1,140 @@
+"""Tests for the thread-safe session manager."""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.models import Utterance, VoiceConfig
+from aumai_voicefirst.registry import SessionRegistry
+from aumai_voicefirst.storage import WriteAheadLogStorage
+from aumai_voicefirst.threadsafe import ThreadSafeVoiceSessionManager
+
+
+class TestThreadSafeVoiceSessionManager:
+    def test_concurrent_appends_to_one_session(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = ThreadSafeVoiceSessionManager(stripes=4)
+        session = manager.create_session(english_config)
+        starts = list(range(2_000))
+        random.Random(3).shuffle(starts)
+        chunks = [starts[i::8] for i in range(8)]
+
+        def worker(chunk: list[int]) -> None:
+            for start in chunk:
+                manager.add_utterance(session, make_utterance(str(start), float(start)))
+                if start % 50 == 0:
+                    manager.get_transcript(session)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, chunks))
+
+        assert [u.start_ms for u in session.utterances] == [float(s) for s in range(2_000)]
+        expected = "\n".join(str(s) for s in range(2_000))
+        assert manager.get_transcript(session) == expected
+
+    def test_concurrent_sessions(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = ThreadSafeVoiceSessionManager()
+
+        def worker(_: int) -> str:
+            session = manager.create_session(english_config)
+            manager.add_utterances(
+                session, [make_utterance(str(i), float(i)) for i in range(100)]
+            )
+            return session.session_id
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(worker, range(64)))
+
+        assert len(set(ids)) == 64
+        for session_id in ids:
+            assert len(manager.get_session(session_id).utterances) == 100
+        assert manager.registry_stats().resident_sessions == 64
+
+    def test_readers_never_see_torn_transcripts(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = ThreadSafeVoiceSessionManager()
+        session = manager.create_session(english_config)
+        done = threading.Event()
+        seen: list[str] = []
+
+        def reader() -> None:
+            while not done.is_set():
+                seen.append(manager.get_transcript(session))
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for i in range(500):
+            manager.add_utterance(session, make_utterance(str(i), float(i)))
+        done.set()
+        thread.join()
+
+        for transcript in seen:
+            lines = transcript.split("\n") if transcript else []
+            assert lines == [str(i) for i in range(len(lines))]
+
+    def test_checkpoint_during_writes_loses_nothing(
+        self,
+        tmp_path: Path,
+        english_config: VoiceConfig,
+        make_utterance: Callable[..., Utterance],
+    ) -> None:
+        manager = ThreadSafeVoiceSessionManager(WriteAheadLogStorage(tmp_path))
+        session = manager.create_session(english_config)
+        stop = threading.Event()
+
+        def checkpointer() -> None:
+            while not stop.is_set():
+                manager.checkpoint()
+
+        thread = threading.Thread(target=checkpointer)
+        thread.start()
+        for i in range(300):
+            manager.add_utterance(session, make_utterance(str(i), float(i)))
+        stop.set()
+        thread.join()
+        manager.close()
+
+        recovered = ThreadSafeVoiceSessionManager(WriteAheadLogStorage(tmp_path))
+        assert len(recovered.get_session(session.session_id).utterances) == 300
+
+    def test_registry_bounds_apply_per_shard(
+        self, tmp_path: Path, english_config: VoiceConfig
+    ) -> None:
+        manager = ThreadSafeVoiceSessionManager(
+            stripes=2,
+            registry_factory=lambda: SessionRegistry(
+                max_sessions=1, spill_directory=tmp_path
+            ),
+        )
+        sessions = [manager.create_session(english_config) for _ in range(10)]
+        stats = manager.registry_stats()
+        assert stats.resident_sessions <= 2
+        assert stats.resident_sessions + stats.spilled_sessions == 10
+        assert manager.get_session(sessions[0].session_id).session_id == (
+            sessions[0].session_id
+        )
+
+    def test_range_queries_return_snapshots(
+        self, english_config: VoiceConfig, make_utterance: Callable[..., Utterance]
+    ) -> None:
+        manager = ThreadSafeVoiceSessionManager()
+        session = manager.create_session(english_config)
+        manager.add_utterance(session, make_utterance("a", 0.0))
+        found = manager.utterances_in_range(session, 0.0, 100.0)
+        manager.add_utterance(session, make_utterance("b", 5.0))
+        assert [u.text for u in found] == ["a"]
+        assert list(manager.transcript_slice(session, 0.0, 100.0)) == ["a", "b"]
+
+    def test_invalid_stripes(self) -> None:
+        with pytest.raises(ValueError):
+            ThreadSafeVoiceSessionManager(stripes=0)
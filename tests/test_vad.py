@@ -0,0 +1,96 @@
+"""Tests for the voice activity detector."""
+
+from __future__ import annotations
+
+import pytest
+
+from aumai_voicefirst.core import VoiceSessionManager
+from aumai_voicefirst.models import VoiceConfig, VoiceSession
+
+np = pytest.importorskip("numpy")
+
+from aumai_voicefirst.vad import VoiceActivityDetector  # noqa: E402
+
+_RATE = 16000
+
+
+def _session(channels: int = 1) -> VoiceSession:
+    config = VoiceConfig(language="hi", sample_rate=_RATE, channels=channels)
+    return VoiceSessionManager().create_session(config)
+
+
+def _signal(*parts: tuple[str, float]) -> object:
+    """Concatenate ('tone'|'noise'|'silence', seconds) parts at 16 kHz."""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for kind, seconds in parts:
+        n = int(seconds * _RATE)
+        if kind == "tone":
+            t = np.arange(n) / _RATE
+            chunks.append(0.3 * np.sin(2 * np.pi * 220 * t))
+        elif kind == "hiss":
+            chunks.append(0.01 * rng.standard_normal(n))
+        else:
+            chunks.append(0.0005 * rng.standard_normal(n))
+    return np.concatenate(chunks).astype(np.float32)
+
+
+class TestVoiceActivityDetector:
+    def test_detects_speech_regions(self) -> None:
+        samples = _signal(("silence", 0.5), ("tone", 1.0), ("silence", 1.0), ("tone", 0.5))
+        segments = VoiceActivityDetector(_session()).detect(samples)
+        assert [(s.start_ms, s.end_ms) for s in segments] == [
+            (500.0, 1500.0),
+            (2500.0, 3000.0),
+        ]
+        assert all(s.text == "" and s.language == "hi" for s in segments)
+        assert all(s.confidence == 1.0 for s in segments)
+
+    def test_short_gaps_are_bridged_and_blips_dropped(self) -> None:
+        samples = _signal(
+            ("tone", 0.4), ("silence", 0.1), ("tone", 0.4), ("silence", 1.0),
+            ("tone", 0.04), ("silence", 1.0),
+        )
+        segments = VoiceActivityDetector(_session()).detect(samples)
+        assert len(segments) == 1
+        assert (segments[0].start_ms, segments[0].end_ms) == (0.0, 900.0)
+        assert segments[0].confidence == pytest.approx(800 / 900)
+
+    def test_weak_high_zcr_frames_count_as_speech(self) -> None:
+        detector = VoiceActivityDetector(_session())
+        mask = detector.classify(_signal(("hiss", 0.2), ("silence", 0.2)))
+        assert mask[:10].all()
+        assert not mask[10:].any()
+
+    def test_streaming_matches_batch(self) -> None:
+        samples = _signal(
+            ("silence", 0.3), ("tone", 0.7), ("silence", 0.6), ("tone", 0.3),
+            ("silence", 0.5),
+        )
+        batch = VoiceActivityDetector(_session()).detect(samples)
+        detector = VoiceActivityDetector(_session())
+        streamed = []
+        for offset in range(0, len(samples), 357):
+            streamed += detector.feed(samples[offset : offset + 357])
+        streamed += detector.flush()
+        assert streamed == batch
+
+    def test_lookahead_is_bounded(self) -> None:
+        detector = VoiceActivityDetector(_session(), min_silence_ms=200.0)
+        assert detector.feed(_signal(("tone", 0.5))) == []
+        assert detector.feed(_signal(("silence", 0.18))) == []
+        emitted = detector.feed(_signal(("silence", 0.02)))
+        assert [(s.start_ms, s.end_ms) for s in emitted] == [(0.0, 500.0)]
+
+    def test_integer_and_stereo_input(self) -> None:
+        mono = _signal(("silence", 0.5), ("tone", 0.5), ("silence", 0.5))
+        pcm = (mono * 32767).astype(np.int16)
+        stereo = np.repeat(pcm, 2)
+        segments = VoiceActivityDetector(_session(channels=2), start_ms=1000.0).detect(
+            stereo
+        )
+        assert [(s.start_ms, s.end_ms) for s in segments] == [(1500.0, 2000.0)]
+
+    def test_invalid_durations(self) -> None:
+        with pytest.raises(ValueError):
+            VoiceActivityDetector(_session(), frame_ms=0)
@@ -0,0 +1,98 @@
+"""Tests for the streaming WAV reader."""
+
+from __future__ import annotations
+
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+from aumai_voicefirst.models import AudioFormat, VoiceConfig
+from aumai_voicefirst.wav import WavReader
+
+
+def _write_wav(
+    path: Path, samples: list[int], *, rate: int = 16000, channels: int = 1
+) -> Path:
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(channels)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return path
+
+
+class TestWavReader:
+    def test_header_properties(self, tmp_path: Path) -> None:
+        path = _write_wav(tmp_path / "a.wav", [0] * 3200, rate=8000, channels=2)
+        with WavReader(path) as reader:
+            assert reader.sample_rate == 8000
+            assert reader.channels == 2
+            assert reader.sample_width == 2
+            assert not reader.is_float
+            assert reader.num_samples == 1600
+            assert reader.duration_ms == 200.0
+
+    def test_frames_cover_the_data_exactly(self, tmp_path: Path) -> None:
+        samples = list(range(1000))
+        path = _write_wav(tmp_path / "a.wav", samples)
+        with WavReader(path, frame_ms=10.0) as reader:
+            frames = list(reader.frames())
+            assert reader.frame_bytes == 320
+            assert [len(f) for f in frames] == [320] * 6 + [80]
+            assert all(f.readonly for f in frames)
+            joined = b"".join(bytes(f) for f in frames)
+            del frames
+        assert list(struct.unpack("<1000h", joined)) == samples
+
+    def test_frames_from_offset(self, tmp_path: Path) -> None:
+        path = _write_wav(tmp_path / "a.wav", list(range(1600)))
+        with WavReader(path, frame_ms=50.0) as reader:
+            first = next(reader.frames(start_ms=25.0))
+            assert struct.unpack_from("<h", first)[0] == 400
+            assert list(reader.frames(start_ms=1_000.0)) == []
+            del first
+
+    def test_validates_against_config(self, tmp_path: Path) -> None:
+        path = _write_wav(tmp_path / "a.wav", [0] * 10, rate=8000)
+        WavReader(path, VoiceConfig(language="en", sample_rate=8000)).close()
+        with pytest.raises(ValueError, match="Hz"):
+            WavReader(path, VoiceConfig(language="en", sample_rate=16000))
+        with pytest.raises(ValueError, match="channel"):
+            WavReader(path, VoiceConfig(language="en", sample_rate=8000, channels=2))
+        with pytest.raises(ValueError, match="mp3"):
+            WavReader(
+                path,
+                VoiceConfig(language="en", sample_rate=8000, format=AudioFormat.mp3),
+            )
+
+    def test_rejects_non_wav(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"ID3" + b"\0" * 64)
+        with pytest.raises(ValueError):
+            WavReader(path)
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            WavReader(path)
+
+    def test_skips_unknown_chunks(self, tmp_path: Path) -> None:
+        fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+        data = struct.pack("<3h", 1, 2, 3)
+        body = (
+            b"WAVE"
+            + b"LIST" + struct.pack("<I", 3) + b"abc\0"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"data" + struct.pack("<I", len(data)) + data
+        )
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+        with WavReader(path) as reader:
+            assert [bytes(f) for f in reader.frames()] == [data]
+
+    def test_close_with_outstanding_frames(self, tmp_path: Path) -> None:
+        path = _write_wav(tmp_path / "a.wav", [7] * 320)
+        reader = WavReader(path)
+        frame = next(reader.frames())
+        reader.close()
+        assert struct.unpack_from("<h", frame)[0] == 7